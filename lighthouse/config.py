@@ -2,12 +2,18 @@
 Configuration loading and validation for Lighthouse.
 """
 
+import json
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import BaseModel, Field, ValidationError
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 
 class PushoverConfig(BaseModel):
     """Pushover API configuration."""
@@ -65,10 +71,13 @@ class Config(BaseModel):
 
 def load_config(config_path: str | Path) -> Config:
     """
-    Load and validate configuration from YAML file.
+    Load and validate configuration from a YAML or JSON file.
+
+    Files with a .json suffix are parsed with the json module; anything else
+    is parsed as YAML.
 
     Args:
-        config_path: Path to the YAML configuration file
+        config_path: Path to the configuration file
 
     Returns:
         Validated Config object
@@ -77,6 +86,7 @@ def load_config(config_path: str | Path) -> Config:
         FileNotFoundError: If config file doesn't exist
         ValueError: If config is invalid
         yaml.YAMLError: If YAML parsing fails
+        json.JSONDecodeError: If JSON parsing fails
     """
     path = Path(config_path)
 
@@ -84,7 +94,11 @@ def load_config(config_path: str | Path) -> Config:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     with path.open('r', encoding='utf-8') as f:
-        raw_config: dict[str, Any] = yaml.safe_load(f)
+        raw_config: dict[str, Any]
+        if path.suffix.lower() == ".json":
+            raw_config = json.load(f)
+        else:
+            raw_config = yaml.load(f, Loader=SafeLoader)  # libyaml when available
 
     try:
         return Config.model_validate(raw_config)
@@ -2,13 +2,13 @@
 Watcher coordinator that wires together observers, triggers, and evaluators.
 """
 
-import json
+from collections import deque
 from collections.abc import Callable
-from datetime import datetime
 from pathlib import Path
 
 from lighthouse.config import WatcherConfig
 from lighthouse.core import AlertDecision, Evaluator, ObservationResult, Observer, Trigger
+from lighthouse.history import MAX_HISTORY, HistoryStore
 from lighthouse.logging_config import get_logger
 from lighthouse.plugins import create_evaluator, create_observer, create_trigger
 
@@ -48,29 +48,19 @@ class WatcherCoordinator:
         self.evaluator = evaluator
         self.state_dir = Path(state_dir)
         self.priority = priority
-        self.history: list[ObservationResult] = []
+        # Bounded to what is persisted, so long-running watchers don't grow without limit
+        self.history: deque[ObservationResult] = deque(maxlen=MAX_HISTORY)
+        self._history_store = HistoryStore(self.state_dir / f"{name}.history.json")
         self._load_history()
 
     def _load_history(self) -> None:
         """Load observation history from disk."""
-        history_file = self.state_dir / f"{self.name}.history.json"
-        if not history_file.exists():
+        if not self._history_store.exists():
             logger.debug("No history file found for watcher '%s'", self.name)
             return
 
         try:
-            with open(history_file, encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Reconstruct ObservationResult objects from JSON
-            self.history = [
-                ObservationResult(
-                    value=item['value'],
-                    timestamp=datetime.fromisoformat(item['timestamp']),
-                    metadata=item['metadata']
-                )
-                for item in data
-            ]
+            self.history.extend(self._history_store.load())
             logger.debug(
                 "Loaded %s observation(s) from history for watcher '%s'",
                 len(self.history),
@@ -78,31 +68,12 @@ class WatcherCoordinator:
             )
         except Exception:
             logger.warning("Failed to load history for watcher '%s'", self.name, exc_info=True)
-            self.history = []
+            self.history.clear()
 
     def _save_history(self) -> None:
         """Save observation history to disk."""
-        # Create state directory if it doesn't exist
-        self.state_dir.mkdir(parents=True, exist_ok=True)
-
-        history_file = self.state_dir / f"{self.name}.history.json"
-
-        # Keep only last 100 observations to prevent unbounded growth
-        recent_history = self.history[-100:]
-
-        # Serialize to JSON
-        data = [
-            {
-                'value': item.value,
-                'timestamp': item.timestamp.isoformat(),
-                'metadata': item.metadata
-            }
-            for item in recent_history
-        ]
-
         try:
-            with open(history_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            self._history_store.save(self.history)
         except Exception:
             logger.warning("Failed to save history for watcher '%s'", self.name, exc_info=True)
 
@@ -9,13 +9,13 @@ This module defines the plugin architecture with four main categories:
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ObservationResult:
     """Result from an observer."""
     value: Any  # The observed value (could be bool, int, str, dict, etc.)
@@ -23,7 +23,7 @@ class ObservationResult:
     metadata: dict[str, Any]  # Additional context about the observation
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertDecision:
     """Decision from an evaluator about whether to alert."""
     should_alert: bool
@@ -108,7 +108,7 @@ class Evaluator(ABC):
     def evaluate(
         self,
         current: ObservationResult,
-        history: list[ObservationResult]
+        history: Sequence[ObservationResult]
     ) -> AlertDecision:
         """
         Evaluate whether to alert based on current and historical observations.
@@ -122,6 +122,32 @@ class Evaluator(ABC):
         """
         raise NotImplementedError
 
+    def evaluate_batch(
+        self,
+        observations: list[ObservationResult],
+        history: Sequence[ObservationResult]
+    ) -> tuple[list[bool], list[AlertDecision]]:
+        """
+        Evaluate a chunk of observations in order.
+
+        Each observation is evaluated against the given history followed by
+        the observations before it in the chunk, exactly as if evaluate() had
+        been called once per observation.
+
+        Args:
+            observations: Observations to evaluate, oldest first
+            history: Observations preceding the chunk (may be empty)
+
+        Returns:
+            Tuple of (should_alert mask, decisions), aligned with observations
+        """
+        window = list(history)
+        decisions = []
+        for observation in observations:
+            decisions.append(self.evaluate(observation, window))
+            window.append(observation)
+        return [d.should_alert for d in decisions], decisions
+
 
 class Notifier(ABC):
     """
@@ -152,3 +178,23 @@ class Notifier(ABC):
             True if notification was sent successfully, False otherwise
         """
         raise NotImplementedError
+
+    def notify_batch(self, alerts: list[tuple[AlertDecision, str]]) -> bool:
+        """
+        Send notifications for several alerts at once.
+
+        The default sends each alert with notify(); notifiers whose destination
+        accepts several alerts per request override this.
+
+        Args:
+            alerts: (alert, watcher_name) pairs, oldest first
+
+        Returns:
+            True if every notification was sent successfully
+        """
+        results = [self.notify(alert, watcher_name) for alert, watcher_name in alerts]
+        return all(results)
+
+    def close(self) -> None:
+        """Flush pending notifications and release resources (default: nothing to do)."""
+        return
@@ -6,12 +6,13 @@ import argparse
 import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from lighthouse.config import load_config
+from lighthouse.config import Config, load_config
 from lighthouse.coordinator import WatcherCoordinator, create_watcher_coordinator
-from lighthouse.core import AlertDecision
+from lighthouse.core import AlertDecision, Notifier
 from lighthouse.logging_config import get_logger, setup_logging
 from lighthouse.plugins import create_notifier
 from lighthouse.state import StateManager
@@ -22,14 +23,20 @@ logger = get_logger(__name__)
 class LighthouseDaemon:
     """Main daemon class that coordinates watchers and notifications."""
 
-    def __init__(self, config_path: str) -> None:
+    def __init__(self, config_path: str | None = None, *, config: Config | None = None) -> None:
         """
         Initialize the daemon.
 
         Args:
             config_path: Path to configuration file
+            config: Already-validated configuration (takes precedence over config_path)
         """
-        self.config = load_config(config_path)
+        if config is None:
+            if config_path is None:
+                raise ValueError("Either config_path or config must be given")
+            config = load_config(config_path)
+
+        self.config = config
         self.state_dir = Path(self.config.state_dir)
 
         # Initialize state manager for rate limiting
@@ -42,10 +49,36 @@ class LighthouseDaemon:
             for n in self.config.notifiers
         ]
 
-        # Watcher coordinators
-        self.coordinators: list[WatcherCoordinator] = []
+        # Threads for sending to several notifiers at once, created on first alert
+        self._notify_pool: ThreadPoolExecutor | None = None
+
+        # Watcher coordinators, created on first access
+        self._coordinators: list[WatcherCoordinator] | None = None
         self.running = False
 
+    @property
+    def coordinators(self) -> list[WatcherCoordinator]:
+        """Watcher coordinators, set up from configuration on first access."""
+        if self._coordinators is None:
+            self._coordinators = self._setup_watchers()
+        return self._coordinators
+
+    @classmethod
+    def from_config(cls, config: Config, state_dir: Path | None = None) -> "LighthouseDaemon":
+        """
+        Create a daemon from an in-memory configuration, skipping YAML parsing.
+
+        Args:
+            config: Validated configuration
+            state_dir: Optional override for config.state_dir
+
+        Returns:
+            Configured daemon instance
+        """
+        if state_dir is not None:
+            config = config.model_copy(update={"state_dir": str(state_dir)})
+        return cls(config=config)
+
     def _handle_alert(
         self,
         watcher_name: str,
@@ -73,49 +106,67 @@ class LighthouseDaemon:
             logger.info("Alert rate limited for watcher '%s'", watcher_name)
             return
 
-        # Send to all notifiers
-        for notifier in self.notifiers:
-            try:
-                success = notifier.notify(decision, watcher_name)
-                # Notifiers already log their own success/failure
-                if not success:
-                    logger.warning(
-                        "Notifier %s returned False for watcher '%s'",
-                        notifier.__class__.__name__,
-                        watcher_name
-                    )
-            except Exception:
-                logger.error(
-                    "Error sending notification via %s for watcher '%s'",
-                    notifier.__class__.__name__,
-                    watcher_name,
-                    exc_info=True
+        # Send to all notifiers; with more than one, fan out so a slow
+        # receiver doesn't hold up the rest
+        if len(self.notifiers) > 1:
+            if self._notify_pool is None:
+                self._notify_pool = ThreadPoolExecutor(
+                    max_workers=len(self.notifiers), thread_name_prefix="lighthouse-notify"
                 )
+            futures = [
+                self._notify_pool.submit(self._notify, notifier, decision, watcher_name)
+                for notifier in self.notifiers
+            ]
+            for future in futures:
+                future.result()
+        else:
+            for notifier in self.notifiers:
+                self._notify(notifier, decision, watcher_name)
 
         # Record alert in state
         self.state.record_alert(watcher_name, decision.message[:100])
 
-    def setup_watchers(self) -> None:
+    @staticmethod
+    def _notify(notifier: Notifier, decision: AlertDecision, watcher_name: str) -> None:
+        """Send one alert through one notifier, logging rather than raising on failure."""
+        try:
+            success = notifier.notify(decision, watcher_name)
+            # Notifiers already log their own success/failure
+            if not success:
+                logger.warning(
+                    "Notifier %s returned False for watcher '%s'",
+                    notifier.__class__.__name__,
+                    watcher_name
+                )
+        except Exception:
+            logger.error(
+                "Error sending notification via %s for watcher '%s'",
+                notifier.__class__.__name__,
+                watcher_name,
+                exc_info=True
+            )
+
+    def _setup_watchers(self) -> list[WatcherCoordinator]:
         """Set up all watcher coordinators from configuration."""
         # Ensure state directory exists
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
-        for watcher_config in self.config.watchers:
-            coordinator = create_watcher_coordinator(
+        coordinators = [
+            create_watcher_coordinator(
                 watcher_config=watcher_config,
                 state_dir=str(self.state_dir),
                 on_alert=self._handle_alert,
             )
-            self.coordinators.append(coordinator)
+            for watcher_config in self.config.watchers
+        ]
 
-        logger.info("Configured %s watcher(s)", len(self.coordinators))
+        logger.info("Configured %s watcher(s)", len(coordinators))
+        return coordinators
 
     def start(self) -> None:
         """Start the daemon."""
         logger.info("Starting Lighthouse daemon")
 
-        self.setup_watchers()
-
         # Start all coordinators
         for coordinator in self.coordinators:
             coordinator.start()
@@ -137,11 +188,27 @@ class LighthouseDaemon:
         logger.info("Stopping Lighthouse daemon")
         self.running = False
 
-        # Stop all coordinators
-        for coordinator in self.coordinators:
+        # Stop all coordinators that were started
+        for coordinator in self._coordinators or []:
             coordinator.stop()
             logger.info("Stopped watcher '%s'", coordinator.name)
 
+        # Flush anything notifiers are still holding
+        for notifier in self.notifiers:
+            try:
+                notifier.close()
+            except Exception:
+                logger.exception(
+                    "Error closing notifier %s", notifier.__class__.__name__
+                )
+
+        if self._notify_pool is not None:
+            self._notify_pool.shutdown(wait=True)
+            self._notify_pool = None
+
+        # Fold the alert log into a snapshot so the next start loads quickly
+        self.state.close()
+
         logger.info("Lighthouse daemon stopped")
 
 
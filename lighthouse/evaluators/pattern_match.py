@@ -2,6 +2,9 @@
 PatternMatch evaluator for Lighthouse.
 """
 
+from collections.abc import Sequence
+from typing import Any
+
 from lighthouse.core import AlertDecision, Evaluator, ObservationResult
 from lighthouse.registry import register_evaluator
 
@@ -18,13 +21,17 @@ class PatternMatchEvaluator(Evaluator):
         severity: Alert severity level (default: "medium")
     """
 
+    def __init__(self, config: dict[str, Any]) -> None:
+        super().__init__(config)
+        self.severity = config.get("severity", "medium")
+
     def evaluate(
         self,
         current: ObservationResult,
-        _history: list[ObservationResult]
+        _history: Sequence[ObservationResult]
     ) -> AlertDecision:
         """Alert if current observation indicates a match."""
-        severity = self.config.get("severity", "medium")
+        severity = self.severity
 
         if current.value is True:
             # Pattern was matched
@@ -2,6 +2,9 @@
 SequentialGrowth evaluator for Lighthouse.
 """
 
+from collections.abc import Sequence
+from typing import Any
+
 from lighthouse.core import AlertDecision, Evaluator, ObservationResult
 from lighthouse.registry import register_evaluator
 
@@ -22,13 +25,17 @@ class SequentialGrowthEvaluator(Evaluator):
         Don't alert if: current < previous OR current == 0
     """
 
+    def __init__(self, config: dict[str, Any]) -> None:
+        super().__init__(config)
+        self.severity = config.get("severity", "medium")
+
     def evaluate(
         self,
         current: ObservationResult,
-        history: list[ObservationResult]
+        history: Sequence[ObservationResult]
     ) -> AlertDecision:
         """Alert if metric shows sequential growth or stagnation."""
-        severity = self.config.get("severity", "medium")
+        severity = self.severity
 
         if current.value is None:
             return AlertDecision(
@@ -99,6 +106,24 @@ class SequentialGrowthEvaluator(Evaluator):
             }
         )
 
+    def evaluate_batch(
+        self,
+        observations: list[ObservationResult],
+        history: Sequence[ObservationResult]
+    ) -> tuple[list[bool], list[AlertDecision]]:
+        """
+        Evaluate a chunk by pairing each observation with its predecessor.
+
+        Only the previous observation affects the decision, so this avoids
+        building the growing history window used by the generic implementation.
+        """
+        previous = [history[-1]] if history else []
+        decisions = []
+        for current in observations:
+            decisions.append(self.evaluate(current, previous))
+            previous = [current]
+        return [d.should_alert for d in decisions], decisions
+
 
 # Export for dynamic importing
 __all__ = ["SequentialGrowthEvaluator"]
@@ -2,6 +2,9 @@
 StateChange evaluator for Lighthouse.
 """
 
+from collections.abc import Sequence
+from typing import Any
+
 from lighthouse.core import AlertDecision, Evaluator, ObservationResult
 from lighthouse.registry import register_evaluator
 
@@ -19,14 +22,23 @@ class StateChangeEvaluator(Evaluator):
         severity: Alert severity level (default: "medium")
     """
 
+    def __init__(self, config: dict[str, Any]) -> None:
+        super().__init__(config)
+        self.alert_on = config.get("alert_on", "both")
+        self.severity = config.get("severity", "medium")
+        # Whether to alert for each boolean (previous, current) transition
+        self._transitions = {
+            (True, False): self.alert_on in ("both", "true_to_false"),
+            (False, True): self.alert_on in ("both", "false_to_true"),
+        }
+
     def evaluate(
         self,
         current: ObservationResult,
-        history: list[ObservationResult]
+        history: Sequence[ObservationResult]
     ) -> AlertDecision:
         """Alert on state changes."""
-        alert_on = self.config.get("alert_on", "both")
-        severity = self.config.get("severity", "medium")
+        severity = self.severity
 
         if current.value is None:
             return AlertDecision(
@@ -71,13 +83,11 @@ class StateChangeEvaluator(Evaluator):
             )
 
         # Determine if we should alert based on alert_on config
-        transitioned_to_failure = (
-            alert_on == "true_to_false" and previous.value is True and current.value is False
-        )
-        transitioned_to_success = (
-            alert_on == "false_to_true" and previous.value is False and current.value is True
-        )
-        should_alert = alert_on == "both" or transitioned_to_failure or transitioned_to_success
+        if isinstance(previous.value, bool) and isinstance(current.value, bool):
+            should_alert = self._transitions[(previous.value, current.value)]
+        else:
+            # Directional settings only apply to boolean states
+            should_alert = self.alert_on == "both"
 
         if should_alert:
             return AlertDecision(
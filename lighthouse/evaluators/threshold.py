@@ -2,9 +2,22 @@
 Threshold evaluator for Lighthouse.
 """
 
+import operator as op
+from collections.abc import Callable, Sequence
+from typing import Any
+
 from lighthouse.core import AlertDecision, Evaluator, ObservationResult
 from lighthouse.registry import register_evaluator
 
+COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "gt": op.gt,
+    "gte": op.ge,
+    "lt": op.lt,
+    "lte": op.le,
+    "eq": op.eq,
+    "ne": op.ne,
+}
+
 
 @register_evaluator("threshold")
 class ThresholdEvaluator(Evaluator):
@@ -17,15 +30,49 @@ class ThresholdEvaluator(Evaluator):
         severity: Alert severity level (default: "medium")
     """
 
+    def __init__(self, config: dict[str, Any]) -> None:
+        super().__init__(config)
+        # Resolved once here rather than on every evaluate() call
+        self.operator = config["operator"]
+        self.threshold = config["value"]
+        self.severity = config.get("severity", "medium")
+        # Constant tail of every message, e.g. " gt 10"
+        self._message_suffix = f" {self.operator} {self.threshold}"
+        self._compare = COMPARISONS.get(self.operator)
+
     def evaluate(
         self,
         current: ObservationResult,
-        _history: list[ObservationResult]
+        _history: Sequence[ObservationResult]
     ) -> AlertDecision:
         """Alert if metric crosses threshold."""
-        operator = self.config["operator"]
-        threshold = self.config["value"]
-        severity = self.config.get("severity", "medium")
+        return self._decide(current)
+
+    def evaluate_batch(
+        self,
+        observations: list[ObservationResult],
+        _history: Sequence[ObservationResult]
+    ) -> tuple[list[bool], list[AlertDecision]]:
+        """Evaluate a chunk of observations, resolving the operator once."""
+        compare = self._comparison()
+        decisions = [self._decide(current, compare) for current in observations]
+        return [d.should_alert for d in decisions], decisions
+
+    def _comparison(self) -> Callable[[Any, Any], bool]:
+        """Look up the comparison function for the configured operator."""
+        if self._compare is None:
+            raise ValueError(f"Unknown operator: {self.operator}")
+        return self._compare
+
+    def _decide(
+        self,
+        current: ObservationResult,
+        compare: Callable[[Any, Any], bool] | None = None
+    ) -> AlertDecision:
+        """Build the decision for a single observation."""
+        operator = self.operator
+        threshold = self.threshold
+        severity = self.severity
 
         if current.value is None:
             return AlertDecision(
@@ -35,26 +82,14 @@ class ThresholdEvaluator(Evaluator):
                 context=current.metadata
             )
 
-        # Perform comparison
-        comparisons = {
-            "gt": lambda v, t: v > t,
-            "gte": lambda v, t: v >= t,
-            "lt": lambda v, t: v < t,
-            "lte": lambda v, t: v <= t,
-            "eq": lambda v, t: v == t,
-            "ne": lambda v, t: v != t,
-        }
-
-        if operator not in comparisons:
-            raise ValueError(f"Unknown operator: {operator}")
-
-        threshold_crossed = comparisons[operator](current.value, threshold)
+        if compare is None:
+            compare = self._comparison()
 
-        if threshold_crossed:
+        if compare(current.value, threshold):
             return AlertDecision(
                 should_alert=True,
                 severity=severity,
-                message=f"Threshold crossed: {current.value} {operator} {threshold}",
+                message=f"Threshold crossed: {current.value}{self._message_suffix}",
                 context={
                     **current.metadata,
                     "current_value": current.value,
@@ -65,7 +100,7 @@ class ThresholdEvaluator(Evaluator):
         return AlertDecision(
             should_alert=False,
             severity=severity,
-            message=f"Threshold not crossed: {current.value} {operator} {threshold}",
+            message=f"Threshold not crossed: {current.value}{self._message_suffix}",
             context=current.metadata
         )
 
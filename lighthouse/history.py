@@ -0,0 +1,99 @@
+"""
+Persistent observation history for watchers.
+"""
+
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from lighthouse.core import ObservationResult
+
+# Optional fast JSON codec; the on-disk format is plain JSON either way
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Only the most recent observations are kept to prevent unbounded growth
+MAX_HISTORY = 100
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes."""
+    if orjson is not None:
+        return bytes(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class HistoryStore:
+    """
+    Reads and writes a watcher's observation history file.
+
+    History is stored as a JSON list, oldest first:
+    [
+        {"value": 3, "timestamp": "2024-01-01T12:00:00", "metadata": {...}}
+    ]
+    """
+
+    def __init__(self, history_file: str | Path) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            history_file: Path to the history JSON file
+        """
+        self.history_file = Path(history_file)
+
+    def exists(self) -> bool:
+        """Return True if a history file has been written."""
+        return self.history_file.exists()
+
+    def load(self) -> list[ObservationResult]:
+        """
+        Load observation history from disk.
+
+        Returns:
+            Observations, oldest first
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid history JSON
+            KeyError: If an entry is missing a field
+        """
+        data = _load_json(self.history_file.read_bytes())
+        return [
+            ObservationResult(
+                value=item['value'],
+                timestamp=datetime.fromisoformat(item['timestamp']),
+                metadata=item['metadata']
+            )
+            for item in data
+        ]
+
+    def save(self, history: Sequence[ObservationResult]) -> None:
+        """
+        Save the most recent MAX_HISTORY observations to disk.
+
+        Args:
+            history: Observations, oldest first
+        """
+        self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        data = [
+            {
+                'value': item.value,
+                'timestamp': item.timestamp.isoformat(),
+                'metadata': item.metadata
+            }
+            for item in islice(history, max(len(history) - MAX_HISTORY, 0), None)
+        ]
+        self.history_file.write_bytes(_dump_json(data))
@@ -0,0 +1,210 @@
+"""
+Shared HTTP plumbing for the notifiers that talk to web APIs.
+
+requests is imported on first use rather than at module load: every
+notifier module is imported when lighthouse.notifiers is, and setups that
+only print to the console shouldn't pay for requests and urllib3.
+"""
+
+import json
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from lighthouse.logging_config import get_logger
+
+if TYPE_CHECKING:
+    import requests
+
+logger = get_logger(__name__)
+
+# Optional fast JSON encoder for request bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def dump_json(payload: Any) -> bytes:
+    """Encode a request body as compact JSON bytes."""
+    if orjson is not None:
+        return bytes(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS))
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def create_session() -> "requests.Session":
+    """
+    Create a session that keeps connections alive between notifications.
+
+    Reusing one session per notifier avoids a new TCP and TLS handshake for
+    every alert sent to the same host.
+
+    Returns:
+        Session with pooled adapters mounted for http and https
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class SendError(Exception):
+    """A notification request failed; the requests exception is its __cause__."""
+
+
+class CircuitOpenError(SendError):
+    """Raised instead of sending while a circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Stops calling a receiver that keeps failing.
+
+    After threshold consecutive failures the circuit opens and requests are
+    refused without touching the network. Once reset_after seconds have
+    passed it goes half-open and lets one probe through: success closes the
+    circuit again, failure re-opens it for another cool-down.
+    """
+
+    def __init__(self, threshold: int = 5, reset_after: float = 30.0) -> None:
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.state = "closed"
+        self.fail_count = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_after:
+                self.state = "half_open"
+                return True
+            # Open and cooling down, or a half-open probe is already in flight
+            return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self.state = "closed"
+            self.fail_count = 0
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self.fail_count += 1
+            if self.state == "half_open" or self.fail_count >= self.threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+
+def _is_transient(exc: "requests.RequestException") -> bool:
+    """Whether a failed request is worth retrying (network trouble or 5xx)."""
+    import requests
+
+    if isinstance(exc, requests.ConnectionError | requests.Timeout):
+        return True
+    if isinstance(exc, requests.HTTPError):
+        status = getattr(exc.response, "status_code", None)
+        return isinstance(status, int) and status >= 500
+    return False
+
+
+def _retry(
+    send: Callable[[], "requests.Response"],
+    max_retries: int,
+    base: float,
+    cap: float,
+    jitter: float,
+) -> "requests.Response":
+    """Call send() until it succeeds, re-raising the last requests exception."""
+    import requests
+
+    attempt = 0
+    while True:
+        try:
+            response = send()
+            response.raise_for_status()
+            return response
+        except requests.RequestException as e:
+            if attempt >= max_retries or not _is_transient(e):
+                raise
+            delay = min(cap, base * 2 ** attempt) * (1 + random.uniform(0, jitter))  # noqa: S311
+            logger.warning(
+                "Request failed (%s), retrying in %.1fs (%d/%d)",
+                e, delay, attempt + 1, max_retries
+            )
+            time.sleep(delay)
+            attempt += 1
+
+
+def send_with_retry(
+    send: Callable[[], "requests.Response"],
+    *,
+    max_retries: int = 3,
+    base: float = 1.0,
+    cap: float = 30.0,
+    jitter: float = 0.5,
+    breaker: CircuitBreaker | None = None,
+) -> "requests.Response":
+    """
+    Call send() until it succeeds, backing off between transient failures.
+
+    Connection errors, timeouts and 5xx responses are retried up to
+    max_retries times, sleeping min(cap, base * 2**attempt) scaled by a
+    random factor in [1, 1 + jitter]. Anything else (including 4xx) is
+    raised immediately.
+
+    With a breaker, the call is refused up front while the circuit is open,
+    and the final outcome is recorded on it; 4xx responses do not count
+    against the receiver, and any other exception counts as a failure.
+
+    Args:
+        send: Performs one request and returns its response
+        max_retries: Retries after the first attempt
+        base: Delay before the first retry, in seconds
+        cap: Upper bound on the un-jittered delay, in seconds
+        jitter: Maximum extra fraction added to each delay
+        breaker: Circuit breaker guarding the receiver, if any
+
+    Returns:
+        The successful response
+
+    Raises:
+        CircuitOpenError: The breaker is open
+        SendError: The request failed and retries, if any, are exhausted
+    """
+    import requests
+
+    if breaker is not None and not breaker.allow():
+        raise CircuitOpenError("Circuit breaker open, not sending")
+
+    try:
+        response = _retry(send, max_retries, base, cap, jitter)
+    except requests.RequestException as e:
+        if breaker is not None:
+            # A 4xx answer still proves the receiver is up
+            if getattr(e.response, "status_code", 500) < 500:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+        raise SendError(str(e)) from e
+    except BaseException:
+        # Anything else still ends a half-open probe, or the circuit never recovers
+        if breaker is not None:
+            breaker.record_failure()
+        raise
+
+    if breaker is not None:
+        breaker.record_success()
+    return response
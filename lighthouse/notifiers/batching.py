@@ -0,0 +1,107 @@
+"""
+Batching notifier for Lighthouse.
+
+Wraps another notifier and coalesces alerts that arrive close together
+into a single notify_batch() call.
+"""
+
+import threading
+from typing import Any
+
+from lighthouse.core import AlertDecision, Notifier
+from lighthouse.logging_config import get_logger
+from lighthouse.registry import create_notifier, register_notifier
+
+logger = get_logger(__name__)
+
+
+@register_notifier("batching")
+class BatchingNotifier(Notifier):
+    """
+    Buffers alerts and forwards them to an inner notifier in batches.
+
+    A batch is flushed when window_ms has passed since its first alert,
+    when it reaches max_batch alerts, or when the notifier is closed.
+    Batches are delivered one at a time, in the order they were taken.
+
+    Config:
+        notifier: Inner notifier, as {"type": ..., "config": {...}}
+        window_ms: How long to wait for more alerts (default: 50)
+        max_batch: Flush immediately once this many alerts are buffered (default: 64)
+    """
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        super().__init__(config)
+        inner = config["notifier"]
+        self.inner = create_notifier(inner["type"], inner.get("config", {}))
+        self.window = config.get("window_ms", 50) / 1000
+        self.max_batch = config.get("max_batch", 64)
+        self._buf: list[tuple[AlertDecision, str]] = []
+        self._lock = threading.Lock()
+        # Held while a batch is taken and delivered, so flushes from the timer
+        # and from a full buffer neither overlap nor reorder
+        self._send_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def notify(self, alert: AlertDecision, watcher_name: str) -> bool:
+        """Buffer an alert; delivery happens when the batch is flushed."""
+        with self._lock:
+            self._buf.append((alert, watcher_name))
+            full = len(self._buf) >= self.max_batch
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.window, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if full:
+            self._flush()
+        return True
+
+    def _flush(self) -> bool:
+        """Send everything buffered so far as one batch."""
+        with self._send_lock:
+            return self._send_buffered()
+
+    def _send_buffered(self) -> bool:
+        with self._lock:
+            batch, self._buf = self._buf, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if not batch:
+            return True
+
+        try:
+            success = self.inner.notify_batch(batch)
+        except Exception:
+            logger.error(
+                "Error sending batch of %d alert(s) via %s",
+                len(batch),
+                self.inner.__class__.__name__,
+                exc_info=True,
+            )
+            return False
+
+        if not success:
+            logger.warning(
+                "Notifier %s failed to deliver batch of %d alert(s)",
+                self.inner.__class__.__name__,
+                len(batch),
+            )
+        return success
+
+    def close(self) -> None:
+        """Flush pending alerts and close the inner notifier."""
+        self._flush()
+        self.inner.close()
+
+    def __enter__(self) -> "BatchingNotifier":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+# Export for dynamic importing
+__all__ = ["BatchingNotifier"]
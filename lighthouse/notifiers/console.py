@@ -2,6 +2,9 @@
 Console notifier for Lighthouse.
 """
 
+import sys
+from typing import ClassVar
+
 from lighthouse.core import AlertDecision, Notifier
 from lighthouse.logging_config import get_logger
 from lighthouse.registry import register_notifier
@@ -20,19 +23,34 @@ class ConsoleNotifier(Notifier):
         (none required)
     """
 
+    _RULE: ClassVar[str] = "=" * 60
+    _TEMPLATE: ClassVar[str] = (
+        "\n{rule}\n"
+        "ALERT: {watcher}\n"
+        "Severity: {severity}\n"
+        "Message: {message}\n"
+        "{context}"
+        "{rule}\n\n"
+    )
+
     def notify(self, alert: AlertDecision, watcher_name: str) -> bool:
         """Print notification to console."""
-        logger.info("Console alert for watcher '%s': {alert.message}", watcher_name)
+        logger.info("Console alert for watcher '%s': %s", watcher_name, alert.message)
 
-        print(f"\n{'=' * 60}")
-        print(f"ALERT: {watcher_name}")
-        print(f"Severity: {alert.severity}")
-        print(f"Message: {alert.message}")
+        context = ""
         if alert.context:
-            print("\nContext:")
-            for key, value in alert.context.items():
-                print(f"  {key}: {value}")
-        print(f"{'=' * 60}\n")
+            context = "\nContext:\n" + "".join(
+                f"  {key}: {value}\n" for key, value in alert.context.items()
+            )
+
+        # One write, so alerts printed from concurrent threads don't interleave
+        sys.stdout.write(self._TEMPLATE.format_map({
+            "rule": self._RULE,
+            "watcher": watcher_name,
+            "severity": alert.severity,
+            "message": alert.message,
+            "context": context,
+        }))
         return True
 
 
@@ -1,32 +1,121 @@
 """
-Email notifier for Lighthouse (placeholder).
+Email notifier for Lighthouse.
 """
 
+import smtplib
+import ssl
+import threading
+from email.message import EmailMessage
+from typing import Any
+
 from lighthouse.core import AlertDecision, Notifier
+from lighthouse.logging_config import get_logger
 from lighthouse.registry import register_notifier
 
+logger = get_logger(__name__)
+
 
 @register_notifier("email")
 class EmailNotifier(Notifier):
     """
     Sends notifications via email.
 
-    TODO: Implement email sending
+    The SMTP connection (including STARTTLS and login) is opened on the first
+    alert and kept for later ones; if the server has dropped it in the
+    meantime, the notifier reconnects once and resends.
 
     Config:
         smtp_host: SMTP server hostname
-        smtp_port: SMTP server port
+        smtp_port: SMTP server port (default: 587)
         from_addr: Sender email address
-        to_addr: Recipient email address
+        to_addr: Recipient email address, or a list of addresses
         username: SMTP username (optional)
         password: SMTP password (optional)
+        starttls: Upgrade the connection with STARTTLS (default: true)
     """
 
+    def __init__(self, config: dict[str, Any]) -> None:
+        super().__init__(config)
+        self._smtp: smtplib.SMTP | None = None
+        self._lock = threading.Lock()
+
     def notify(self, alert: AlertDecision, watcher_name: str) -> bool:
-        """Send notification via email (not yet implemented)."""
-        raise NotImplementedError("Email notifications not yet implemented")
+        """Send notification via email."""
+        message = self._build_message(alert, watcher_name)
+
+        with self._lock:
+            try:
+                try:
+                    self._send(message)
+                except smtplib.SMTPServerDisconnected:
+                    logger.info("SMTP connection was closed, reconnecting")
+                    self._smtp = None
+                    self._send(message)
+            except (smtplib.SMTPException, OSError):
+                logger.error(
+                    "Failed to send email notification for watcher '%s'",
+                    watcher_name,
+                    exc_info=True
+                )
+                self._disconnect()
+                return False
+
+        logger.info("Email notification sent successfully for watcher '%s'", watcher_name)
+        return True
+
+    def close(self) -> None:
+        """Close the SMTP connection, if one is open."""
+        with self._lock:
+            self._disconnect()
+
+    def _build_message(self, alert: AlertDecision, watcher_name: str) -> EmailMessage:
+        """Build the email for one alert."""
+        to_addr = self.config["to_addr"]
+        if isinstance(to_addr, list):
+            to_addr = ", ".join(to_addr)
+
+        message = EmailMessage()
+        message["Subject"] = f"[Lighthouse] {alert.severity.upper()}: {watcher_name}"
+        message["From"] = self.config["from_addr"]
+        message["To"] = to_addr
+        message.set_content("\n".join([
+            alert.message,
+            *(f"{k}: {v}" for k, v in alert.context.items()),
+        ]))
+        return message
+
+    def _send(self, message: EmailMessage) -> None:
+        """Send a message over the shared connection, opening it if needed."""
+        if self._smtp is None:
+            self._smtp = self._connect()
+        self._smtp.send_message(message)
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection."""
+        smtp = smtplib.SMTP(
+            self.config["smtp_host"], self.config.get("smtp_port", 587), timeout=10
+        )
+        try:
+            if self.config.get("starttls", True):
+                smtp.starttls(context=ssl.create_default_context())
+            username = self.config.get("username")
+            if username:
+                smtp.login(username, self.config.get("password", ""))
+        except BaseException:
+            smtp.close()
+            raise
+        return smtp
+
+    def _disconnect(self) -> None:
+        """Drop the current connection, ignoring errors from a dead server."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
 
 
 # Export for dynamic importing
 __all__ = ["EmailNotifier"]
-
@@ -2,12 +2,17 @@
 Pushover notifier for Lighthouse.
 """
 
-from typing import ClassVar
-
-import requests
+from typing import Any, ClassVar
 
 from lighthouse.core import AlertDecision, Notifier
 from lighthouse.logging_config import get_logger
+from lighthouse.notifiers._http import (
+    CircuitBreaker,
+    CircuitOpenError,
+    SendError,
+    create_session,
+    send_with_retry,
+)
 from lighthouse.registry import register_notifier
 
 logger = get_logger(__name__)
@@ -33,6 +38,16 @@ class PushoverNotifier(Notifier):
         "critical": 2,
     }
 
+    def __init__(self, config: dict[str, Any]) -> None:
+        super().__init__(config)
+        self._session = create_session()
+        self._breaker = CircuitBreaker()
+
+    @staticmethod
+    def _format_message(alert: AlertDecision) -> str:
+        """Alert message followed by one paragraph per context item."""
+        return "\n\n".join([alert.message, *(f"{k}: {v}" for k, v in alert.context.items())])
+
     def notify(self, alert: AlertDecision, watcher_name: str) -> bool:
         """Send notification via Pushover."""
         user_key = self.config["user_key"]
@@ -42,21 +57,12 @@ class PushoverNotifier(Notifier):
         # Map severity to Pushover priority
         priority = self.SEVERITY_TO_PRIORITY.get(alert.severity, default_priority)
 
-        # Build notification message
-        title = f"Lighthouse: {watcher_name}"
-        message = alert.message
-
-        # Add context as additional details
-        if alert.context:
-            details = "\n\n".join([f"{k}: {v}" for k, v in alert.context.items()])
-            message = f"{message}\n\n{details}"
-
         # Send to Pushover
         payload = {
             "token": api_token,
             "user": user_key,
-            "title": title,
-            "message": message,
+            "title": f"Lighthouse: {watcher_name}",
+            "message": self._format_message(alert),
             "priority": priority,
         }
 
@@ -66,15 +72,20 @@ class PushoverNotifier(Notifier):
             payload["expire"] = 3600  # Give up after 1 hour
 
         try:
-            response = requests.post(
+            send_with_retry(lambda: self._session.request(
+                "POST",
                 self.PUSHOVER_API_URL,
                 data=payload,
                 timeout=10
-            )
-            response.raise_for_status()
+            ), breaker=self._breaker)
             logger.info("Pushover notification sent successfully for watcher '%s'", watcher_name)
             return True
-        except requests.RequestException:
+        except CircuitOpenError:
+            logger.warning(
+                "Pushover circuit open, dropping notification for watcher '%s'", watcher_name
+            )
+            return False
+        except SendError:
             logger.error(
                 "Failed to send Pushover notification for watcher '%s'",
                 watcher_name,
@@ -1,29 +1,125 @@
 """
-Slack notifier for Lighthouse (placeholder).
+Slack notifier for Lighthouse.
 """
 
+import hashlib
+import threading
+import time
+from typing import Any
+
 from lighthouse.core import AlertDecision, Notifier
+from lighthouse.logging_config import get_logger
+from lighthouse.notifiers._http import (
+    JSON_HEADERS,
+    CircuitBreaker,
+    CircuitOpenError,
+    SendError,
+    create_session,
+    dump_json,
+    send_with_retry,
+)
 from lighthouse.registry import register_notifier
 
+logger = get_logger(__name__)
+
+# Upper bound on remembered alerts, so a flood of distinct messages can't grow it forever
+MAX_DEDUP_ENTRIES = 1024
+
 
 @register_notifier("slack")
 class SlackNotifier(Notifier):
     """
     Sends notifications to Slack via webhook.
 
-    TODO: Implement Slack formatting
+    An alert identical to one already sent (same watcher, severity and
+    message) within dedup_seconds is suppressed, so a cascading failure
+    posts each distinct alert once rather than once per occurrence.
 
     Config:
         webhook_url: Slack webhook URL
         channel: Optional channel override
         username: Optional bot username
+        dedup_seconds: Window for suppressing repeated alerts (default: 60, 0 disables)
     """
 
+    def __init__(self, config: dict[str, Any]) -> None:
+        super().__init__(config)
+        self.dedup_seconds = config.get("dedup_seconds", 60)
+        self._session = create_session()
+        self._breaker = CircuitBreaker()
+        # Alert key -> monotonic time it stops being a duplicate
+        self._recent: dict[bytes, float] = {}
+        self._lock = threading.Lock()
+
     def notify(self, alert: AlertDecision, watcher_name: str) -> bool:
-        """Send notification to Slack (not yet implemented)."""
-        raise NotImplementedError("Slack notifications not yet implemented")
+        """Send notification to Slack."""
+        key = hashlib.blake2b(
+            f"{watcher_name}|{alert.severity}|{alert.message}".encode(), digest_size=8
+        ).digest()
+        if self._is_duplicate(key):
+            logger.info("Suppressed duplicate Slack alert for watcher '%s'", watcher_name)
+            return True
+
+        payload: dict[str, Any] = {"text": self._format_text(alert, watcher_name)}
+        for option in ("channel", "username"):
+            if option in self.config:
+                payload[option] = self.config[option]
+        body = dump_json(payload)
+
+        try:
+            send_with_retry(lambda: self._session.request(
+                "POST",
+                self.config["webhook_url"],
+                data=body,
+                headers=JSON_HEADERS,
+                timeout=10
+            ), breaker=self._breaker)
+        except CircuitOpenError:
+            logger.warning(
+                "Slack circuit open, dropping notification for watcher '%s'", watcher_name
+            )
+            return False
+        except SendError:
+            logger.error(
+                "Failed to send Slack notification for watcher '%s'",
+                watcher_name,
+                exc_info=True
+            )
+            return False
+
+        self._remember(key)
+        logger.info("Slack notification sent successfully for watcher '%s'", watcher_name)
+        return True
+
+    @staticmethod
+    def _format_text(alert: AlertDecision, watcher_name: str) -> str:
+        """Slack mrkdwn text for one alert."""
+        return "\n".join([
+            f"*[{alert.severity.upper()}] {watcher_name}*",
+            alert.message,
+            *(f"• {k}: {v}" for k, v in alert.context.items()),
+        ])
+
+    def _is_duplicate(self, key: bytes) -> bool:
+        """Whether an identical alert was sent within the dedup window."""
+        with self._lock:
+            expires = self._recent.get(key)
+            return expires is not None and time.monotonic() < expires
+
+    def _remember(self, key: bytes) -> None:
+        """Record a sent alert, pruning expired and excess entries."""
+        if self.dedup_seconds <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if len(self._recent) >= MAX_DEDUP_ENTRIES:
+                self._recent = {k: t for k, t in self._recent.items() if t > now}
+                # Still full: drop the oldest (dicts keep insertion order)
+                while len(self._recent) >= MAX_DEDUP_ENTRIES:
+                    del self._recent[next(iter(self._recent))]
+            self._recent.pop(key, None)
+            self._recent[key] = now + self.dedup_seconds
 
 
 # Export for dynamic importing
 __all__ = ["SlackNotifier"]
-
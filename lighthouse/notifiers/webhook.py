@@ -2,10 +2,19 @@
 Webhook notifier for Lighthouse.
 """
 
-import requests
+from typing import Any, ClassVar
 
 from lighthouse.core import AlertDecision, Notifier
 from lighthouse.logging_config import get_logger
+from lighthouse.notifiers._http import (
+    JSON_HEADERS,
+    CircuitBreaker,
+    CircuitOpenError,
+    SendError,
+    create_session,
+    dump_json,
+    send_with_retry,
+)
 from lighthouse.registry import register_notifier
 
 logger = get_logger(__name__)
@@ -18,19 +27,36 @@ class WebhookNotifier(Notifier):
 
     Config:
         url: Webhook URL to POST to
-        method: HTTP method (default: POST)
+        method: HTTP method: POST, PUT or PATCH (default: POST)
         headers: Optional HTTP headers
         auth: Optional authentication config
     """
 
+    SUPPORTED_METHODS: ClassVar[frozenset[str]] = frozenset({"POST", "PUT", "PATCH"})
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        super().__init__(config)
+        self.url = config["url"]
+        self.method = config.get("method", "POST").upper()
+        self._headers = {**JSON_HEADERS, **config.get("headers", {})}
+        self._session = create_session()
+        self._breaker = CircuitBreaker()
+
     def notify(self, alert: AlertDecision, watcher_name: str) -> bool:
         """Send notification via webhook."""
-        url = self.config["url"]
-        method = self.config.get("method", "POST").upper()
-        headers = self.config.get("headers", {})
+        return self._send(self._build_payload(alert, watcher_name), f"watcher '{watcher_name}'")
 
-        # Build payload
+    def notify_batch(self, alerts: list[tuple[AlertDecision, str]]) -> bool:
+        """Send several alerts as one webhook request: {"alerts": [...]}."""
         payload = {
+            "alerts": [self._build_payload(alert, watcher_name) for alert, watcher_name in alerts]
+        }
+        return self._send(payload, f"batch of {len(alerts)} alert(s)")
+
+    @staticmethod
+    def _build_payload(alert: AlertDecision, watcher_name: str) -> dict[str, Any]:
+        """Build the JSON body describing one alert."""
+        return {
             "watcher": watcher_name,
             "severity": alert.severity,
             "message": alert.message,
@@ -38,27 +64,34 @@ class WebhookNotifier(Notifier):
             "timestamp": alert.context.get("timestamp"),  # If available
         }
 
+    def _send(self, payload: dict[str, Any], label: str) -> bool:
+        """
+        Send a JSON payload to the configured URL.
+
+        Args:
+            payload: JSON body
+            label: What is being sent, for log messages
+
+        Returns:
+            True if the request succeeded
+        """
+        url, method, headers = self.url, self.method, self._headers
+
+        if method not in self.SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
         try:
-            if method == "POST":
-                response = requests.post(url, json=payload, headers=headers, timeout=10)
-            elif method == "PUT":
-                response = requests.put(url, json=payload, headers=headers, timeout=10)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            response.raise_for_status()
-            logger.info(
-                "Webhook notification sent successfully for watcher '%s' to %s",
-                watcher_name,
-                url
-            )
+            body = dump_json(payload)
+            send_with_retry(lambda: self._session.request(
+                method, url, data=body, headers=headers, timeout=10
+            ), breaker=self._breaker)
+            logger.info("Webhook notification sent successfully for %s to %s", label, url)
             return True
-        except requests.RequestException:
-            logger.error(
-                "Failed to send webhook notification for watcher '%s'",
-                watcher_name,
-                exc_info=True
-            )
+        except CircuitOpenError:
+            logger.warning("Webhook circuit open for %s, dropping %s", url, label)
+            return False
+        except SendError:
+            logger.error("Failed to send webhook notification for %s", label, exc_info=True)
             return False
 
 
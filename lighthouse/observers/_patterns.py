@@ -0,0 +1,50 @@
+"""
+Shared regex compilation for the pattern-based observers.
+"""
+
+import functools
+import re
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """
+    Compile a regex pattern, sharing the result across observer instances.
+
+    Unlike the re module's internal cache, entries are never evicted in bulk,
+    so configs with many patterns keep their compiled objects.
+
+    Args:
+        pattern: Regex pattern string
+        flags: re module flags
+
+    Returns:
+        Compiled pattern
+    """
+    return re.compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_any(patterns: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    """
+    Compile patterns for "does any of these match" checks.
+
+    Patterns are joined into a single alternation so each search is one pass
+    of the regex engine instead of one per pattern. Patterns that cannot be
+    safely combined (capturing groups, whose backreference numbers would shift,
+    or inline global flags) fall back to one compiled pattern each.
+
+    Args:
+        patterns: Regex pattern strings
+
+    Returns:
+        Compiled patterns; a line matches if any of them matches
+    """
+    compiled = tuple(compile_pattern(pattern) for pattern in patterns)
+    if len(compiled) < 2 or any(regex.groups for regex in compiled):
+        return compiled
+
+    try:
+        return (re.compile("|".join(f"(?:{pattern})" for pattern in patterns)),)
+    except re.error:
+        return compiled
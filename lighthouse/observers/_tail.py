@@ -0,0 +1,75 @@
+"""
+Incremental reading of append-only files for the observers.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import xxhash
+
+from lighthouse.platform import get_file_fingerprint
+
+# Bytes just before the resume offset that are hashed to detect in-place rewrites
+ANCHOR_BYTES = 4096
+
+
+class TailReader:
+    """
+    Reads a file from where the previous read stopped.
+
+    Tracks the file fingerprint, the offset just past the last complete line,
+    and a hash of the bytes before that offset. If the file was replaced,
+    shrank, or those bytes changed, reading starts over from the beginning.
+    """
+
+    def __init__(self) -> None:
+        self.fingerprint: tuple[Any, ...] | None = None
+        self.offset = 0
+        self._anchor: bytes | None = None
+        self._anchor_len = 0
+
+    def _can_resume(self, f: BinaryIO, fingerprint: tuple[Any, ...] | None) -> bool:
+        """Check that the already-read prefix of the file is unchanged."""
+        if fingerprint is None or fingerprint != self.fingerprint or self._anchor is None:
+            return False
+        if os.fstat(f.fileno()).st_size < self.offset:
+            return False
+        f.seek(self.offset - self._anchor_len)
+        return xxhash.xxh64_digest(f.read(self._anchor_len)) == self._anchor
+
+    def read(self, path: Path) -> tuple[str, str, bool]:
+        """
+        Read new content from path.
+
+        Args:
+            path: File to read
+
+        Returns:
+            Tuple of (complete, partial, reset): newly completed lines, a
+            trailing line that is still being written (it is read again next
+            time), and whether reading started over from the beginning
+        """
+        fingerprint = get_file_fingerprint(str(path))
+
+        with open(path, 'rb') as f:
+            reset = not self._can_resume(f, fingerprint)
+            if reset:
+                self.offset = 0
+                self._anchor = None
+                self._anchor_len = 0
+            f.seek(self.offset)
+            data = f.read()
+
+        end = data.rfind(b"\n") + 1
+        if end:
+            self._anchor_len = min(end, ANCHOR_BYTES)
+            self._anchor = xxhash.xxh64_digest(data[end - self._anchor_len:end])
+            self.offset += end
+        self.fingerprint = fingerprint
+
+        return (
+            data[:end].decode('utf-8', errors='ignore'),
+            data[end:].decode('utf-8', errors='ignore'),
+            reset,
+        )
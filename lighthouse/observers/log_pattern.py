@@ -1,29 +1,55 @@
 """
-Observes log files for pattern matches by reading the entire file.
+Observes log files for pattern matches across the entire file.
 """
 
-import re
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from lighthouse.core import ObservationResult
 from lighthouse.core import Observer as BaseObserver
 from lighthouse.logging_config import get_logger
+from lighthouse.observers._patterns import compile_pattern
+from lighthouse.observers._tail import TailReader
 from lighthouse.registry import register_observer
 
 logger = get_logger(__name__)
 
+# Characters of already-scanned text searched again with new content, so a
+# match that straddles the previous read boundary is still found
+OVERLAP_CHARS = 4096
+
 
 @register_observer("log_pattern")
 class Observer(BaseObserver):
     """
-    Observes log files for pattern matches by reading the entire file.
+    Observes log files for pattern matches across the entire file.
+
+    The whole file is read on the first observation. Later observations only
+    read bytes appended since then and merge their matches with the earlier
+    ones, as long as the file is the same one (same fingerprint), has not
+    shrunk, and the last bytes already scanned are unchanged. Otherwise the
+    file is scanned from the start again.
+
+    The appended text is searched together with the last OVERLAP_CHARS
+    characters already scanned, so a match split across two reads is found
+    as long as it starts within that window. ^ and \\A only match at the
+    real start of the file.
 
     Config:
         log_file: Path to the log file to watch
         patterns: List of regex patterns to match
     """
 
+    def __init__(self, config: dict[str, Any]) -> None:
+        super().__init__(config)
+        self._tail = TailReader()
+        self._matched: set[str] = set()
+        # Tail of the scanned text, and where searches in it may start: 0 while
+        # it still begins at the start of the file, else 1 so ^ and \A can't match
+        self._overlap = ""
+        self._overlap_pos = 0
+
     def observe(self) -> ObservationResult:
         """Check if any patterns match in the log file."""
         log_file = Path(self.config["log_file"])
@@ -37,15 +63,28 @@ class Observer(BaseObserver):
                 metadata={"error": f"Log file not found: {log_file}"}
             )
 
-        # Read the file and check for pattern matches
+        # Read new content and check it for patterns not matched yet
         try:
-            with open(log_file, encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            complete, partial, reset = self._tail.read(log_file)
+            if reset:
+                self._matched.clear()
+                self._overlap = ""
+                self._overlap_pos = 0
+            content = self._overlap + complete + partial
 
-            matches = []
             for pattern in patterns:
-                if re.search(pattern, content):
-                    matches.append(pattern)
+                if pattern not in self._matched and compile_pattern(pattern).search(
+                    content, self._overlap_pos
+                ):
+                    self._matched.add(pattern)
+
+            scanned = self._overlap + complete
+            if len(scanned) > OVERLAP_CHARS:
+                self._overlap = scanned[-OVERLAP_CHARS:]
+                self._overlap_pos = 1
+            else:
+                self._overlap = scanned
+            matches = [pattern for pattern in patterns if pattern in self._matched]
 
             if matches:
                 logger.info(
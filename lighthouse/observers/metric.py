@@ -11,11 +11,36 @@ from typing import Any
 from lighthouse.core import ObservationResult
 from lighthouse.core import Observer as BaseObserver
 from lighthouse.logging_config import get_logger
+from lighthouse.observers._patterns import compile_pattern
+from lighthouse.observers._tail import TailReader
 from lighthouse.registry import register_observer
 
 logger = get_logger(__name__)
 
 
+def _count_matching_lines(regex: re.Pattern[str], text: str) -> int:
+    """
+    Count the lines of text that contain a match.
+
+    The regex scans the whole text in C; Python only runs once per hit. A hit
+    that ends within its line counts that line, one that runs into the next
+    line is retried within its own line, and the scan then resumes at the
+    start of the next line.
+    """
+    count = 0
+    pos = 0
+    end = len(text)
+    while pos < end and (match := regex.search(text, pos)):
+        start = match.start()
+        line_end = text.find("\n", start) + 1 or end
+        if match.end() <= line_end or regex.search(
+            text, text.rfind("\n", 0, start) + 1, line_end
+        ):
+            count += 1
+        pos = line_end
+    return count
+
+
 @register_observer("metric")
 class Observer(BaseObserver):
     """
@@ -27,6 +52,12 @@ class Observer(BaseObserver):
             (type-specific config)
     """
 
+    def __init__(self, config: dict[str, Any]) -> None:
+        super().__init__(config)
+        # line_count keeps a running tally of complete lines already counted
+        self._tail = TailReader()
+        self._line_count = 0
+
     def observe(self) -> ObservationResult:
         """Extract and return the metric value."""
         extractor_config = self.config["extractor"]
@@ -61,20 +92,26 @@ class Observer(BaseObserver):
             )
 
     def _extract_line_count(self, config: dict[str, Any]) -> int:
-        """Count lines matching a pattern in a file."""
+        """
+        Count lines matching a pattern in a file.
+
+        Only lines appended since the previous call are scanned; the file is
+        recounted from scratch if it was replaced, truncated, or rewritten.
+        """
         file_path = Path(config["source"])
-        pattern = config["pattern"]
+        # MULTILINE so ^ and $ anchor at line boundaries, as when searching line by line
+        regex = compile_pattern(config["pattern"], re.MULTILINE)
 
         if not file_path.exists():
             return 0
 
-        count = 0
-        with open(file_path, encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                if re.search(pattern, line):
-                    count += 1
+        complete, partial, reset = self._tail.read(file_path)
+        if reset:
+            self._line_count = 0
+        self._line_count += _count_matching_lines(regex, complete)
 
-        return count
+        # A trailing line without a newline is counted now but rescanned next time
+        return self._line_count + _count_matching_lines(regex, partial)
 
     def _extract_regex_capture(self, config: dict[str, Any]) -> str | int | float | None:
         """Extract a value using regex capture group."""
@@ -89,7 +126,7 @@ class Observer(BaseObserver):
         with open(file_path, encoding='utf-8', errors='ignore') as f:
             content = f.read()
 
-        match = re.search(pattern, content)
+        match = compile_pattern(pattern).search(content)
         if not match:
             return None
 
@@ -5,7 +5,6 @@ This observer is robust against log rotation and truncation.
 """
 
 import json
-import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -13,6 +12,7 @@ from typing import Any
 from lighthouse.core import ObservationResult
 from lighthouse.core import Observer as BaseObserver
 from lighthouse.logging_config import get_logger
+from lighthouse.observers._patterns import compile_any
 from lighthouse.platform import get_file_fingerprint
 from lighthouse.registry import register_observer
 
@@ -159,6 +159,11 @@ class Observer(BaseObserver):
                 # Ensure rotated_fingerprint exists for backward compatibility
                 if "rotated_fingerprint" not in state:
                     state["rotated_fingerprint"] = None
+                # JSON stores fingerprint tuples as lists; restore them so they
+                # compare equal to get_file_fingerprint() after a restart
+                for key in ("fingerprint", "rotated_fingerprint"):
+                    if isinstance(state.get(key), list):
+                        state[key] = tuple(state[key])
                 return state
         except (json.JSONDecodeError, KeyError) as e:
             logger.warning(
@@ -209,12 +214,11 @@ class Observer(BaseObserver):
             )
 
         # Search for patterns
-        matched_lines = []
-        for line in lines:
-            for pattern in self.patterns:
-                if re.search(pattern, line):
-                    matched_lines.append(line.strip())
-                    break # Don't match same line against multiple patterns
+        regexes = compile_any(tuple(self.patterns))
+        matched_lines = [
+            line.strip() for line in lines
+            if any(regex.search(line) for regex in regexes)
+        ]
 
         self.state["offset"] = new_offset
         self._save_state()
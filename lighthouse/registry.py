@@ -5,6 +5,8 @@ This module provides a centralized registry for all plugin types and
 factory functions to instantiate them from configuration.
 """
 
+import functools
+import importlib
 from collections.abc import Callable
 from typing import Any
 
@@ -32,9 +34,10 @@ class PluginRegistry:
 
     def get_observer(self, type_name: str) -> type[Observer]:
         """Get an observer class by type name."""
-        if type_name not in self._observers:
-            raise ValueError(f"Unknown observer type: {type_name}")
-        return self._observers[type_name]
+        try:
+            return self._observers[type_name]
+        except KeyError:
+            raise ValueError(f"Unknown observer type: {type_name}") from None
 
     # Trigger registration
     def register_trigger(self, type_name: str, cls: type[Trigger]) -> None:
@@ -43,9 +46,10 @@ class PluginRegistry:
 
     def get_trigger(self, type_name: str) -> type[Trigger]:
         """Get a trigger class by type name."""
-        if type_name not in self._triggers:
-            raise ValueError(f"Unknown trigger type: {type_name}")
-        return self._triggers[type_name]
+        try:
+            return self._triggers[type_name]
+        except KeyError:
+            raise ValueError(f"Unknown trigger type: {type_name}") from None
 
     # Evaluator registration
     def register_evaluator(self, type_name: str, cls: type[Evaluator]) -> None:
@@ -54,9 +58,10 @@ class PluginRegistry:
 
     def get_evaluator(self, type_name: str) -> type[Evaluator]:
         """Get an evaluator class by type name."""
-        if type_name not in self._evaluators:
-            raise ValueError(f"Unknown evaluator type: {type_name}")
-        return self._evaluators[type_name]
+        try:
+            return self._evaluators[type_name]
+        except KeyError:
+            raise ValueError(f"Unknown evaluator type: {type_name}") from None
 
     # Notifier registration
     def register_notifier(self, type_name: str, cls: type[Notifier]) -> None:
@@ -65,9 +70,10 @@ class PluginRegistry:
 
     def get_notifier(self, type_name: str) -> type[Notifier]:
         """Get a notifier class by type name."""
-        if type_name not in self._notifiers:
-            raise ValueError(f"Unknown notifier type: {type_name}")
-        return self._notifiers[type_name]
+        try:
+            return self._notifiers[type_name]
+        except KeyError:
+            raise ValueError(f"Unknown notifier type: {type_name}") from None
 
     def list_plugins(self) -> dict[str, list[str]]:
         """List all registered plugins by category."""
@@ -82,6 +88,14 @@ class PluginRegistry:
 # Global registry instance
 _registry = PluginRegistry()
 
+# Subpackages whose modules register the built-in plugins on import
+BUILTIN_PLUGIN_PACKAGES = (
+    "lighthouse.observers",
+    "lighthouse.triggers",
+    "lighthouse.evaluators",
+    "lighthouse.notifiers",
+)
+
 
 # Factory functions
 def create_observer(type_name: str, config: dict[str, Any]) -> Observer:
@@ -141,6 +155,14 @@ def register_notifier(type_name: str) -> Callable[[type[Notifier]], type[Notifie
     return decorator
 
 
+@functools.cache
+def bootstrap_plugins() -> None:
+    """Import the built-in plugin packages so they register themselves (once)."""
+    for package in BUILTIN_PLUGIN_PACKAGES:
+        importlib.import_module(package)
+
+
 def get_registry() -> PluginRegistry:
-    """Get the global plugin registry."""
+    """Get the global plugin registry, with the built-in plugins registered."""
+    bootstrap_plugins()
     return _registry
@@ -2,23 +2,111 @@
 State management for tracking sent notifications and rate limiting.
 """
 
+import atexit
 import json
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from lighthouse.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Optional fast JSON codec for the snapshot and write-ahead log
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+# Fold the write-ahead log into a fresh snapshot after this many appends
+SNAPSHOT_EVERY = 1000
+
+# Write-ahead log entries are fsynced in groups: once this many are pending,
+# or FLUSH_DELAY seconds after the first of them
+FLUSH_EVERY = 64
+FLUSH_DELAY = 0.05
+
+# Synchronous data writes for snapshots, where the platform has them (not Windows)
+_O_DSYNC = getattr(os, 'O_DSYNC', 0)
+
+# Length of the max_per_hour window, in seconds
+HOUR = 3600.0
+
+AlertKey = tuple[str, str]
+
+# Managers that may still hold unflushed log entries, flushed at interpreter exit
+_open_managers: "weakref.WeakSet[StateManager]" = weakref.WeakSet()
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """Encode JSON as UTF-8 bytes, compact unless indent is set."""
+    if orjson is not None:
+        return bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+    if indent:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode JSON from UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _key(watcher_name: str, pattern: str) -> AlertKey:
+    """In-memory key for a watcher/pattern pair."""
+    return (sys.intern(watcher_name), sys.intern(pattern))
+
+
+def _parse_key(key: str) -> AlertKey:
+    """Split a "watcher:pattern" key written by older versions (patterns may contain ':')."""
+    watcher_name, _, pattern = key.partition(':')
+    return _key(watcher_name, pattern)
+
+
+def _entry_key(joined: str, entry: dict[str, Any]) -> AlertKey:
+    """
+    Key of a snapshot or log entry stored under the joined key.
+
+    The watcher and pattern fields are authoritative; entries written by
+    older versions only have the joined key, which is split at the first ':'.
+    """
+    if 'watcher' in entry and 'pattern' in entry:
+        return _key(entry['watcher'], entry['pattern'])
+    return _parse_key(joined)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Make a rename inside a directory durable (not possible on Windows)."""
+    if os.name == 'nt':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@dataclass(slots=True)
 class AlertState:
-    """State tracking for a single alert."""
-    last_sent: datetime
-    count_this_hour: int = 0
-    hour_start: datetime = field(default_factory=datetime.now)
+    """State tracking for a single alert (times are epoch seconds)."""
+    last_sent: float
+    # When each alert of the last hour was sent, oldest first
+    timestamps: deque[float] = field(default_factory=deque)
+
+    def expire(self, now: float) -> None:
+        """Drop timestamps that have left the one-hour window."""
+        while self.timestamps and now - self.timestamps[0] >= HOUR:
+            self.timestamps.popleft()
 
 
 class StateManager:
@@ -29,29 +117,65 @@ class StateManager:
     {
         "alerts": {
             "watcher_name:pattern": {
+                "watcher": "watcher_name",
+                "pattern": "pattern",
                 "last_sent": "2024-01-01T12:00:00",
-                "count_this_hour": 3,
-                "hour_start": "2024-01-01T12:00:00"
+                "timestamps": [1704106800.0, 1704107400.0, 1704110400.0]
             }
         }
     }
+
+    Between snapshots, each record_alert() appends its watcher, pattern and
+    send time as one JSON line to a write-ahead log next to the state file
+    (state.wal), so recording an alert costs a small fixed-size append
+    rather than rewriting every entry. On load the snapshot is read and the
+    logged send times are replayed on top of it. A snapshot is written
+    every SNAPSHOT_EVERY appends and on close(). Log appends are buffered
+    and written with one fsync per group (see FLUSH_EVERY/FLUSH_DELAY);
+    flush() forces pending ones out, and managers that were never closed
+    are flushed at interpreter exit.
+
+    max_per_hour is enforced over a sliding one-hour window: timestamps
+    holds the epoch time of each alert sent within the last hour. Entries
+    written by older versions (count_this_hour/hour_start) are still read.
+
+    In memory, alerts are keyed by (watcher_name, pattern) tuples; the
+    "watcher_name:pattern" form above is only used on disk. Each entry also
+    carries the watcher and pattern separately, since a watcher name may
+    contain ':' too. Entries written without them are split at the first ':'.
     """
 
-    def __init__(self, state_file: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        state_file: str | Path | None = None,
+        clock: Callable[[], float] = time.time
+    ) -> None:
         """
         Initialize state manager.
 
         Args:
             state_file: Path to state file. If None, uses ~/.lighthouse/state.json
+            clock: Returns the current epoch time in seconds (injectable for tests)
         """
         if state_file is None:
             state_file = Path.home() / '.lighthouse' / 'state.json'
 
         self.state_file = Path(state_file)
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-
-        self.alerts: dict[str, AlertState] = {}
+        self.wal_file = self.state_file.with_suffix(".wal")
+        self._clock = clock
+
+        self.alerts: dict[AlertKey, AlertState] = {}
+        self._wal: BinaryIO | None = None
+        self._appends = 0
+        self._pending = 0
+        self._flush_timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        _open_managers.add(self)
         self._load()
+        if self._replay_wal():
+            # Start from a compact snapshot rather than an ever-growing log
+            self._save()
 
     def _load(self) -> None:
         """Load state from disk."""
@@ -59,37 +183,153 @@ class StateManager:
             return
 
         try:
-            with self.state_file.open('r', encoding='utf-8') as f:
-                data: dict[str, Any] = json.load(f)
+            data: dict[str, Any] = _loads(self.state_file.read_bytes())
 
             alerts_data = data.get('alerts', {})
             for key, alert_data in alerts_data.items():
-                hour_start_str = alert_data.get('hour_start', alert_data['last_sent'])
-                self.alerts[key] = AlertState(
-                    last_sent=datetime.fromisoformat(alert_data['last_sent']),
-                    count_this_hour=alert_data.get('count_this_hour', 0),
-                    hour_start=datetime.fromisoformat(hour_start_str)
-                )
+                self.alerts[_entry_key(key, alert_data)] = self._decode(alert_data)
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             # If state file is corrupted, start fresh
             logger.warning("Could not load state file: %s", e)
             self.alerts = {}
 
+    def _replay_wal(self) -> int:
+        """
+        Apply write-ahead log entries on top of the loaded snapshot.
+
+        Returns:
+            Number of entries applied
+        """
+        if not self.wal_file.exists():
+            return 0
+
+        applied = 0
+        with self.wal_file.open('rb') as f:
+            for line in f:
+                try:
+                    entry = _loads(line)
+                    if 'sent' in entry:
+                        self._apply_sent(
+                            _key(entry['watcher'], entry['pattern']), float(entry['sent'])
+                        )
+                    else:
+                        # Full entry, as logged by older versions
+                        key = _entry_key(entry.get('key', ''), entry)
+                        self.alerts[key] = self._decode(entry)
+                except (json.JSONDecodeError, KeyError, ValueError) as e:
+                    # A crash mid-append leaves at most one torn line at the end
+                    logger.warning("Skipping unreadable state log entry: %s", e)
+                    continue
+                applied += 1
+        return applied
+
+    @staticmethod
+    def _encode(state: AlertState) -> dict[str, Any]:
+        """Serialize one alert's state."""
+        return {
+            'last_sent': datetime.fromtimestamp(state.last_sent).isoformat(),
+            'timestamps': list(state.timestamps)
+        }
+
+    @classmethod
+    def _record(cls, key: AlertKey, state: AlertState) -> dict[str, Any]:
+        """Serialize one alert's state along with its watcher and pattern."""
+        return {'watcher': key[0], 'pattern': key[1], **cls._encode(state)}
+
+    @staticmethod
+    def _decode(data: dict[str, Any]) -> AlertState:
+        """Deserialize one alert's state."""
+        last_sent = datetime.fromisoformat(data['last_sent']).timestamp()
+        if 'timestamps' in data:
+            timestamps = deque(float(t) for t in data['timestamps'])
+        else:
+            # Fixed-window format: count the window's alerts as sent when it opened
+            hour_start = datetime.fromisoformat(data.get('hour_start', data['last_sent']))
+            timestamps = deque([hour_start.timestamp()] * data.get('count_this_hour', 0))
+        return AlertState(last_sent=last_sent, timestamps=timestamps)
+
+    def _apply_sent(self, key: AlertKey, sent: float) -> None:
+        """Add one send time to an alert's state."""
+        state = self.alerts.get(key)
+        if state is None:
+            state = self.alerts[key] = AlertState(last_sent=sent)
+        else:
+            state.last_sent = sent
+            state.expire(sent)
+        state.timestamps.append(sent)
+
+    def _append(self, key: AlertKey, sent: float) -> None:
+        """Append one send time to the write-ahead log."""
+        if self._wal is None:
+            self._wal = self.wal_file.open('ab')
+        record = {'watcher': key[0], 'pattern': key[1], 'sent': sent}
+        self._wal.write(_dumps(record) + b'\n')
+        self._appends += 1
+        self._pending += 1
+        if self._appends >= SNAPSHOT_EVERY:
+            self._save()
+        elif self._pending >= FLUSH_EVERY:
+            self._sync()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _sync(self) -> None:
+        """Write out and fsync pending log entries."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._wal is not None and self._pending:
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+        self._pending = 0
+
+    def flush(self) -> None:
+        """Make every recorded alert durable in the write-ahead log."""
+        with self._lock:
+            self._sync()
+
     def _save(self) -> None:
-        """Save state to disk."""
+        """Write a full snapshot atomically and empty the write-ahead log."""
         data = {
             'alerts': {
-                key: {
-                    'last_sent': state.last_sent.isoformat(),
-                    'count_this_hour': state.count_this_hour,
-                    'hour_start': state.hour_start.isoformat()
-                }
-                for key, state in self.alerts.items()
+                ':'.join(key): self._record(key, state) for key, state in self.alerts.items()
             }
         }
 
-        with self.state_file.open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        tmp_file = self.state_file.with_suffix('.tmp')
+        # O_DSYNC and the directory fsync: the snapshot must be on disk before
+        # the log is emptied below
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_DSYNC, 0o666)
+        try:
+            payload = memoryview(_dumps(data, indent=True))
+            while payload:
+                payload = payload[os.write(fd, payload):]
+        finally:
+            os.close(fd)
+        tmp_file.replace(self.state_file)
+        _fsync_dir(self.state_file.parent)
+
+        # Every logged entry is now in the snapshot
+        if self._wal is not None:
+            self._wal.truncate(0)
+        elif self.wal_file.exists():
+            self.wal_file.unlink()
+        self._appends = 0
+        self._pending = 0
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def close(self) -> None:
+        """Write a final snapshot and close the write-ahead log."""
+        with self._lock:
+            self._save()
+            if self._wal is not None:
+                self._wal.close()
+                self._wal = None
+        _open_managers.discard(self)
 
     def should_send_alert(
         self,
@@ -110,30 +350,27 @@ class StateManager:
         Returns:
             True if the alert should be sent
         """
-        key = f"{watcher_name}:{pattern}"
-        now = datetime.now()
-
-        if key not in self.alerts:
-            return True
+        key = _key(watcher_name, pattern)
 
-        state = self.alerts[key]
+        # expire() mutates the deque that record_alert() and snapshots also use
+        with self._lock:
+            state = self.alerts.get(key)
+            if state is None:
+                return True
 
-        # Check cooldown period
-        time_since_last = now - state.last_sent
-        if time_since_last.total_seconds() < cooldown_seconds:
-            return False
+            now = self._clock()
 
-        # Check hourly rate limit
-        if max_per_hour > 0:
-            # Reset hourly counter if an hour has passed
-            if now - state.hour_start >= timedelta(hours=1):
-                state.count_this_hour = 0
-                state.hour_start = now
-
-            if state.count_this_hour >= max_per_hour:
+            # Check cooldown period
+            if now - state.last_sent < cooldown_seconds:
                 return False
 
-        return True
+            # Check hourly rate limit over the last hour
+            if max_per_hour > 0:
+                state.expire(now)
+                if len(state.timestamps) >= max_per_hour:
+                    return False
+
+            return True
 
     def record_alert(self, watcher_name: str, pattern: str) -> None:
         """
@@ -143,24 +380,16 @@ class StateManager:
             watcher_name: Name of the watcher
             pattern: Matched pattern
         """
-        key = f"{watcher_name}:{pattern}"
-        now = datetime.now()
+        key = _key(watcher_name, pattern)
+        now = self._clock()
 
-        if key in self.alerts:
-            state = self.alerts[key]
+        with self._lock:
+            self._apply_sent(key, now)
+            self._append(key, now)
 
-            # Reset hourly counter if needed
-            if now - state.hour_start >= timedelta(hours=1):
-                state.count_this_hour = 0
-                state.hour_start = now
-
-            state.last_sent = now
-            state.count_this_hour += 1
-        else:
-            self.alerts[key] = AlertState(
-                last_sent=now,
-                count_this_hour=1,
-                hour_start=now
-            )
 
-        self._save()
+@atexit.register
+def _flush_open_managers() -> None:
+    """Flush log entries still pending in managers that were never closed."""
+    for manager in list(_open_managers):
+        manager.flush()
@@ -2,6 +2,7 @@
 File system event trigger using watchdog.
 """
 
+import threading
 from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -16,6 +17,55 @@ if TYPE_CHECKING:
     from watchdog.observers.api import BaseObserver
 
 
+class _Debouncer:
+    """
+    Collapses a burst of calls into a leading and a trailing call.
+
+    The first call runs immediately. Calls arriving within window seconds
+    after it are coalesced into a single call when the window closes, so the
+    last change of a burst is never lost. Calls to fn never overlap, even
+    when fn takes longer than the window.
+    """
+
+    def __init__(self, fn: Callable[[], None], window: float) -> None:
+        self.fn = fn
+        self.window = window
+        self._lock = threading.Lock()
+        # Leading calls run on the watchdog thread and trailing ones on the timer
+        self._run_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._pending = False
+
+    def __call__(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._pending = True
+                return
+            self._timer = threading.Timer(self.window, self._close_window)
+            self._timer.daemon = True
+            self._timer.start()
+        self._run()
+
+    def _close_window(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, False
+            self._timer = None
+        if pending:
+            self._run()
+
+    def _run(self) -> None:
+        with self._run_lock:
+            self.fn()
+
+    def cancel(self) -> None:
+        """Drop any trailing call that has not run yet."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending = False
+
+
 @register_trigger("file_event")
 class Trigger(BaseTrigger):
     """
@@ -25,12 +75,16 @@ class Trigger(BaseTrigger):
         path: File or directory to watch
         events: List of events to trigger on ("modified", "created", "deleted", "moved")
         recursive: Whether to watch subdirectories (default: False)
+        debounce_seconds: Collapse events arriving within this window into one
+            immediate and one trailing callback (default: 0, disabled). A
+            single write can raise several modify events.
     """
 
     def __init__(self, config: dict[str, Any], callback: Callable[[], None]) -> None:
         super().__init__(config, callback)
         self.observer: BaseObserver | None = None
         self.event_handler: FileSystemEventHandler | None = None
+        self._debouncer: _Debouncer | None = None
 
     def start(self) -> None:
         """Start watching for file events."""
@@ -55,10 +109,16 @@ class Trigger(BaseTrigger):
         if self.observer:
             self.observer.stop()
             self.observer.join()
+        if self._debouncer:
+            self._debouncer.cancel()
 
     def _create_event_handler(self, events: list[str]) -> FileSystemEventHandler:
         """Create a watchdog event handler that calls our callback."""
         callback = self.callback
+        debounce = self.config.get("debounce_seconds", 0)
+        if debounce > 0:
+            self._debouncer = _Debouncer(callback, debounce)
+            callback = self._debouncer
         watch_path = Path(self.config["path"])
 
         class Handler(FileSystemEventHandler):
@@ -4,6 +4,7 @@ Run all CI checks locally before pushing.
 Mirrors the CI workflow in .gitea/workflows/ci.yml
 """
 
+import os
 import subprocess
 import sys
 import time
@@ -17,6 +18,9 @@ YELLOW = '\033[1;33m'
 BLUE = '\033[0;34m'
 NC = '\033[0m'  # No Color
 
+# Commands run relative to the project root (passed as cwd, never chdir'd into)
+PROJECT_ROOT = Path(__file__).parent.parent
+
 # Track results
 passed_checks = []
 failed_checks = []
@@ -34,7 +38,7 @@ def print_step(text: str) -> None:
     print(f"\n{YELLOW}▶ {text}{NC}")
 
 
-def run_command(cmd: list[str], check_name: str, log_file: Path) -> bool:
+def run_command(cmd: list[str], check_name: str, log_file: Path, cwd: Path = PROJECT_ROOT) -> bool:
     """
     Run a command and capture output to log file.
 
@@ -47,7 +51,8 @@ def run_command(cmd: list[str], check_name: str, log_file: Path) -> bool:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
-                check=False
+                check=False,
+                cwd=cwd
             )
             f.write(result.stdout)
 
@@ -70,18 +75,12 @@ def run_command(cmd: list[str], check_name: str, log_file: Path) -> bool:
 
 def main() -> int:
     """Run all CI checks."""
-    # Get project root
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
+    project_root = PROJECT_ROOT
 
     # Create logs directory
     logs_dir = project_root / ".ci-logs"
     logs_dir.mkdir(exist_ok=True)
 
-    # Change to project root
-    import os
-    os.chdir(project_root)
-
     start_time = time.time()
 
     print_header("Lighthouse Local CI Checks")
@@ -112,7 +111,8 @@ def main() -> int:
         [sys.executable, "-m", "pip", "install", "build"],
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
-        check=False
+        check=False,
+        cwd=project_root
     )
     run_command(
         [sys.executable, "-m", "build", "--wheel"],
@@ -157,7 +157,8 @@ def main() -> int:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
-                check=False
+                check=False,
+                cwd=project_root
             )
             f.write(result.stdout)
             print(result.stdout, end='')
@@ -223,8 +224,10 @@ def main() -> int:
     if failed_checks:
         print(f"\n{RED}❌ Some checks failed. Please fix the issues before pushing.{NC}")
         print(f"\nCheck the log files in {logs_dir}/ for details:")
-        for log_file in sorted(logs_dir.glob("*.log")):
-            print(f"  - {log_file}")
+        log_names = [e.name for e in os.scandir(logs_dir) if e.name.endswith(".log")]
+        log_names.sort()
+        for name in log_names:
+            print(f"  - {logs_dir / name}")
         return 1
     else:
         print(f"\n{GREEN}✅ All checks passed! Safe to push.{NC}")
@@ -2,10 +2,17 @@
 Pytest configuration and fixtures for Lighthouse tests.
 """
 
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
+# RAM-backed scratch space for tests that write a lot of small files, where available
+SHM_DIR = Path("/dev/shm")
+
 
 @pytest.fixture
 def tmp_path(tmp_path: Path) -> Path:
@@ -15,3 +22,30 @@ def tmp_path(tmp_path: Path) -> Path:
     This is a built-in pytest fixture that we're re-exposing.
     """
     return tmp_path
+
+
+@pytest.fixture(scope="session")
+def scratch_root(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """
+    Session-wide scratch directory, on tmpfs when the platform has one.
+
+    State, history and log files written here never reach a disk. Falls back
+    to pytest's temporary directory elsewhere.
+    """
+    if SHM_DIR.is_dir() and os.access(SHM_DIR, os.W_OK):
+        root = Path(tempfile.mkdtemp(prefix="lighthouse-tests-", dir=SHM_DIR))
+        yield root
+        shutil.rmtree(root, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("scratch")
+
+
+@pytest.fixture
+def state_dir(scratch_root: Path) -> Path:
+    """
+    Fresh directory for one test's state files, under scratch_root.
+
+    Costs a single mkdir, unlike tmp_path's per-test numbered directory
+    bookkeeping.
+    """
+    return Path(tempfile.mkdtemp(prefix="state-", dir=scratch_root))
@@ -2,12 +2,58 @@
 Tests for configuration loading and validation.
 """
 
+import json
+import textwrap
 from pathlib import Path
 
 import pytest
+import yaml
 
 from lighthouse.config import load_config
 
+# Minimal valid document shared by the variant tests. The watchers list comes
+# last so variants can append further list items or top-level keys to it.
+BASE_CONFIG_YAML = textwrap.dedent("""\
+    notifiers:
+      - type: "console"
+        config: {}
+
+    watchers:
+      - name: "Watcher 1"
+        observer:
+          type: "log_pattern"
+          config:
+            log_file: "/tmp/test1.log"
+            patterns: ["ERROR"]
+        trigger:
+          type: "file_event"
+          config:
+            path: "/tmp/test1.log"
+        evaluator:
+          type: "pattern_match"
+          config: {}
+    """)
+
+SECOND_WATCHER_YAML = textwrap.indent(textwrap.dedent("""\
+    - name: "Watcher 2"
+      observer:
+        type: "metric"
+        config:
+          extractor:
+            type: "line_count"
+            source: "/tmp/test2.log"
+            pattern: "FAILED"
+      trigger:
+        type: "temporal"
+        config:
+          interval_seconds: 3600
+      evaluator:
+        type: "threshold"
+        config:
+          operator: "gt"
+          value: 10
+    """), "  ")
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
@@ -103,80 +149,45 @@ notifiers: []
         with pytest.raises(ValueError, match="validation error"):
             load_config(config_file)
 
-    def test_load_multiple_watchers(self, tmp_path: Path) -> None:
-        """Test loading config with multiple watchers."""
+    @pytest.mark.parametrize(
+        "extra_yaml,expected_state_dir,expected_count",
+        [
+            ("", "/var/lib/lighthouse", 1),
+            (SECOND_WATCHER_YAML, "/var/lib/lighthouse", 2),
+            ('state_dir: "/custom/state/path"\n', "/custom/state/path", 1),
+        ],
+        ids=["base", "multiple_watchers", "custom_state_dir"],
+    )
+    def test_load_config_variants(
+        self, tmp_path: Path, extra_yaml: str, expected_state_dir: str, expected_count: int
+    ) -> None:
+        """Test loading variants of the shared base config."""
         config_file = tmp_path / "config.yaml"
-        config_file.write_text("""
-watchers:
-  - name: "Watcher 1"
-    observer:
-      type: "log_pattern"
-      config:
-        log_file: "/tmp/test1.log"
-        patterns: ["ERROR"]
-    trigger:
-      type: "file_event"
-      config:
-        path: "/tmp/test1.log"
-    evaluator:
-      type: "pattern_match"
-      config: {}
-
-  - name: "Watcher 2"
-    observer:
-      type: "metric"
-      config:
-        extractor:
-          type: "line_count"
-          source: "/tmp/test2.log"
-          pattern: "FAILED"
-    trigger:
-      type: "temporal"
-      config:
-        interval_seconds: 3600
-    evaluator:
-      type: "threshold"
-      config:
-        operator: "gt"
-        value: 10
-
-notifiers:
-  - type: "console"
-    config: {}
-""")
+        config_file.write_text(BASE_CONFIG_YAML + extra_yaml)
 
         config = load_config(config_file)
 
-        assert len(config.watchers) == 2
-        assert config.watchers[0].name == "Watcher 1"
-        assert config.watchers[1].name == "Watcher 2"
+        assert len(config.watchers) == expected_count
+        assert [w.name for w in config.watchers] == [
+            f"Watcher {i}" for i in range(1, expected_count + 1)
+        ]
+        assert config.notifiers[0].type == "console"
+        assert config.state_dir == expected_state_dir
 
-    def test_load_with_custom_state_dir(self, tmp_path: Path) -> None:
-        """Test loading config with custom state directory."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("""
-watchers:
-  - name: "Test"
-    observer:
-      type: "log_pattern"
-      config:
-        log_file: "/tmp/test.log"
-        patterns: ["ERROR"]
-    trigger:
-      type: "file_event"
-      config:
-        path: "/tmp/test.log"
-    evaluator:
-      type: "pattern_match"
-      config: {}
+    def test_load_json_config(self, tmp_path: Path) -> None:
+        """Test that a .json file is loaded with the JSON parser."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps(yaml.safe_load(BASE_CONFIG_YAML)))
 
-notifiers:
-  - type: "console"
-    config: {}
+        config = load_config(config_file)
 
-state_dir: "/custom/state/path"
-""")
+        assert config.watchers[0].name == "Watcher 1"
+        assert config.notifiers[0].type == "console"
 
-        config = load_config(config_file)
+    def test_load_invalid_json(self, tmp_path: Path) -> None:
+        """Test that invalid JSON raises a decode error."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text("{not json")
 
-        assert config.state_dir == "/custom/state/path"
+        with pytest.raises(json.JSONDecodeError):
+            load_config(config_file)
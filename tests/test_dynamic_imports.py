@@ -5,62 +5,65 @@ Tests for dynamic import validation in triggers, notifiers, observers, and evalu
 import importlib
 import importlib.util
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
+from lighthouse.core import AlertDecision, ObservationResult
+from lighthouse.core import Notifier as BaseNotifier
+from lighthouse.core import Observer as BaseObserver
+from lighthouse.core import Trigger as BaseTrigger
+from lighthouse.registry import register_notifier, register_observer, register_trigger
+
+
+def _exec_module(name: str, source: str, **bindings: Any) -> ModuleType:
+    """
+    Build a plugin module in memory with pre-bound globals.
+
+    The lighthouse imports are already resolved by this test module, so they are
+    injected into the module namespace instead of being re-imported from source.
+    """
+    module = ModuleType(name)
+    module.__dict__.update(bindings)
+    exec(compile(source, f"<{name}>", "exec"), module.__dict__)  # noqa: S102
+    return module
+
 
 class TestTriggerImportValidation:
     """Test validation of trigger imports."""
 
-    def test_rejects_non_class_export(self, tmp_path: Path, monkeypatch: Any) -> None:
+    def test_rejects_non_class_export(self) -> None:
         """Test that non-class exports are rejected."""
-        # Create a temporary trigger module with a non-class export
-        trigger_file = tmp_path / "bad_trigger.py"
-        trigger_file.write_text("""
-from lighthouse.core import Trigger as BaseTrigger
-from lighthouse.registry import register_trigger
-
+        # Build a trigger module with a non-class export
+        module = _exec_module("bad_trigger", """
 # This is a function, not a class - should be rejected
 def NotAClass():
     pass
 
 __all__ = ["NotAClass"]
-""")
-
-        # Temporarily add tmp_path to sys.path
-        monkeypatch.syspath_prepend(str(tmp_path))
+""", BaseTrigger=BaseTrigger, register_trigger=register_trigger)
 
-        # Import and check it doesn't export the invalid item
-        module = importlib.import_module("bad_trigger")
+        # Check it doesn't export the invalid item
         assert hasattr(module, "__all__")
         assert "NotAClass" in module.__all__
 
         # The validation should skip it (tested via warning logs)
 
-    def test_rejects_non_trigger_subclass(self, tmp_path: Path, monkeypatch: Any) -> None:
+    def test_rejects_non_trigger_subclass(self) -> None:
         """Test that non-Trigger subclasses are rejected."""
-        trigger_file = tmp_path / "wrong_base.py"
-        trigger_file.write_text("""
-from lighthouse.core import Observer  # Wrong base class
-from lighthouse.registry import register_trigger
-
+        module = _exec_module("wrong_base", """
 @register_trigger("wrong")
-class WrongBase(Observer):
+class WrongBase(Observer):  # Wrong base class
     def observe(self):
         pass
 
 __all__ = ["WrongBase"]
-""")
+""", Observer=BaseObserver, register_trigger=register_trigger)
 
-        monkeypatch.syspath_prepend(str(tmp_path))
-        module = importlib.import_module("wrong_base")
         assert hasattr(module, "__all__")
 
-    def test_accepts_valid_trigger(self, tmp_path: Path, monkeypatch: Any) -> None:
+    def test_accepts_valid_trigger(self) -> None:
         """Test that valid triggers are accepted."""
-        trigger_file = tmp_path / "valid_trigger.py"
-        trigger_file.write_text("""
-from lighthouse.core import Trigger as BaseTrigger
-from lighthouse.registry import register_trigger
+        module = _exec_module("valid_trigger", """
 from typing import Any
 from collections.abc import Callable
 
@@ -77,10 +80,8 @@ class ValidTrigger(BaseTrigger):
 
 Trigger = ValidTrigger
 __all__ = ["Trigger", "ValidTrigger"]
-""")
+""", BaseTrigger=BaseTrigger, register_trigger=register_trigger)
 
-        monkeypatch.syspath_prepend(str(tmp_path))
-        module = importlib.import_module("valid_trigger")
         assert hasattr(module, "ValidTrigger")
         assert hasattr(module, "Trigger")
 
@@ -88,27 +89,20 @@ __all__ = ["Trigger", "ValidTrigger"]
 class TestNotifierImportValidation:
     """Test validation of notifier imports."""
 
-    def test_rejects_non_class_export(self, tmp_path: Path, monkeypatch: Any) -> None:
+    def test_rejects_non_class_export(self) -> None:
         """Test that non-class exports are rejected."""
-        notifier_file = tmp_path / "bad_notifier.py"
-        notifier_file.write_text("""
-from lighthouse.core import Notifier as BaseNotifier
-from lighthouse.registry import register_notifier
-
+        module = _exec_module("bad_notifier", """
 # This is a constant, not a class - should be rejected
 SOME_CONSTANT = 42
 
 __all__ = ["SOME_CONSTANT"]
-""")
+""", BaseNotifier=BaseNotifier, register_notifier=register_notifier)
 
-        monkeypatch.syspath_prepend(str(tmp_path))
-        module = importlib.import_module("bad_notifier")
         assert hasattr(module, "__all__")
 
-    def test_rejects_non_notifier_subclass(self, tmp_path: Path, monkeypatch: Any) -> None:
+    def test_rejects_non_notifier_subclass(self) -> None:
         """Test that non-Notifier subclasses are rejected."""
-        notifier_file = tmp_path / "wrong_notifier.py"
-        notifier_file.write_text("""
+        module = _exec_module("wrong_notifier", """
 class NotANotifier:
     '''Not a notifier at all'''
     pass
@@ -116,17 +110,11 @@ class NotANotifier:
 __all__ = ["NotANotifier"]
 """)
 
-        monkeypatch.syspath_prepend(str(tmp_path))
-        module = importlib.import_module("wrong_notifier")
         assert hasattr(module, "__all__")
 
-    def test_accepts_valid_notifier(self, tmp_path: Path, monkeypatch: Any) -> None:
+    def test_accepts_valid_notifier(self) -> None:
         """Test that valid notifiers are accepted."""
-        notifier_file = tmp_path / "valid_notifier.py"
-        notifier_file.write_text("""
-from lighthouse.core import AlertDecision, Notifier as BaseNotifier
-from lighthouse.registry import register_notifier
-
+        module = _exec_module("valid_notifier", """
 @register_notifier("valid")
 class ValidNotifier(BaseNotifier):
     def notify(self, alert: AlertDecision, watcher_name: str) -> bool:
@@ -134,10 +122,8 @@ class ValidNotifier(BaseNotifier):
 
 Notifier = ValidNotifier
 __all__ = ["Notifier", "ValidNotifier"]
-""")
+""", AlertDecision=AlertDecision, BaseNotifier=BaseNotifier, register_notifier=register_notifier)
 
-        monkeypatch.syspath_prepend(str(tmp_path))
-        module = importlib.import_module("valid_notifier")
         assert hasattr(module, "ValidNotifier")
         assert hasattr(module, "Notifier")
 
@@ -145,27 +131,20 @@ __all__ = ["Notifier", "ValidNotifier"]
 class TestObserverImportValidation:
     """Test validation of observer imports."""
 
-    def test_rejects_non_class_export(self, tmp_path: Path, monkeypatch: Any) -> None:
+    def test_rejects_non_class_export(self) -> None:
         """Test that non-class exports are rejected."""
-        observer_file = tmp_path / "bad_observer.py"
-        observer_file.write_text("""
-from lighthouse.core import Observer as BaseObserver
-from lighthouse.registry import register_observer
-
+        module = _exec_module("bad_observer", """
 # This is a variable, not a class - should be rejected
 SOME_VALUE = 123
 
 __all__ = ["SOME_VALUE"]
-""")
+""", BaseObserver=BaseObserver, register_observer=register_observer)
 
-        monkeypatch.syspath_prepend(str(tmp_path))
-        module = importlib.import_module("bad_observer")
         assert hasattr(module, "__all__")
 
-    def test_rejects_non_observer_subclass(self, tmp_path: Path, monkeypatch: Any) -> None:
+    def test_rejects_non_observer_subclass(self) -> None:
         """Test that non-Observer subclasses are rejected."""
-        observer_file = tmp_path / "wrong_observer.py"
-        observer_file.write_text("""
+        module = _exec_module("wrong_observer", """
 class NotAnObserver:
     '''Not an observer at all'''
     pass
@@ -173,16 +152,11 @@ class NotAnObserver:
 __all__ = ["NotAnObserver"]
 """)
 
-        monkeypatch.syspath_prepend(str(tmp_path))
-        module = importlib.import_module("wrong_observer")
         assert hasattr(module, "__all__")
 
-    def test_accepts_valid_observer(self, tmp_path: Path, monkeypatch: Any) -> None:
+    def test_accepts_valid_observer(self) -> None:
         """Test that valid observers are accepted."""
-        observer_file = tmp_path / "valid_observer.py"
-        observer_file.write_text("""
-from lighthouse.core import Observer as BaseObserver, ObservationResult
-from lighthouse.registry import register_observer
+        module = _exec_module("valid_observer", """
 from datetime import datetime
 
 @register_observer("valid")
@@ -192,10 +166,9 @@ class ValidObserver(BaseObserver):
 
 Observer = ValidObserver
 __all__ = ["Observer", "ValidObserver"]
-""")
+""", BaseObserver=BaseObserver, ObservationResult=ObservationResult,
+            register_observer=register_observer)
 
-        monkeypatch.syspath_prepend(str(tmp_path))
-        module = importlib.import_module("valid_observer")
         assert hasattr(module, "ValidObserver")
         assert hasattr(module, "Observer")
 
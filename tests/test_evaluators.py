@@ -1,10 +1,15 @@
 """
 Tests for evaluator implementations.
+
+PYTEST_DONT_REWRITE: these asserts only compare simple decision fields, so the
+module skips pytest's assertion-rewriting pass at collection.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
+
+import pytest
 
-from lighthouse.core import ObservationResult
+from lighthouse.core import Evaluator, ObservationResult
 from lighthouse.evaluators import (
     PatternMatchEvaluator,
     SequentialGrowthEvaluator,
@@ -12,6 +17,9 @@ from lighthouse.evaluators import (
     ThresholdEvaluator,
 )
 
+# Evaluators never read the clock, so a fixed timestamp avoids a syscall per observation
+TS = datetime(2024, 1, 1, tzinfo=UTC)
+
 
 class TestPatternMatchEvaluator:
     """Tests for PatternMatchEvaluator."""
@@ -22,7 +30,7 @@ class TestPatternMatchEvaluator:
 
         observation = ObservationResult(
             value=True,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={"matched_patterns": ["ERROR", "FATAL"]}
         )
 
@@ -38,7 +46,7 @@ class TestPatternMatchEvaluator:
 
         observation = ObservationResult(
             value=False,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={"matched_patterns": []}
         )
 
@@ -50,78 +58,29 @@ class TestPatternMatchEvaluator:
 class TestThresholdEvaluator:
     """Tests for ThresholdEvaluator."""
 
-    def test_evaluate_greater_than(self) -> None:
-        """Test evaluation with greater than operator."""
-        evaluator = ThresholdEvaluator({
-            "operator": "gt",
-            "value": 10,
-            "severity": "medium"
-        })
-
-        observation = ObservationResult(
-            value=15,
-            timestamp=datetime.now(),
-            metadata={}
-        )
-
-        decision = evaluator.evaluate(observation, [])
-
-        assert decision.should_alert is True
-        assert "15 gt 10" in decision.message
-
-    def test_evaluate_not_exceeded(self) -> None:
-        """Test evaluation when threshold not exceeded."""
-        evaluator = ThresholdEvaluator({
-            "operator": "gt",
-            "value": 10,
-            "severity": "medium"
-        })
-
-        observation = ObservationResult(
-            value=5,
-            timestamp=datetime.now(),
-            metadata={}
-        )
+    @pytest.mark.parametrize(
+        "op,threshold,value,expected",
+        [
+            ("gt", 10, 15, True),
+            ("gt", 10, 5, False),
+            ("gte", 10, 10, True),
+            ("lt", 10, 5, True),
+            ("lte", 10, 11, False),
+            ("eq", 42, 42, True),
+            ("ne", 42, 42, False),
+        ],
+    )
+    def test_threshold_ops(self, op: str, threshold: int, value: int, expected: bool) -> None:
+        """Test each comparison operator on both sides of the threshold."""
+        evaluator = ThresholdEvaluator({"operator": op, "value": threshold, "severity": "low"})
+
+        observation = ObservationResult(value=value, timestamp=TS, metadata={})
 
         decision = evaluator.evaluate(observation, [])
 
-        assert decision.should_alert is False
-
-    def test_evaluate_less_than(self) -> None:
-        """Test evaluation with less than operator."""
-        evaluator = ThresholdEvaluator({
-            "operator": "lt",
-            "value": 10,
-            "severity": "low"
-        })
-
-        observation = ObservationResult(
-            value=5,
-            timestamp=datetime.now(),
-            metadata={}
-        )
-
-        decision = evaluator.evaluate(observation, [])
-
-        assert decision.should_alert is True
-
-    def test_evaluate_equals(self) -> None:
-        """Test evaluation with equals operator."""
-        evaluator = ThresholdEvaluator({
-            "operator": "eq",
-            "value": 42,
-            "severity": "low"
-        })
-
-        observation = ObservationResult(
-            value=42,
-            timestamp=datetime.now(),
-            metadata={}
-        )
-
-        decision = evaluator.evaluate(observation, [])
-
-        assert decision.should_alert is True
+        assert decision.should_alert is expected
+        assert decision.severity == "low"
+        assert f"{value} {op} {threshold}" in decision.message
 
     def test_evaluate_null_value(self) -> None:
         """Test evaluation with null value."""
@@ -132,7 +91,7 @@ class TestThresholdEvaluator:
 
         observation = ObservationResult(
             value=None,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={}
         )
 
@@ -141,6 +100,16 @@ class TestThresholdEvaluator:
         assert decision.should_alert is False
 
 
+    def test_unknown_operator_raises(self) -> None:
+        """Test that an unknown operator is reported when evaluating."""
+        evaluator = ThresholdEvaluator({"operator": "between", "value": 10})
+
+        observation = ObservationResult(value=5, timestamp=TS, metadata={})
+
+        with pytest.raises(ValueError, match="Unknown operator: between"):
+            evaluator.evaluate(observation, [])
+
+
 class TestSequentialGrowthEvaluator:
     """Tests for SequentialGrowthEvaluator."""
 
@@ -150,7 +119,7 @@ class TestSequentialGrowthEvaluator:
 
         observation = ObservationResult(
             value=10,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={}
         )
 
@@ -165,7 +134,7 @@ class TestSequentialGrowthEvaluator:
 
         observation = ObservationResult(
             value=0,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={}
         )
 
@@ -180,13 +149,13 @@ class TestSequentialGrowthEvaluator:
 
         previous = ObservationResult(
             value=10,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={}
         )
 
         current = ObservationResult(
             value=15,
-            timestamp=datetime.now(),
+            timestamp=TS + timedelta(seconds=1),
             metadata={}
         )
 
@@ -203,13 +172,13 @@ class TestSequentialGrowthEvaluator:
 
         previous = ObservationResult(
             value=10,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={}
         )
 
         current = ObservationResult(
             value=10,
-            timestamp=datetime.now(),
+            timestamp=TS + timedelta(seconds=1),
             metadata={}
         )
 
@@ -225,13 +194,13 @@ class TestSequentialGrowthEvaluator:
 
         previous = ObservationResult(
             value=15,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={}
         )
 
         current = ObservationResult(
             value=10,
-            timestamp=datetime.now(),
+            timestamp=TS + timedelta(seconds=1),
             metadata={}
         )
 
@@ -253,7 +222,7 @@ class TestStateChangeEvaluator:
 
         observation = ObservationResult(
             value=True,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={}
         )
 
@@ -271,13 +240,13 @@ class TestStateChangeEvaluator:
 
         previous = ObservationResult(
             value=True,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={}
         )
 
         current = ObservationResult(
             value=True,
-            timestamp=datetime.now(),
+            timestamp=TS + timedelta(seconds=1),
             metadata={}
         )
 
@@ -294,13 +263,13 @@ class TestStateChangeEvaluator:
 
         previous = ObservationResult(
             value=True,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={}
         )
 
         current = ObservationResult(
             value=False,
-            timestamp=datetime.now(),
+            timestamp=TS + timedelta(seconds=1),
             metadata={}
         )
 
@@ -318,13 +287,13 @@ class TestStateChangeEvaluator:
 
         previous = ObservationResult(
             value=True,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={}
         )
 
         current = ObservationResult(
             value=False,
-            timestamp=datetime.now(),
+            timestamp=TS + timedelta(seconds=1),
             metadata={}
         )
 
@@ -342,13 +311,13 @@ class TestStateChangeEvaluator:
 
         previous = ObservationResult(
             value=False,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={}
         )
 
         current = ObservationResult(
             value=True,
-            timestamp=datetime.now(),
+            timestamp=TS + timedelta(seconds=1),
             metadata={}
         )
 
@@ -365,16 +334,101 @@ class TestStateChangeEvaluator:
 
         previous = ObservationResult(
             value=False,
-            timestamp=datetime.now(),
+            timestamp=TS,
             metadata={}
         )
 
         current = ObservationResult(
             value=True,
-            timestamp=datetime.now(),
+            timestamp=TS + timedelta(seconds=1),
             metadata={}
         )
 
         decision = evaluator.evaluate(current, [previous])
 
         assert decision.should_alert is True
+
+    @pytest.mark.parametrize(
+        "alert_on,previous,current,expected",
+        [
+            ("both", True, False, True),
+            ("both", False, True, True),
+            ("true_to_false", True, False, True),
+            ("true_to_false", False, True, False),
+            ("false_to_true", True, False, False),
+            ("false_to_true", False, True, True),
+            ("both", "active", "failed", True),
+            ("true_to_false", "active", "failed", False),
+            ("true_to_false", 1, 0, False),
+        ],
+    )
+    def test_transition_table(
+        self, alert_on: str, previous: object, current: object, expected: bool
+    ) -> None:
+        """Test every alert_on setting against boolean and non-boolean changes."""
+        evaluator = StateChangeEvaluator({"alert_on": alert_on})
+
+        decision = evaluator.evaluate(
+            ObservationResult(value=current, timestamp=TS + timedelta(seconds=1), metadata={}),
+            [ObservationResult(value=previous, timestamp=TS, metadata={})]
+        )
+
+        assert decision.should_alert is expected
+
+
+def _batch(values: list[object], metadata: dict[str, object] | None = None) -> list[ObservationResult]:
+    """Build a chunk of observations with the given values."""
+    return [
+        ObservationResult(value=v, timestamp=TS, metadata=dict(metadata or {}))
+        for v in values
+    ]
+
+
+class TestEvaluateBatch:
+    """Tests for the batch evaluation path."""
+
+    @pytest.mark.parametrize(
+        "evaluator,values",
+        [
+            (
+                PatternMatchEvaluator({"severity": "high"}),
+                [i % 3 == 0 for i in range(1024)],
+            ),
+            (
+                ThresholdEvaluator({"operator": "gt", "value": 50}),
+                [None if i % 97 == 0 else i % 100 for i in range(1024)],
+            ),
+            (
+                SequentialGrowthEvaluator({}),
+                [None if i % 89 == 0 else (i * 7) % 13 for i in range(1024)],
+            ),
+            (
+                StateChangeEvaluator({"alert_on": "true_to_false"}),
+                [None if i % 101 == 0 else (i // 3) % 2 == 0 for i in range(1024)],
+            ),
+        ],
+        ids=["pattern_match", "threshold", "sequential_growth", "state_change"],
+    )
+    def test_batch_matches_scalar(self, evaluator: Evaluator, values: list[object]) -> None:
+        """Test that evaluate_batch agrees with per-observation evaluate."""
+        history = _batch([1], {"matched_patterns": ["ERROR"]})
+        observations = _batch(values, {"matched_patterns": ["ERROR"]})
+
+        mask, decisions = evaluator.evaluate_batch(observations, history)
+
+        expected = []
+        window = list(history)
+        for observation in observations:
+            expected.append(evaluator.evaluate(observation, window))
+            window.append(observation)
+
+        assert decisions == expected
+        assert mask == [d.should_alert for d in expected]
+        assert any(mask)
+        assert not all(mask)
+
+    def test_batch_empty(self) -> None:
+        """Test that an empty chunk yields empty results."""
+        evaluator = ThresholdEvaluator({"operator": "gt", "value": 10})
+
+        assert evaluator.evaluate_batch([], []) == ([], [])
@@ -0,0 +1,73 @@
+"""
+Tests for observation history persistence.
+"""
+
+import json
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from lighthouse.core import ObservationResult
+from lighthouse.history import MAX_HISTORY, HistoryStore
+
+
+def _observation(value: int, seconds: int = 0) -> ObservationResult:
+    """Build an observation at a fixed time plus an offset."""
+    return ObservationResult(
+        value=value,
+        timestamp=datetime(2024, 1, 1, 12, 0) + timedelta(seconds=seconds),
+        metadata={"extractor_type": "line_count"}
+    )
+
+
+class TestHistoryStore:
+    """Tests for HistoryStore."""
+
+    def test_save_and_load_round_trip(self, tmp_path: Path) -> None:
+        """Test that saved history loads back identically."""
+        store = HistoryStore(tmp_path / "watcher.history.json")
+        history = [_observation(1), _observation(2, seconds=60)]
+
+        store.save(history)
+
+        assert HistoryStore(store.history_file).load() == history
+
+    def test_exists(self, tmp_path: Path) -> None:
+        """Test that exists reflects whether history was written."""
+        store = HistoryStore(tmp_path / "state" / "watcher.history.json")
+
+        assert store.exists() is False
+        store.save([])
+        assert store.exists() is True
+
+    def test_save_keeps_most_recent(self, tmp_path: Path) -> None:
+        """Test that only the last MAX_HISTORY observations are written."""
+        store = HistoryStore(tmp_path / "watcher.history.json")
+        history = [_observation(i, seconds=i) for i in range(MAX_HISTORY + 5)]
+
+        store.save(history)
+        loaded = store.load()
+
+        assert len(loaded) == MAX_HISTORY
+        assert loaded[0].value == 5
+        assert loaded[-1].value == MAX_HISTORY + 4
+
+    def test_load_indented_json(self, tmp_path: Path) -> None:
+        """Test that history written as indented JSON still loads."""
+        history_file = tmp_path / "watcher.history.json"
+        history_file.write_text(json.dumps([
+            {"value": 3, "timestamp": "2024-01-01T12:00:00", "metadata": {}}
+        ], indent=2))
+
+        loaded = HistoryStore(history_file).load()
+
+        assert loaded == [ObservationResult(3, datetime(2024, 1, 1, 12, 0), {})]
+
+    def test_save_accepts_deque(self, tmp_path: Path) -> None:
+        """Test that a bounded deque, as used by coordinators, can be saved."""
+        store = HistoryStore(tmp_path / "watcher.history.json")
+        history = deque((_observation(i, seconds=i) for i in range(3)), maxlen=MAX_HISTORY)
+
+        store.save(history)
+
+        assert store.load() == list(history)
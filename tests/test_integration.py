@@ -2,10 +2,111 @@
 Integration tests for the full Lighthouse daemon workflow.
 """
 
+import copy
+import json
+import tempfile
+import threading
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
+import pytest
+
+from lighthouse.config import Config
 from lighthouse.daemon import LighthouseDaemon
+from lighthouse.history import MAX_HISTORY
+
+
+class DaemonFactory:
+    """
+    Builds daemons from the base template for a single test.
+
+    Every daemon it built is stopped when the test ends, closing its
+    notifiers and state log.
+    """
+
+    def __init__(self, base_config: dict[str, Any], work_dir: Path) -> None:
+        self.base_config = base_config
+        self.work_dir = work_dir
+        self._daemons: list[LighthouseDaemon] = []
+
+    def __call__(self, *watchers: dict[str, Any], **overrides: Any) -> LighthouseDaemon:
+        """Return a new daemon watching the given watchers."""
+        raw = copy.deepcopy(self.base_config)
+        raw["watchers"] = list(watchers)
+        raw.update(overrides)
+        state_dir = self.work_dir / f"state-{len(self._daemons)}"
+        return self._track(LighthouseDaemon.from_config(Config.model_validate(raw), state_dir))
+
+    def restart(self, daemon: LighthouseDaemon) -> LighthouseDaemon:
+        """Build a second daemon from the same config and state dir, as after a restart."""
+        return self._track(LighthouseDaemon.from_config(daemon.config))
+
+    def _track(self, daemon: LighthouseDaemon) -> LighthouseDaemon:
+        self._daemons.append(daemon)
+        return daemon
+
+    def stop_all(self) -> None:
+        """Stop every daemon built so far."""
+        for daemon in self._daemons:
+            daemon.stop()
+
+
+@pytest.fixture(scope="session")
+def base_config() -> dict[str, Any]:
+    """Config template shared by the workflow tests (no watchers yet)."""
+    return {
+        "watchers": [],
+        "notifiers": [{"type": "console", "config": {}}],
+    }
+
+
+@pytest.fixture
+def daemon_factory(base_config: dict[str, Any], scratch_root: Path) -> Iterator[DaemonFactory]:
+    """
+    Daemon factory for one test; test files live in its work_dir.
+
+    The work dir is a fresh directory under scratch_root, on tmpfs when
+    available, so log, history and state writes never reach a disk. Tests
+    that take tmp_path still use the real filesystem.
+    """
+    work_dir = Path(tempfile.mkdtemp(prefix="daemons-", dir=scratch_root))
+    factory = DaemonFactory(base_config, work_dir)
+    yield factory
+    factory.stop_all()
+
+
+def log_pattern_watcher(name: str, log_file: Path, **evaluator_config: Any) -> dict[str, Any]:
+    """Watcher config matching ERROR lines in log_file."""
+    return {
+        "name": name,
+        "observer": {
+            "type": "log_pattern",
+            "config": {"log_file": str(log_file), "patterns": ["ERROR"]},
+        },
+        "trigger": {"type": "manual", "config": {}},
+        "evaluator": {"type": "pattern_match", "config": evaluator_config},
+    }
+
+
+def failed_count_watcher(name: str, error_file: Path, **evaluator_config: Any) -> dict[str, Any]:
+    """Watcher config counting [FAILED] lines with sequential growth evaluation."""
+    return {
+        "name": name,
+        "observer": {
+            "type": "metric",
+            "config": {
+                "extractor": {
+                    "type": "line_count",
+                    "source": str(error_file),
+                    "pattern": r"\[FAILED\]",
+                }
+            },
+        },
+        "trigger": {"type": "manual", "config": {}},
+        "evaluator": {"type": "sequential_growth", "config": evaluator_config},
+    }
 
 
 class TestEndToEndIntegration:
@@ -13,32 +114,23 @@ class TestEndToEndIntegration:
 
     def test_daemon_init_and_config_loading(self, tmp_path: Path) -> None:
         """Test daemon initialization with config."""
-        config_file = tmp_path / "config.yaml"
-        state_dir = str(tmp_path / "state")
-        config_file.write_text(f"""
-watchers:
-  - name: "Test Watcher"
-    observer:
-      type: "log_pattern"
-      config:
-        log_file: "/tmp/test.log"
-        patterns: ["ERROR"]
-    trigger:
-      type: "file_event"
-      config:
-        path: "/tmp/test.log"
-        events: ["modified"]
-    evaluator:
-      type: "pattern_match"
-      config:
-        severity: "medium"
-
-notifiers:
-  - type: "console"
-    config: {{}}
-
-state_dir: "{state_dir}"
-""")
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({
+            "watchers": [{
+                "name": "Test Watcher",
+                "observer": {
+                    "type": "log_pattern",
+                    "config": {"log_file": "/tmp/test.log", "patterns": ["ERROR"]},
+                },
+                "trigger": {
+                    "type": "file_event",
+                    "config": {"path": "/tmp/test.log", "events": ["modified"]},
+                },
+                "evaluator": {"type": "pattern_match", "config": {"severity": "medium"}},
+            }],
+            "notifiers": [{"type": "console", "config": {}}],
+            "state_dir": str(tmp_path / "state"),
+        }))
 
         daemon = LighthouseDaemon(str(config_file))
 
@@ -46,37 +138,39 @@ state_dir: "{state_dir}"
         assert len(daemon.notifiers) == 1
         assert daemon.state_dir == tmp_path / "state"
 
-    def test_log_pattern_to_notification_workflow(self, tmp_path: Path) -> None:
+    def test_daemon_from_config(self, daemon_factory: DaemonFactory) -> None:
+        """Test that from_config builds the same daemon without a config file."""
+        daemon = daemon_factory(
+            log_pattern_watcher("Test", daemon_factory.work_dir / "test.log")
+        )
+
+        assert len(daemon.config.watchers) == 1
+        assert len(daemon.notifiers) == 1
+        assert daemon.state_dir.parent == daemon_factory.work_dir
+
+    def test_coordinators_are_created_lazily_once(self, tmp_path: Path) -> None:
+        """Test that coordinators are built on first access and then cached."""
+        config = Config.model_validate({
+            "watchers": [log_pattern_watcher("Lazy", tmp_path / "lazy.log")],
+            "notifiers": [{"type": "console", "config": {}}],
+        })
+        daemon = LighthouseDaemon.from_config(config, tmp_path / "state")
+
+        assert daemon._coordinators is None
+
+        coordinators = daemon.coordinators
+
+        assert len(coordinators) == 1
+        assert daemon.coordinators is coordinators
+
+    def test_log_pattern_to_notification_workflow(self, daemon_factory: DaemonFactory) -> None:
         """Test full workflow: log pattern → observation → evaluation → notification."""
-        log_file = tmp_path / "test.log"
+        log_file = daemon_factory.work_dir / "test.log"
         log_file.write_text("INFO: Starting\n")
 
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("""
-watchers:
-  - name: "Error Detector"
-    observer:
-      type: "log_pattern"
-      config:
-        log_file: "{log_file}"
-        patterns: ["ERROR"]
-    trigger:
-      type: "manual"
-      config: {{}}
-    evaluator:
-      type: "pattern_match"
-      config:
-        severity: "high"
-
-notifiers:
-  - type: "console"
-    config: {{}}
-
-state_dir: "{state_dir}"
-""".format(log_file=str(log_file), state_dir=str(tmp_path / "state")))
-
-        daemon = LighthouseDaemon(str(config_file))
-        daemon.setup_watchers()
+        watcher = log_pattern_watcher("Error Detector", log_file, severity="high")
+        watcher["observer"]["config"]["patterns"] = ["ERROR", "FATAL"]
+        daemon = daemon_factory(watcher)
 
         # Manually trigger observation - no error yet
         coordinator = daemon.coordinators[0]
@@ -92,39 +186,34 @@ state_dir: "{state_dir}"
         assert decision.should_alert is True
         assert decision.severity == "high"
 
-    def test_metric_sequential_growth_workflow(self, tmp_path: Path) -> None:
+        with patch.object(daemon.notifiers[0], 'notify', return_value=True) as mock_notify:
+            daemon._handle_alert("Error Detector", decision, None)
+
+            # An unrelated append does not notify about the same error again
+            with log_file.open("a") as f:
+                f.write("INFO: Still running\n")
+            decision = coordinator.check()
+            assert decision is not None
+            daemon._handle_alert("Error Detector", decision, None)
+            assert mock_notify.call_count == 1
+
+            # A newly appended line is picked up
+            with log_file.open("a") as f:
+                f.write("FATAL: Giving up\n")
+            decision = coordinator.check()
+            assert decision is not None
+            assert decision.context["matched_patterns"] == ["ERROR", "FATAL"]
+            daemon._handle_alert("Error Detector", decision, None)
+            assert mock_notify.call_count == 2
+
+    def test_metric_sequential_growth_workflow(self, daemon_factory: DaemonFactory) -> None:
         """Test metric observation with sequential growth evaluator."""
-        error_file = tmp_path / "errors.log"
+        error_file = daemon_factory.work_dir / "errors.log"
         error_file.write_text("[FAILED] File 1\n[FAILED] File 2\n")
 
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("""
-watchers:
-  - name: "Persistent Errors"
-    observer:
-      type: "metric"
-      config:
-        extractor:
-          type: "line_count"
-          source: "{error_file}"
-          pattern: "\\\\[FAILED\\\\]"
-    trigger:
-      type: "manual"
-      config: {{}}
-    evaluator:
-      type: "sequential_growth"
-      config:
-        severity: "medium"
-
-notifiers:
-  - type: "console"
-    config: {{}}
-
-state_dir: "{state_dir}"
-""".format(error_file=str(error_file), state_dir=str(tmp_path / "state")))
-
-        daemon = LighthouseDaemon(str(config_file))
-        daemon.setup_watchers()
+        daemon = daemon_factory(
+            failed_count_watcher("Persistent Errors", error_file, severity="medium")
+        )
         coordinator = daemon.coordinators[0]
 
         # First observation - establishes baseline
@@ -153,40 +242,15 @@ state_dir: "{state_dir}"
         decision4 = coordinator.check()
         assert decision4 is None  # No alert when improving
 
-    def test_rate_limiting_works(self, tmp_path: Path) -> None:
+    def test_rate_limiting_works(self, daemon_factory: DaemonFactory) -> None:
         """Test that rate limiting prevents alert spam."""
-        log_file = tmp_path / "test.log"
+        log_file = daemon_factory.work_dir / "test.log"
         log_file.write_text("ERROR: Problem\n")
 
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("""
-watchers:
-  - name: "Test"
-    observer:
-      type: "log_pattern"
-      config:
-        log_file: "{log_file}"
-        patterns: ["ERROR"]
-    trigger:
-      type: "manual"
-      config: {{}}
-    evaluator:
-      type: "pattern_match"
-      config: {{}}
-
-notifiers:
-  - type: "console"
-    config: {{}}
-
-rate_limiting:
-  cooldown_seconds: 60
-  max_per_hour: 5
-
-state_dir: "{state_dir}"
-""".format(log_file=str(log_file), state_dir=str(tmp_path / "state")))
-
-        daemon = LighthouseDaemon(str(config_file))
-        daemon.setup_watchers()
+        daemon = daemon_factory(
+            log_pattern_watcher("Test", log_file),
+            rate_limiting={"cooldown_seconds": 60, "max_per_hour": 5}
+        )
 
         # Mock the notifier to track calls
         with patch.object(daemon.notifiers[0], 'notify', return_value=True) as mock_notify:
@@ -204,42 +268,16 @@ state_dir: "{state_dir}"
             daemon._handle_alert("Test", decision2, None)
             assert mock_notify.call_count == 1  # Still 1, not 2
 
-    def test_multiple_notifiers(self, tmp_path: Path) -> None:
+    def test_multiple_notifiers(self, daemon_factory: DaemonFactory) -> None:
         """Test that alerts are sent to all notifiers."""
-        log_file = tmp_path / "test.log"
+        log_file = daemon_factory.work_dir / "test.log"
         log_file.write_text("ERROR: Problem\n")
 
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("""
-watchers:
-  - name: "Test"
-    observer:
-      type: "log_pattern"
-      config:
-        log_file: "{log_file}"
-        patterns: ["ERROR"]
-    trigger:
-      type: "manual"
-      config: {{}}
-    evaluator:
-      type: "pattern_match"
-      config: {{}}
-
-notifiers:
-  - type: "console"
-    config: {{}}
-  - type: "console"
-    config: {{}}
-
-rate_limiting:
-  cooldown_seconds: 0
-  max_per_hour: 100
-
-state_dir: "{state_dir}"
-""".format(log_file=str(log_file), state_dir=str(tmp_path / "state")))
-
-        daemon = LighthouseDaemon(str(config_file))
-        daemon.setup_watchers()
+        daemon = daemon_factory(
+            log_pattern_watcher("Test", log_file),
+            notifiers=[{"type": "console", "config": {}}, {"type": "console", "config": {}}],
+            rate_limiting={"cooldown_seconds": 0, "max_per_hour": 100}
+        )
 
         # Mock both notifiers
         with patch.object(daemon.notifiers[0], 'notify', return_value=True) as mock1, \
@@ -254,39 +292,46 @@ state_dir: "{state_dir}"
             assert mock1.call_count == 1
             assert mock2.call_count == 1
 
-    def test_observation_history_persistence(self, tmp_path: Path) -> None:
+    def test_multiple_notifiers_sent_concurrently(self, daemon_factory: DaemonFactory) -> None:
+        """Test a slow notifier does not hold up the others."""
+        log_file = daemon_factory.work_dir / "concurrent.log"
+        log_file.write_text("ERROR: Problem\n")
+
+        daemon = daemon_factory(
+            log_pattern_watcher("Concurrent", log_file),
+            notifiers=[{"type": "console", "config": {}}] * 3,
+            rate_limiting={"cooldown_seconds": 0, "max_per_hour": 100}
+        )
+
+        # Each notify() waits for all three to be in flight at once; sent one
+        # after another, the barrier would time out and break
+        barrier = threading.Barrier(3, timeout=5)
+        results: list[bool] = []
+
+        def rendezvous(*_args: Any) -> bool:
+            barrier.wait()
+            results.append(True)
+            return True
+
+        with patch.object(daemon.notifiers[0], 'notify', side_effect=rendezvous), \
+             patch.object(daemon.notifiers[1], 'notify', side_effect=rendezvous), \
+             patch.object(daemon.notifiers[2], 'notify', side_effect=rendezvous):
+            decision = daemon.coordinators[0].check()
+            assert decision is not None
+            daemon._handle_alert("Concurrent", decision, None)
+
+        assert results == [True, True, True]
+        assert not barrier.broken
+
+    @pytest.mark.slow
+    def test_observation_history_persistence(self, daemon_factory: DaemonFactory) -> None:
         """Test that observation history is saved and loaded."""
-        error_file = tmp_path / "errors.log"
+        error_file = daemon_factory.work_dir / "errors.log"
         error_file.write_text("[FAILED] File 1\n")
-
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("""
-watchers:
-  - name: "Errors"
-    observer:
-      type: "metric"
-      config:
-        extractor:
-          type: "line_count"
-          source: "{error_file}"
-          pattern: "\\\\[FAILED\\\\]"
-    trigger:
-      type: "manual"
-      config: {{}}
-    evaluator:
-      type: "sequential_growth"
-      config: {{}}
-
-notifiers:
-  - type: "console"
-    config: {{}}
-
-state_dir: "{state_dir}"
-""".format(error_file=str(error_file), state_dir=str(tmp_path / "state")))
+        watcher = failed_count_watcher("Errors", error_file)
 
         # First daemon instance
-        daemon1 = LighthouseDaemon(str(config_file))
-        daemon1.setup_watchers()
+        daemon1 = daemon_factory(watcher)
         coordinator1 = daemon1.coordinators[0]
 
         # Make some observations
@@ -296,44 +341,40 @@ state_dir: "{state_dir}"
         assert len(coordinator1.history) == 2
 
         # Create new daemon instance (simulating restart)
-        daemon2 = LighthouseDaemon(str(config_file))
-        daemon2.setup_watchers()
+        daemon2 = daemon_factory.restart(daemon1)
         coordinator2 = daemon2.coordinators[0]
 
         # History should be loaded
         assert len(coordinator2.history) == 2
         assert coordinator2.history[0].value == 1
         assert coordinator2.history[1].value == 1
+        assert coordinator2.history[0].timestamp == coordinator1.history[0].timestamp
 
-    def test_state_change_evaluator_service_monitoring(self, tmp_path: Path) -> None:
-        """Test state change evaluator for service monitoring."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("""
-watchers:
-  - name: "Service Monitor"
-    observer:
-      type: "service"
-      config:
-        check_type: "process"
-        service_name: "launchd"
-    trigger:
-      type: "manual"
-      config: {{}}
-    evaluator:
-      type: "state_change"
-      config:
-        alert_on: "true_to_false"
-        severity: "critical"
-
-notifiers:
-  - type: "console"
-    config: {{}}
-
-state_dir: "{state_dir}"
-""".format(state_dir=str(tmp_path / "state")))
+    def test_history_is_bounded(self, daemon_factory: DaemonFactory) -> None:
+        """Test that in-memory history keeps only the most recent observations."""
+        error_file = daemon_factory.work_dir / "bounded.log"
+        error_file.write_text("[FAILED] File 1\n")
+        coordinator = daemon_factory(failed_count_watcher("Bounded", error_file)).coordinators[0]
 
-        daemon = LighthouseDaemon(str(config_file))
-        daemon.setup_watchers()
+        for _ in range(MAX_HISTORY + 5):
+            coordinator.check()
+
+        assert len(coordinator.history) == MAX_HISTORY
+
+    def test_state_change_evaluator_service_monitoring(self, daemon_factory: DaemonFactory) -> None:
+        """Test state change evaluator for service monitoring."""
+        daemon = daemon_factory({
+            "name": "Service Monitor",
+            "observer": {
+                "type": "service",
+                "config": {"check_type": "process", "service_name": "launchd"},
+            },
+            "trigger": {"type": "manual", "config": {}},
+            "evaluator": {
+                "type": "state_change",
+                "config": {"alert_on": "true_to_false", "severity": "critical"},
+            },
+        })
         coordinator = daemon.coordinators[0]
 
         # First check - service is running
@@ -2,7 +2,14 @@
 Tests for notifier implementations.
 """
 
-from typing import Any
+import json
+import smtplib
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any, ClassVar
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,6 +17,7 @@ import requests
 
 from lighthouse.core import AlertDecision
 from lighthouse.notifiers import (
+    BatchingNotifier,
     ConsoleNotifier,
     EmailNotifier,
     PushoverNotifier,
@@ -18,10 +26,48 @@ from lighthouse.notifiers import (
 )
 
 
+def sent_json(call_args: Any) -> Any:
+    """Decode the JSON body of a mocked session.request() call."""
+    return json.loads(call_args[1]["data"])
+
+
+def make_response(status_code: int = 200) -> MagicMock:
+    """Build a response mock limited to the requests.Response interface."""
+    response = MagicMock(spec=requests.Response)
+    response.status_code = status_code
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(
+            f"{status_code} Error", response=response
+        )
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+@pytest.fixture
+def http_request() -> Iterator[MagicMock]:
+    """
+    Replace requests.Session.request for every notifier session.
+
+    Calls succeed by default; set side_effect or return_value to simulate
+    failures. Recorded calls omit the session itself, so call_args[0] is
+    (method, url).
+    """
+    with patch.object(requests.Session, "request", return_value=make_response()) as mock_request:
+        yield mock_request
+
+
+@pytest.fixture
+def no_sleep() -> Iterator[MagicMock]:
+    """Skip retry backoff delays, recording what would have been slept."""
+    with patch("lighthouse.notifiers._http.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
 class TestPushoverNotifier:
     """Tests for PushoverNotifier."""
 
-    def test_notify_success(self) -> None:
+    def test_notify_success(self, http_request: MagicMock) -> None:
         """Test successful Pushover notification."""
         notifier = PushoverNotifier({
             "user_key": "test_user",
@@ -35,58 +81,51 @@ class TestPushoverNotifier:
             context={"details": "Test details"}
         )
 
-        with patch('requests.post') as mock_post:
-            mock_response = MagicMock()
-            mock_response.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response
+        result = notifier.notify(alert, "test_watcher")
 
-            result = notifier.notify(alert, "test_watcher")
-
-            assert result is True
-            mock_post.assert_called_once()
-
-            # Verify payload
-            call_args = mock_post.call_args
-            assert call_args[0][0] == "https://api.pushover.net/1/messages.json"
-            payload = call_args[1]["data"]
-            assert payload["user"] == "test_user"
-            assert payload["token"] == "test_token"
-            assert "test_watcher" in payload["title"]
-            assert "Test alert" in payload["message"]
-
-    def test_notify_with_priority_mapping(self) -> None:
+        assert result is True
+        http_request.assert_called_once()
+
+        # Verify payload
+        call_args = http_request.call_args
+        assert call_args[0][:2] == ("POST", "https://api.pushover.net/1/messages.json")
+        payload = call_args[1]["data"]
+        assert payload["user"] == "test_user"
+        assert payload["token"] == "test_token"
+        assert "test_watcher" in payload["title"]
+        assert "Test alert" in payload["message"]
+
+    @pytest.mark.parametrize(
+        "severity,expected_priority",
+        [
+            ("low", -1),
+            ("medium", 0),
+            ("high", 1),
+            ("critical", 2),
+        ],
+    )
+    def test_notify_with_priority_mapping(
+        self, http_request: MagicMock, severity: str, expected_priority: int
+    ) -> None:
         """Test priority mapping from severity levels."""
         notifier = PushoverNotifier({
             "user_key": "test_user",
             "api_token": "test_token"
         })
 
-        severities_to_priorities = {
-            "low": -1,
-            "medium": 0,
-            "high": 1,
-            "critical": 2
-        }
-
-        for severity, expected_priority in severities_to_priorities.items():
-            alert = AlertDecision(
-                should_alert=True,
-                severity=severity,
-                message="Test",
-                context={}
-            )
-
-            with patch('requests.post') as mock_post:
-                mock_response = MagicMock()
-                mock_response.raise_for_status = MagicMock()
-                mock_post.return_value = mock_response
+        alert = AlertDecision(
+            should_alert=True,
+            severity=severity,
+            message="Test",
+            context={}
+        )
 
-                notifier.notify(alert, "test")
+        notifier.notify(alert, "test")
 
-                payload = mock_post.call_args[1]["data"]
-                assert payload["priority"] == expected_priority
+        payload = http_request.call_args[1]["data"]
+        assert payload["priority"] == expected_priority
 
-    def test_notify_includes_context(self) -> None:
+    def test_notify_includes_context(self, http_request: MagicMock) -> None:
         """Test that context is included in notification message."""
         notifier = PushoverNotifier({
             "user_key": "test_user",
@@ -103,20 +142,34 @@ class TestPushoverNotifier:
             }
         )
 
-        with patch('requests.post') as mock_post:
-            mock_response = MagicMock()
-            mock_response.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response
+        notifier.notify(alert, "backup_watcher")
+
+        payload = http_request.call_args[1]["data"]
+        message = payload["message"]
+        assert "Error occurred" in message
+        assert "error_count: 5" in message
+        assert "service: backup" in message
+
+    def test_format_message_large_context(self) -> None:
+        """Test every context item appears once, in insertion order."""
+        alert = AlertDecision(
+            should_alert=True,
+            severity="high",
+            message="Error occurred",
+            context={f"key_{i}": i for i in range(1000)}
+        )
+
+        message = PushoverNotifier._format_message(alert)
+
+        assert message.split("\n\n") == ["Error occurred", *(f"key_{i}: {i}" for i in range(1000))]
 
-            notifier.notify(alert, "backup_watcher")
+    def test_format_message_without_context(self) -> None:
+        """Test a bare alert formats to just its message."""
+        alert = AlertDecision(should_alert=True, severity="low", message="Just this", context={})
 
-            payload = mock_post.call_args[1]["data"]
-            message = payload["message"]
-            assert "Error occurred" in message
-            assert "error_count: 5" in message
-            assert "service: backup" in message
+        assert PushoverNotifier._format_message(alert) == "Just this"
 
-    def test_notify_handles_request_failure(self) -> None:
+    def test_notify_handles_request_failure(self, http_request: MagicMock) -> None:
         """Test handling of request failures."""
         notifier = PushoverNotifier({
             "user_key": "test_user",
@@ -130,12 +183,11 @@ class TestPushoverNotifier:
             context={}
         )
 
-        with patch('requests.post', side_effect=requests.RequestException("Network error")):
-            result = notifier.notify(alert, "test")
+        http_request.side_effect = requests.RequestException("Network error")
 
-            assert result is False
+        assert notifier.notify(alert, "test") is False
 
-    def test_notify_handles_http_error(self) -> None:
+    def test_notify_handles_http_error(self, http_request: MagicMock) -> None:
         """Test handling of HTTP errors."""
         notifier = PushoverNotifier({
             "user_key": "test_user",
@@ -149,20 +201,88 @@ class TestPushoverNotifier:
             context={}
         )
 
-        with patch('requests.post') as mock_post:
-            mock_response = MagicMock()
-            mock_response.raise_for_status.side_effect = requests.HTTPError("400 Bad Request")
-            mock_post.return_value = mock_response
+        http_request.return_value = make_response(400)
 
-            result = notifier.notify(alert, "test")
+        result = notifier.notify(alert, "test")
 
-            assert result is False
+        assert result is False
+
+    def test_notify_retries_transient_then_succeeds(
+        self, http_request: MagicMock, no_sleep: MagicMock
+    ) -> None:
+        """Test connection errors are retried with backoff until success."""
+        notifier = PushoverNotifier({
+            "user_key": "test_user",
+            "api_token": "test_token"
+        })
+
+        alert = AlertDecision(
+            should_alert=True,
+            severity="medium",
+            message="Test",
+            context={}
+        )
+
+        http_request.side_effect = [
+            requests.ConnectionError, requests.ConnectionError, make_response()
+        ]
+
+        assert notifier.notify(alert, "test") is True
+        assert http_request.call_count == 3
+        # Exponential backoff: 1s then 2s, each stretched by at most 50% jitter
+        delays = [c.args[0] for c in no_sleep.call_args_list]
+        assert 1.0 <= delays[0] <= 1.5
+        assert 2.0 <= delays[1] <= 3.0
+
+    def test_notify_gives_up_after_max_retries(
+        self, http_request: MagicMock, no_sleep: MagicMock
+    ) -> None:
+        """Test persistent 5xx responses fail after three retries."""
+        notifier = PushoverNotifier({
+            "user_key": "test_user",
+            "api_token": "test_token"
+        })
+
+        alert = AlertDecision(
+            should_alert=True,
+            severity="medium",
+            message="Test",
+            context={}
+        )
+
+        http_request.return_value = make_response(503)
+
+        assert notifier.notify(alert, "test") is False
+        assert http_request.call_count == 4
+
+    def test_session_is_reused(self) -> None:
+        """Test that consecutive notifications go through the same session."""
+        notifier = PushoverNotifier({
+            "user_key": "test_user",
+            "api_token": "test_token"
+        })
+
+        alert = AlertDecision(
+            should_alert=True,
+            severity="medium",
+            message="Test",
+            context={}
+        )
+
+        session = notifier._session
+        with patch.object(session, 'request', return_value=make_response()) as mock_request:
+            notifier.notify(alert, "test")
+            notifier.notify(alert, "test")
+
+        assert notifier._session is session
+        assert mock_request.call_count == 2
+        assert session.get_adapter("https://api.pushover.net")._pool_maxsize == 16
 
 
 class TestWebhookNotifier:
     """Tests for WebhookNotifier."""
 
-    def test_notify_post_success(self) -> None:
+    def test_notify_post_success(self, http_request: MagicMock) -> None:
         """Test successful webhook POST."""
         notifier = WebhookNotifier({
             "url": "https://example.com/webhook"
@@ -175,26 +295,21 @@ class TestWebhookNotifier:
             context={"key": "value"}
         )
 
-        with patch('requests.post') as mock_post:
-            mock_response = MagicMock()
-            mock_response.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response
+        result = notifier.notify(alert, "webhook_test")
 
-            result = notifier.notify(alert, "webhook_test")
-
-            assert result is True
-            mock_post.assert_called_once()
-
-            # Verify payload structure
-            call_args = mock_post.call_args
-            assert call_args[0][0] == "https://example.com/webhook"
-            payload = call_args[1]["json"]
-            assert payload["watcher"] == "webhook_test"
-            assert payload["severity"] == "high"
-            assert payload["message"] == "Alert message"
-            assert payload["context"]["key"] == "value"
-
-    def test_notify_put_method(self) -> None:
+        assert result is True
+        http_request.assert_called_once()
+
+        # Verify payload structure
+        call_args = http_request.call_args
+        assert call_args[0][:2] == ("POST", "https://example.com/webhook")
+        payload = sent_json(call_args)
+        assert payload["watcher"] == "webhook_test"
+        assert payload["severity"] == "high"
+        assert payload["message"] == "Alert message"
+        assert payload["context"]["key"] == "value"
+
+    def test_notify_put_method(self, http_request: MagicMock) -> None:
         """Test webhook with PUT method."""
         notifier = WebhookNotifier({
             "url": "https://example.com/webhook",
@@ -208,17 +323,30 @@ class TestWebhookNotifier:
             context={}
         )
 
-        with patch('requests.put') as mock_put:
-            mock_response = MagicMock()
-            mock_response.raise_for_status = MagicMock()
-            mock_put.return_value = mock_response
+        result = notifier.notify(alert, "test")
 
-            result = notifier.notify(alert, "test")
+        assert result is True
+        http_request.assert_called_once()
+        assert http_request.call_args[0][0] == "PUT"
 
-            assert result is True
-            mock_put.assert_called_once()
+    def test_notify_patch_method(self, http_request: MagicMock) -> None:
+        """Test webhook with PATCH method."""
+        notifier = WebhookNotifier({
+            "url": "https://example.com/webhook",
+            "method": "patch"
+        })
 
-    def test_notify_with_custom_headers(self) -> None:
+        alert = AlertDecision(
+            should_alert=True,
+            severity="low",
+            message="Test",
+            context={}
+        )
+
+        assert notifier.notify(alert, "test") is True
+        assert http_request.call_args[0][0] == "PATCH"
+
+    def test_notify_with_custom_headers(self, http_request: MagicMock) -> None:
         """Test webhook with custom headers."""
         notifier = WebhookNotifier({
             "url": "https://example.com/webhook",
@@ -235,22 +363,120 @@ class TestWebhookNotifier:
             context={}
         )
 
-        with patch('requests.post') as mock_post:
-            mock_response = MagicMock()
-            mock_response.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response
+        notifier.notify(alert, "test")
+
+        headers = http_request.call_args[1]["headers"]
+        assert headers["Authorization"] == "Bearer token123"
+        assert headers["X-Custom"] == "value"
+        assert headers["Content-Type"] == "application/json"
+
+    def test_notify_handles_request_failure(self, http_request: MagicMock) -> None:
+        """Test handling of request failures."""
+        notifier = WebhookNotifier({
+            "url": "https://example.com/webhook"
+        })
+
+        alert = AlertDecision(
+            should_alert=True,
+            severity="medium",
+            message="Test",
+            context={}
+        )
+
+        http_request.side_effect = requests.RequestException("Connection error")
+
+        assert notifier.notify(alert, "test") is False
+
+    def test_notify_4xx_does_not_retry(self, http_request: MagicMock, no_sleep: MagicMock) -> None:
+        """Test client errors fail immediately without backing off."""
+        notifier = WebhookNotifier({
+            "url": "https://example.com/webhook"
+        })
 
+        alert = AlertDecision(
+            should_alert=True,
+            severity="medium",
+            message="Test",
+            context={}
+        )
+
+        http_request.return_value = make_response(404)
+
+        assert notifier.notify(alert, "test") is False
+        http_request.assert_called_once()
+        no_sleep.assert_not_called()
+
+    def test_notify_retries_timeout(self, http_request: MagicMock, no_sleep: MagicMock) -> None:
+        """Test a timed-out request is retried."""
+        notifier = WebhookNotifier({
+            "url": "https://example.com/webhook"
+        })
+
+        alert = AlertDecision(
+            should_alert=True,
+            severity="medium",
+            message="Test",
+            context={}
+        )
+
+        http_request.side_effect = [requests.Timeout, make_response()]
+
+        assert notifier.notify(alert, "test") is True
+        assert http_request.call_count == 2
+
+    def test_circuit_opens_after_n_failures(self, http_request: MagicMock) -> None:
+        """Test the sixth alert is dropped without a request once five have failed."""
+        notifier = WebhookNotifier({
+            "url": "https://example.com/webhook"
+        })
+
+        alert = AlertDecision(
+            should_alert=True,
+            severity="medium",
+            message="Test",
+            context={}
+        )
+
+        http_request.side_effect = requests.RequestException("down")
+        results = [notifier.notify(alert, "test") for _ in range(6)]
+
+        assert results == [False] * 6
+        assert http_request.call_count == 5
+        assert notifier._breaker.state == "open"
+
+    def test_circuit_half_open_recovers(self, http_request: MagicMock) -> None:
+        """Test one probe is let through after the cool-down and closes the circuit."""
+        notifier = WebhookNotifier({
+            "url": "https://example.com/webhook"
+        })
+        notifier._breaker.reset_after = 0.0
+
+        alert = AlertDecision(
+            should_alert=True,
+            severity="medium",
+            message="Test",
+            context={}
+        )
+
+        http_request.side_effect = requests.RequestException("down")
+        for _ in range(5):
             notifier.notify(alert, "test")
+        assert notifier._breaker.state == "open"
 
-            headers = mock_post.call_args[1]["headers"]
-            assert headers["Authorization"] == "Bearer token123"
-            assert headers["X-Custom"] == "value"
+        http_request.reset_mock(side_effect=True)
+        assert notifier.notify(alert, "test") is True
 
-    def test_notify_handles_request_failure(self) -> None:
-        """Test handling of request failures."""
+        http_request.assert_called_once()
+        assert notifier._breaker.state == "closed"
+        assert notifier._breaker.fail_count == 0
+
+    def test_circuit_half_open_probe_error_reopens(self, http_request: MagicMock) -> None:
+        """Test a non-requests exception during the probe re-opens rather than sticking half-open."""
         notifier = WebhookNotifier({
             "url": "https://example.com/webhook"
         })
+        notifier._breaker.state = "open"
+        notifier._breaker.reset_after = 0.0
 
         alert = AlertDecision(
             should_alert=True,
@@ -259,10 +485,15 @@ class TestWebhookNotifier:
             context={}
         )
 
-        with patch('requests.post', side_effect=requests.RequestException("Connection error")):
-            result = notifier.notify(alert, "test")
+        http_request.side_effect = TypeError("bad payload")
+        with pytest.raises(TypeError):
+            notifier.notify(alert, "test")
+        assert notifier._breaker.state == "open"
 
-            assert result is False
+        # The next probe is let through again after the cool-down
+        http_request.reset_mock(side_effect=True)
+        assert notifier.notify(alert, "test") is True
+        assert notifier._breaker.state == "closed"
 
     def test_notify_unsupported_method(self) -> None:
         """Test that unsupported HTTP methods raise ValueError."""
@@ -281,6 +512,112 @@ class TestWebhookNotifier:
         with pytest.raises(ValueError, match="Unsupported HTTP method: DELETE"):
             notifier.notify(alert, "test")
 
+    def test_notify_batch_single_request(self, http_request: MagicMock) -> None:
+        """Test notify_batch sends all alerts in one request."""
+        notifier = WebhookNotifier({"url": "https://example.com/webhook"})
+        alerts = [
+            (AlertDecision(True, "high", f"Alert {i}", {}), "batch_test")
+            for i in range(3)
+        ]
+
+        assert notifier.notify_batch(alerts) is True
+
+        http_request.assert_called_once()
+        payload = sent_json(http_request.call_args)
+        assert [a["message"] for a in payload["alerts"]] == [
+            "Alert 0", "Alert 1", "Alert 2"
+        ]
+
+
+class TestBatchingNotifier:
+    """Tests for BatchingNotifier."""
+
+    @staticmethod
+    def _make(**config: Any) -> BatchingNotifier:
+        return BatchingNotifier({
+            "notifier": {"type": "webhook", "config": {"url": "https://example.com/webhook"}},
+            **config,
+        })
+
+    @staticmethod
+    def _alert(i: int) -> AlertDecision:
+        return AlertDecision(True, "high", f"Alert {i}", {})
+
+    def test_burst_coalesced_into_one_request(self, http_request: MagicMock) -> None:
+        """Test alerts inside the window go out as a single POST."""
+        notifier = self._make(window_ms=10_000)
+
+        for i in range(10):
+            assert notifier.notify(self._alert(i), "burst") is True
+        http_request.assert_not_called()
+
+        notifier.close()
+
+        http_request.assert_called_once()
+        assert len(sent_json(http_request.call_args)["alerts"]) == 10
+
+    def test_window_expiry_flushes(self, http_request: MagicMock) -> None:
+        """Test the timer flushes the batch once the window passes."""
+        notifier = self._make(window_ms=10)
+
+        notifier.notify(self._alert(0), "timer")
+        timer = notifier._timer
+        assert timer is not None
+        timer.join(timeout=5)
+
+        http_request.assert_called_once()
+
+    def test_max_batch_flushes_immediately(self, http_request: MagicMock) -> None:
+        """Test reaching max_batch sends without waiting for the window."""
+        notifier = self._make(window_ms=10_000, max_batch=4)
+
+        for i in range(5):
+            notifier.notify(self._alert(i), "full")
+
+        http_request.assert_called_once()
+        assert len(sent_json(http_request.call_args)["alerts"]) == 4
+
+        notifier.close()
+        assert http_request.call_count == 2
+
+    def test_flushes_delivered_in_order(self) -> None:
+        """Test a max_batch flush waits for a slow timer flush instead of overtaking it."""
+        notifier = self._make(window_ms=10, max_batch=2)
+        sending = threading.Event()
+        delivered: list[list[str]] = []
+        in_flight: list[None] = []
+
+        def slow_batch(batch: list[tuple[AlertDecision, str]]) -> bool:
+            assert not in_flight, "batches delivered concurrently"
+            in_flight.append(None)
+            sending.set()
+            time.sleep(0.1)
+            delivered.append([alert.message for alert, _ in batch])
+            in_flight.pop()
+            return True
+
+        with patch.object(notifier.inner, "notify_batch", side_effect=slow_batch):
+            notifier.notify(self._alert(0), "order")
+            assert sending.wait(timeout=5)
+            # The timer is delivering the first batch; this one fills up meanwhile
+            notifier.notify(self._alert(1), "order")
+            notifier.notify(self._alert(2), "order")
+            notifier.close()
+
+        assert delivered == [["Alert 0"], ["Alert 1", "Alert 2"]]
+
+    def test_context_manager_flushes_on_exit(self, http_request: MagicMock) -> None:
+        """Test leaving the with-block delivers pending alerts."""
+        notifier = self._make(window_ms=10_000)
+
+        with notifier:
+            notifier.notify(self._alert(0), "ctx")
+            notifier.notify(self._alert(1), "ctx")
+            http_request.assert_not_called()
+
+        http_request.assert_called_once()
+        assert len(sent_json(http_request.call_args)["alerts"]) == 2
+
 
 class TestConsoleNotifier:
     """Tests for ConsoleNotifier."""
@@ -342,45 +679,160 @@ class TestConsoleNotifier:
             result = notifier.notify(alert, "test")
             assert result is True
 
+    def test_console_only_does_not_import_requests(self) -> None:
+        """Test loading the notifiers and alerting to the console leaves requests unimported."""
+        script = (
+            "import sys\n"
+            "from lighthouse.plugins import create_notifier\n"
+            "from lighthouse.core import AlertDecision\n"
+            "create_notifier('console', {}).notify(AlertDecision(True, 'low', 'hi', {}), 'w')\n"
+            "sys.exit('requests' in sys.modules)\n"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script], capture_output=True, text=True, check=False
+        )
 
-class TestEmailNotifier:
-    """Tests for EmailNotifier (not yet implemented)."""
-
-    def test_email_raises_not_implemented(self) -> None:
-        """Test that email notifier raises NotImplementedError."""
-        notifier = EmailNotifier({
-            "smtp_host": "smtp.example.com",
-            "smtp_port": 587,
-            "from_addr": "lighthouse@example.com",
-            "to_addr": "admin@example.com"
-        })
+        assert result.returncode == 0, result.stderr
 
-        alert = AlertDecision(
+
+class TestEmailNotifier:
+    """Tests for EmailNotifier."""
+
+    CONFIG: ClassVar[dict[str, Any]] = {
+        "smtp_host": "smtp.example.com",
+        "smtp_port": 587,
+        "from_addr": "lighthouse@example.com",
+        "to_addr": "admin@example.com",
+        "username": "lighthouse",
+        "password": "secret",
+    }
+
+    @pytest.fixture
+    def smtp(self) -> Iterator[MagicMock]:
+        """Replace smtplib.SMTP; yields the class mock."""
+        with patch("lighthouse.notifiers.email.smtplib.SMTP") as mock_smtp:
+            yield mock_smtp
+
+    @staticmethod
+    def _alert() -> AlertDecision:
+        return AlertDecision(
             should_alert=True,
-            severity="medium",
-            message="Test",
-            context={}
+            severity="high",
+            message="Disk almost full",
+            context={"usage": "97%"}
         )
 
-        with pytest.raises(NotImplementedError, match="Email notifications not yet implemented"):
-            notifier.notify(alert, "test")
+    def test_email_sends_message(self, smtp: MagicMock) -> None:
+        """Test the alert is sent as an email after STARTTLS and login."""
+        notifier = EmailNotifier(self.CONFIG)
+
+        assert notifier.notify(self._alert(), "disk") is True
+
+        smtp.assert_called_once_with("smtp.example.com", 587, timeout=10)
+        conn = smtp.return_value
+        conn.starttls.assert_called_once()
+        conn.login.assert_called_once_with("lighthouse", "secret")
+        message = conn.send_message.call_args[0][0]
+        assert message["Subject"] == "[Lighthouse] HIGH: disk"
+        assert message["To"] == "admin@example.com"
+        assert "Disk almost full" in message.get_content()
+        assert "usage: 97%" in message.get_content()
+
+    def test_email_reuses_smtp_connection(self, smtp: MagicMock) -> None:
+        """Test later alerts go over the already-open connection."""
+        notifier = EmailNotifier(self.CONFIG)
+
+        notifier.notify(self._alert(), "disk")
+        notifier.notify(self._alert(), "disk")
+
+        smtp.assert_called_once()
+        smtp.return_value.login.assert_called_once()
+        assert smtp.return_value.send_message.call_count == 2
+
+    def test_email_reconnects_after_disconnect(self, smtp: MagicMock) -> None:
+        """Test a connection dropped by the server is reopened and the alert resent."""
+        stale, fresh = MagicMock(), MagicMock()
+        stale.send_message.side_effect = [None, smtplib.SMTPServerDisconnected()]
+        smtp.side_effect = [stale, fresh]
+        notifier = EmailNotifier(self.CONFIG)
+
+        assert notifier.notify(self._alert(), "disk") is True
+        assert notifier.notify(self._alert(), "disk") is True
+
+        assert smtp.call_count == 2
+        fresh.send_message.assert_called_once()
+
+    def test_email_failure_returns_false(self, smtp: MagicMock) -> None:
+        """Test SMTP errors are reported as a failed notification."""
+        smtp.return_value.send_message.side_effect = smtplib.SMTPRecipientsRefused({})
+        notifier = EmailNotifier(self.CONFIG)
+
+        assert notifier.notify(self._alert(), "disk") is False
+        smtp.return_value.quit.assert_called_once()
+
+    def test_close_quits_connection(self, smtp: MagicMock) -> None:
+        """Test close() ends the SMTP session."""
+        notifier = EmailNotifier(self.CONFIG)
+        notifier.notify(self._alert(), "disk")
+
+        notifier.close()
+
+        smtp.return_value.quit.assert_called_once()
 
 
 class TestSlackNotifier:
-    """Tests for SlackNotifier (not yet implemented)."""
+    """Tests for SlackNotifier."""
 
-    def test_slack_raises_not_implemented(self) -> None:
-        """Test that Slack notifier raises NotImplementedError."""
-        notifier = SlackNotifier({
-            "webhook_url": "https://hooks.slack.com/services/XXX/YYY/ZZZ"
-        })
+    URL = "https://hooks.slack.com/services/XXX/YYY/ZZZ"
 
-        alert = AlertDecision(
+    @staticmethod
+    def _alert(message: str = "Backup failed") -> AlertDecision:
+        return AlertDecision(
             should_alert=True,
-            severity="medium",
-            message="Test",
-            context={}
+            severity="high",
+            message=message,
+            context={"job": "nightly"}
         )
 
-        with pytest.raises(NotImplementedError, match="Slack notifications not yet implemented"):
-            notifier.notify(alert, "test")
+    def test_slack_posts_message(self, http_request: MagicMock) -> None:
+        """Test the alert is posted to the webhook as Slack text."""
+        notifier = SlackNotifier({"webhook_url": self.URL, "channel": "#ops"})
+
+        assert notifier.notify(self._alert(), "backup") is True
+
+        assert http_request.call_args[0][:2] == ("POST", self.URL)
+        payload = sent_json(http_request.call_args)
+        assert payload["channel"] == "#ops"
+        assert payload["text"].startswith("*[HIGH] backup*\nBackup failed")
+        assert "job: nightly" in payload["text"]
+
+    def test_slack_dedupes_within_window(self, http_request: MagicMock) -> None:
+        """Test identical alerts inside the window produce one POST."""
+        notifier = SlackNotifier({"webhook_url": self.URL})
+
+        results = [notifier.notify(self._alert(), "backup") for _ in range(5)]
+        notifier.notify(self._alert("Different failure"), "backup")
+
+        assert results == [True] * 5
+        assert http_request.call_count == 2
+
+    def test_slack_resends_after_window(self, http_request: MagicMock) -> None:
+        """Test a repeat is sent again once the window has passed."""
+        notifier = SlackNotifier({"webhook_url": self.URL, "dedup_seconds": 60})
+
+        with patch("lighthouse.notifiers.slack.time.monotonic", side_effect=[0.0, 61.0, 61.0]):
+            notifier.notify(self._alert(), "backup")
+            notifier.notify(self._alert(), "backup")
+
+        assert http_request.call_count == 2
+
+    def test_slack_failed_send_is_not_deduped(self, http_request: MagicMock) -> None:
+        """Test an alert that failed to send is not suppressed next time."""
+        notifier = SlackNotifier({"webhook_url": self.URL})
+        http_request.return_value = make_response(400)
+
+        assert notifier.notify(self._alert(), "backup") is False
+
+        http_request.return_value = make_response()
+        assert notifier.notify(self._alert(), "backup") is True
+        assert http_request.call_count == 2
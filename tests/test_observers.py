@@ -2,9 +2,17 @@
 Tests for observer implementations.
 """
 
+import os
+import re
 import shutil
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import TextIO
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from lighthouse.observers import (
     LogPatternObserver,
@@ -12,59 +20,92 @@ from lighthouse.observers import (
     ServiceObserver,
     StatefulLogPatternObserver,
 )
+from lighthouse.observers._patterns import compile_any, compile_pattern
+from lighthouse.observers.log_pattern import OVERLAP_CHARS
+from lighthouse.observers.metric import _count_matching_lines
 
+ObserverFactory = Callable[[str, Path], StatefulLogPatternObserver]
 
-class TestLogPatternObserver:
-    """Tests for LogPatternObserver."""
-
-    def test_observe_pattern_match(self, tmp_path: Path) -> None:
-        """Test observing a file with matching pattern."""
-        log_file = tmp_path / "test.log"
-        log_file.write_text("INFO: Starting\nERROR: Something failed\nINFO: Done\n")
 
-        observer = LogPatternObserver({
-            "log_file": str(log_file),
-            "patterns": ["ERROR"]
-        })
+def rewrite(path: Path, data: str) -> int:
+    """
+    Truncate a log in place (same inode) and write new content.
 
-        result = observer.observe()
+    Returns the resulting file size, read from the open descriptor.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_TRUNC | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, data.encode())
+        return os.fstat(fd).st_size
+    finally:
+        os.close(fd)
 
-        assert result.value is True
-        assert "ERROR" in result.metadata["matched_patterns"]
-        assert result.metadata["total_patterns"] == 1
-        assert isinstance(result.timestamp, datetime)
 
-    def test_observe_no_match(self, tmp_path: Path) -> None:
-        """Test observing a file with no matching pattern."""
-        log_file = tmp_path / "test.log"
-        log_file.write_text("INFO: Starting\nINFO: Done\n")
+@contextmanager
+def append_sink(path: Path) -> Iterator[TextIO]:
+    """
+    Keep a log file open for appending, like a process writing its log.
 
-        observer = LogPatternObserver({
-            "log_file": str(log_file),
-            "patterns": ["ERROR", "FATAL"]
-        })
+    Callers flush after each write so the observer sees it.
+    """
+    f = path.open("a", buffering=1)
+    try:
+        yield f
+    finally:
+        f.close()
 
-        result = observer.observe()
 
-        assert result.value is False
-        assert result.metadata["matched_patterns"] == []
+class TestLogPatternObserver:
+    """Tests for LogPatternObserver."""
 
-    def test_observe_multiple_patterns(self, tmp_path: Path) -> None:
-        """Test observing with multiple patterns."""
+    @pytest.mark.parametrize(
+        "contents,patterns,expected_value,expected_matches",
+        [
+            (
+                "INFO: Starting\nERROR: Something failed\nINFO: Done\n",
+                ["ERROR"],
+                True,
+                ["ERROR"],
+            ),
+            ("INFO: Starting\nINFO: Done\n", ["ERROR", "FATAL"], False, []),
+            (
+                "ERROR: First error\nWARNING: A warning\nFATAL: Critical\n",
+                ["ERROR", "FATAL", "CRITICAL"],
+                True,
+                ["ERROR", "FATAL"],
+            ),
+            (
+                "Error code: 500\nError code: 404\nSuccess: 200\n",
+                [r"Error code: \d+"],
+                True,
+                [r"Error code: \d+"],
+            ),
+        ],
+        ids=["pattern_match", "no_match", "multiple_patterns", "regex_pattern"],
+    )
+    def test_observe(
+        self,
+        tmp_path: Path,
+        contents: str,
+        patterns: list[str],
+        expected_value: bool,
+        expected_matches: list[str],
+    ) -> None:
+        """Test which of the configured patterns are found in a log file."""
         log_file = tmp_path / "test.log"
-        log_file.write_text("ERROR: First error\nWARNING: A warning\nFATAL: Critical\n")
+        log_file.write_text(contents)
 
         observer = LogPatternObserver({
             "log_file": str(log_file),
-            "patterns": ["ERROR", "FATAL", "CRITICAL"]
+            "patterns": patterns
         })
 
         result = observer.observe()
 
-        assert result.value is True
-        assert "ERROR" in result.metadata["matched_patterns"]
-        assert "FATAL" in result.metadata["matched_patterns"]
-        assert len(result.metadata["matched_patterns"]) == 2
+        assert result.value is expected_value
+        assert sorted(result.metadata["matched_patterns"]) == sorted(expected_matches)
+        assert result.metadata["total_patterns"] == len(patterns)
+        assert isinstance(result.timestamp, datetime)
 
     def test_observe_nonexistent_file(self, tmp_path: Path) -> None:
         """Test observing a nonexistent file."""
@@ -94,70 +135,193 @@ class TestLogPatternObserver:
         assert result.value is True
 
 
-class TestStatefulLogPatternObserver:
-    """Tests for StatefulLogPatternObserver."""
+class TestLogPatternObserverIncremental:
+    """Tests for incremental reads in LogPatternObserver."""
 
-    def test_initial_read(self, tmp_path: Path) -> None:
-        """Test that the first read processes the whole file."""
+    def test_appended_lines_only_are_read(self, tmp_path: Path) -> None:
+        """Test that later observations resume from the previous offset."""
         log_file = tmp_path / "test.log"
-        log_file.write_text("line 1\nERROR: line 2\nline 3\n")
+        log_file.write_text("ERROR: first\nINFO: ok\n")
 
-        observer = StatefulLogPatternObserver({
-            "name": "test_initial_read",
-            "state_dir": str(tmp_path),
+        observer = LogPatternObserver({
             "log_file": str(log_file),
-            "patterns": ["ERROR"]
+            "patterns": ["ERROR", "FATAL"]
         })
+        assert observer.observe().metadata["matched_patterns"] == ["ERROR"]
+        offset = log_file.stat().st_size
+
+        with log_file.open("a") as f:
+            f.write("FATAL: second\n")
 
         result = observer.observe()
 
-        assert result.value is True
-        assert "ERROR: line 2" in result.metadata["matched_lines"]
-        assert observer.state["offset"] > 0
+        # Earlier matches are kept while only the appended line was scanned
+        assert result.metadata["matched_patterns"] == ["ERROR", "FATAL"]
+        assert observer._tail.offset == offset + len("FATAL: second\n")
 
-    def test_tailing_logic(self, tmp_path: Path) -> None:
-        """Test that subsequent reads only process new lines."""
+    def test_partial_line_is_rescanned(self, tmp_path: Path) -> None:
+        """Test that a line without a trailing newline is read again next time."""
         log_file = tmp_path / "test.log"
-        state_dir = tmp_path / "state"
+        observer = LogPatternObserver({"log_file": str(log_file), "patterns": ["ERROR"]})
 
-        observer = StatefulLogPatternObserver({
-            "name": "test_tailing_logic",
-            "state_dir": str(state_dir),
-            "log_file": str(log_file),
-            "patterns": ["ERROR"]
-        })
+        with append_sink(log_file) as sink:
+            sink.write("INFO: ok\nERR")
+            sink.flush()
+            assert observer.observe().value is False
 
-        # First run
-        log_file.write_text("line 1\n")
-        result1 = observer.observe()
-        assert result1.value is False
+            sink.write("OR: done\n")
+            sink.flush()
+            assert observer.observe().value is True
+
+    def test_match_split_across_appends(self, tmp_path: Path) -> None:
+        """Test that a match straddling the previous read boundary is found."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("INFO: ok\nERROR: disk\n")
+
+        observer = LogPatternObserver({"log_file": str(log_file), "patterns": [r"ERROR: disk\nFATAL"]})
+        assert observer.observe().value is False
 
-        # Second run
         with log_file.open("a") as f:
-            f.write("ERROR: new line\n")
+            f.write("FATAL: halting\n")
 
-        result2 = observer.observe()
-        assert result2.value is True
-        assert "ERROR: new line" in result2.metadata["matched_lines"]
+        assert observer.observe().value is True
+
+    def test_anchors_match_only_at_file_start(self, tmp_path: Path) -> None:
+        """Test that ^ is not re-rooted at the resume offset."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("INFO: " + "x" * OVERLAP_CHARS + "\n")
+
+        observer = LogPatternObserver({"log_file": str(log_file), "patterns": ["^ERROR", r"\AINFO"]})
+        assert observer.observe().metadata["matched_patterns"] == [r"\AINFO"]
 
-        # Third run (no new error lines)
         with log_file.open("a") as f:
-            f.write("another line\n")
+            f.write("ERROR: late\n")
+
+        assert observer.observe().metadata["matched_patterns"] == [r"\AINFO"]
+
+    def test_rewritten_file_is_rescanned(self, tmp_path: Path) -> None:
+        """Test that rewriting the scanned region drops stale matches."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("ERROR: broken\n")
+
+        observer = LogPatternObserver({"log_file": str(log_file), "patterns": ["ERROR"]})
+        assert observer.observe().value is True
+
+        # Same inode, larger file, but the error line is gone
+        log_file.write_text("INFO: fixed!\nINFO: still fine\n")
+
+        assert observer.observe().value is False
+
+    def test_truncated_file_is_rescanned(self, tmp_path: Path) -> None:
+        """Test that a file smaller than the offset is scanned from the start."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("INFO: a long line of text\nERROR: broken\n")
+
+        observer = LogPatternObserver({"log_file": str(log_file), "patterns": ["ERROR"]})
+        assert observer.observe().value is True
+
+        log_file.write_text("INFO: short\n")
+
+        assert observer.observe().value is False
+
+
+class TestCompilePattern:
+    """Tests for the shared pattern cache."""
+
+    def test_same_pattern_shares_compiled_object(self) -> None:
+        """Test that identical patterns compile once."""
+        assert compile_pattern(r"ERROR\d+") is compile_pattern(r"ERROR\d+")
+
+    def test_flags_are_part_of_key(self) -> None:
+        """Test that different flags produce different compiled patterns."""
+        assert compile_pattern("error") is not compile_pattern("error", re.IGNORECASE)
+        assert compile_pattern("error", re.IGNORECASE).search("ERROR")
+
+    def test_compile_any_combines_patterns(self) -> None:
+        """Test that plain patterns are merged into one alternation."""
+        regexes = compile_any(("ERROR", "FATAL", r"panic: \w+"))
+
+        assert len(regexes) == 1
+        assert regexes[0].search("kernel panic: oops")
+        assert not regexes[0].search("INFO all good")
+
+    def test_compile_any_keeps_groups_separate(self) -> None:
+        """Test that patterns with backreferences are not combined."""
+        regexes = compile_any(("ERROR", r"(\w+) \1"))
+
+        assert len(regexes) == 2
+        assert any(r.search("again again") for r in regexes)
+
+    def test_compile_any_keeps_inline_flags_separate(self) -> None:
+        """Test that inline global flags fall back to per-pattern matching."""
+        regexes = compile_any(("ERROR", "(?i)fatal"))
+
+        assert len(regexes) == 2
+        assert any(r.search("FATAL crash") for r in regexes)
+
+
+class TestStatefulLogPatternObserver:
+    """Tests for StatefulLogPatternObserver."""
+
+    @pytest.fixture
+    def make_observer(self, scratch_root: Path) -> ObserverFactory:
+        """Build observers (matching ERROR) whose state lives in the session scratch root."""
+        state_root = scratch_root / "observer-state"
+
+        def make(name: str, log_file: Path) -> StatefulLogPatternObserver:
+            return StatefulLogPatternObserver({
+                "name": name,
+                "state_dir": str(state_root / name),
+                "log_file": str(log_file),
+                "patterns": ["ERROR"]
+            })
+
+        return make
+
+    def test_initial_read(self, tmp_path: Path, make_observer: ObserverFactory) -> None:
+        """Test that the first read processes the whole file."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("line 1\nERROR: line 2\nline 3\n")
+
+        observer = make_observer("test_initial_read", log_file)
+
+        result = observer.observe()
+
+        assert result.value is True
+        assert "ERROR: line 2" in result.metadata["matched_lines"]
+        assert observer.state["offset"] > 0
 
-        result3 = observer.observe()
-        assert result3.value is False
+    def test_tailing_logic(self, tmp_path: Path, make_observer: ObserverFactory) -> None:
+        """Test that subsequent reads only process new lines."""
+        log_file = tmp_path / "test.log"
 
-    def test_standard_rotation(self, tmp_path: Path) -> None:
+        observer = make_observer("test_tailing_logic", log_file)
+
+        with append_sink(log_file) as sink:
+            # First run
+            sink.write("line 1\n")
+            sink.flush()
+            result1 = observer.observe()
+            assert result1.value is False
+
+            # Second run
+            sink.write("ERROR: new line\n")
+            sink.flush()
+            result2 = observer.observe()
+            assert result2.value is True
+            assert "ERROR: new line" in result2.metadata["matched_lines"]
+
+            # Third run (no new error lines)
+            sink.write("another line\n")
+            sink.flush()
+            result3 = observer.observe()
+            assert result3.value is False
+
+    def test_standard_rotation(self, tmp_path: Path, make_observer: ObserverFactory) -> None:
         """Test that the observer handles standard log rotation (rename)."""
         log_file = tmp_path / "test.log"
-        state_dir = tmp_path / "state"
 
-        observer = StatefulLogPatternObserver({
-            "name": "test_standard_rotation",
-            "state_dir": str(state_dir),
-            "log_file": str(log_file),
-            "patterns": ["ERROR"]
-        })
+        observer = make_observer("test_standard_rotation", log_file)
 
         # Initial file
         log_file.write_text("initial line\n")
@@ -180,17 +344,11 @@ class TestStatefulLogPatternObserver:
         assert new_fingerprint is not None
         assert new_fingerprint != initial_fingerprint
 
-    def test_copytruncate_rotation(self, tmp_path: Path) -> None:
+    def test_copytruncate_rotation(self, tmp_path: Path, make_observer: ObserverFactory) -> None:
         """Test that the observer handles copy-truncate rotation."""
         log_file = tmp_path / "test.log"
-        state_dir = tmp_path / "state"
 
-        observer = StatefulLogPatternObserver({
-            "name": "test_copytruncate_rotation",
-            "state_dir": str(state_dir),
-            "log_file": str(log_file),
-            "patterns": ["ERROR"]
-        })
+        observer = make_observer("test_copytruncate_rotation", log_file)
 
         # Initial file - make it longer so truncation is detected
         log_file.write_text("initial line 1\ninitial line 2\ninitial line 3\n")
@@ -211,43 +369,55 @@ class TestStatefulLogPatternObserver:
         result = observer.observe()
 
         assert result.value is True, f"Expected match but got: {result}"
-        assert "ERROR: new" in result.metadata.get("matched_lines", [])
+        assert "ERROR: new" in result.metadata["matched_lines"]
 
         # After copytruncate, the fingerprint stays the same (same inode)
         # but offset should be reset to 0 when truncation is detected
         new_fingerprint = observer.state["fingerprint"]
         assert new_fingerprint == initial_fingerprint, "Fingerprint should not change on copytruncate"
 
-    def test_state_file_creation(self, tmp_path: Path) -> None:
+    def test_state_file_creation(self, tmp_path: Path, make_observer: ObserverFactory) -> None:
         """Test that a state file is created."""
         log_file = tmp_path / "test.log"
-        state_dir = tmp_path / "state"
         log_file.write_text("some data\n")
 
-        observer = StatefulLogPatternObserver({
-            "name": "test_state_file_creation",
-            "state_dir": str(state_dir),
-            "log_file": str(log_file),
-            "patterns": ["ERROR"]
-        })
+        observer = make_observer("test_state_file_creation", log_file)
 
         observer.observe()
 
-        state_file = state_dir / "test_state_file_creation.state.json"
+        state_file = observer.state_file
+        assert state_file.name == "test_state_file_creation.state.json"
         assert state_file.exists()
         assert state_file.stat().st_size > 0
 
-    def test_file_size_regression(self, tmp_path: Path) -> None:
+    def test_state_is_read_from_disk_only_at_startup(
+        self, tmp_path: Path, make_observer: ObserverFactory
+    ) -> None:
+        """Test observe() works from in-memory state and a new observer resumes from disk."""
+        log_file = tmp_path / "test.log"
+        log_file.write_text("line 1\n")
+        observer = make_observer("test_state_read_once", log_file)
+
+        with patch(
+            "lighthouse.observers.stateful_log_pattern.json.load",
+            side_effect=AssertionError("state re-read from disk"),
+        ):
+            observer.observe()
+            with log_file.open("a") as f:
+                f.write("ERROR: later\n")
+            assert observer.observe().value is True
+            assert observer.observe().value is False
+
+        # A restarted observer picks up the saved offset instead of rescanning
+        restarted = make_observer("test_state_read_once", log_file)
+        assert restarted.state["offset"] == observer.state["offset"]
+        assert restarted.observe().value is False
+
+    def test_file_size_regression(self, tmp_path: Path, make_observer: ObserverFactory) -> None:
         """Test that file size regression (file smaller than offset) is handled."""
         log_file = tmp_path / "test.log"
-        state_dir = tmp_path / "state"
 
-        observer = StatefulLogPatternObserver({
-            "name": "test_file_size_regression",
-            "state_dir": str(state_dir),
-            "log_file": str(log_file),
-            "patterns": ["ERROR"]
-        })
+        observer = make_observer("test_file_size_regression", log_file)
 
         # Initial file with content
         log_file.write_text("line 1\nline 2\nline 3\nline 4\n")
@@ -257,28 +427,24 @@ class TestStatefulLogPatternObserver:
 
         # Simulate file being truncated (race condition or manual truncation)
         # File is now smaller than the stored offset
-        log_file.write_text("ERROR: new\n")
+        rewrite(log_file, "ERROR: new\n")
 
         # Observer should detect size regression and reset offset to 0
         result = observer.observe()
 
         assert result.value is True
-        assert "ERROR: new" in result.metadata.get("matched_lines", [])
+        assert "ERROR: new" in result.metadata["matched_lines"]
         # Offset should be updated to new position after reading from 0
         assert observer.state["offset"] > 0
         assert observer.state["offset"] < initial_offset
 
-    def test_file_deleted_during_observation(self, tmp_path: Path) -> None:
+    def test_file_deleted_during_observation(
+        self, tmp_path: Path, make_observer: ObserverFactory
+    ) -> None:
         """Test that file deletion during observation is handled gracefully."""
         log_file = tmp_path / "test.log"
-        state_dir = tmp_path / "state"
 
-        observer = StatefulLogPatternObserver({
-            "name": "test_file_deleted",
-            "state_dir": str(state_dir),
-            "log_file": str(log_file),
-            "patterns": ["ERROR"]
-        })
+        observer = make_observer("test_file_deleted", log_file)
 
         # Initial observation with file present
         log_file.write_text("initial content\n")
@@ -291,20 +457,16 @@ class TestStatefulLogPatternObserver:
         # Observer should handle missing file gracefully
         result2 = observer.observe()
         assert result2.value is False
-        assert result2.metadata.get("status") == "file not found"
+        assert result2.metadata["status"] == "file not found"
 
-    def test_copytruncate_with_log1_appearing(self, tmp_path: Path) -> None:
+    def test_copytruncate_with_log1_appearing(
+        self, tmp_path: Path, make_observer: ObserverFactory
+    ) -> None:
         """Test copytruncate detection when .log.1 suddenly appears."""
         log_file = tmp_path / "test.log"
         rotated_log = tmp_path / "test.log.1"
-        state_dir = tmp_path / "state"
 
-        observer = StatefulLogPatternObserver({
-            "name": "test_copytruncate_log1_appears",
-            "state_dir": str(state_dir),
-            "log_file": str(log_file),
-            "patterns": ["ERROR"]
-        })
+        observer = make_observer("test_copytruncate_log1_appears", log_file)
 
         # Initial observation - no .log.1 exists
         log_file.write_text("initial line 1\ninitial line 2\n")
@@ -322,23 +484,19 @@ class TestStatefulLogPatternObserver:
         result = observer.observe()
 
         assert result.value is True
-        assert "ERROR: after rotation" in result.metadata.get("matched_lines", [])
+        assert "ERROR: after rotation" in result.metadata["matched_lines"]
         # Fingerprint should not change (same inode)
         assert observer.state["fingerprint"] == initial_fingerprint
         # rotated_fingerprint should now be set
         assert observer.state.get("rotated_fingerprint") is not None
 
-    def test_offset_beyond_file_end_race_condition(self, tmp_path: Path) -> None:
+    def test_offset_beyond_file_end_race_condition(
+        self, tmp_path: Path, make_observer: ObserverFactory
+    ) -> None:
         """Test handling when offset is beyond file end (edge case race condition)."""
         log_file = tmp_path / "test.log"
-        state_dir = tmp_path / "state"
 
-        observer = StatefulLogPatternObserver({
-            "name": "test_offset_beyond_end",
-            "state_dir": str(state_dir),
-            "log_file": str(log_file),
-            "patterns": ["ERROR"]
-        })
+        observer = make_observer("test_offset_beyond_end", log_file)
 
         # Initial file
         log_file.write_text("line 1\nline 2\nline 3\n")
@@ -350,15 +508,17 @@ class TestStatefulLogPatternObserver:
         observer.state["offset"] = stored_offset + 1000
 
         # File gets new content but is still smaller than offset
-        log_file.write_text("ERROR: short\n")
+        rewrite(log_file, "ERROR: short\n")
 
         # Should detect size regression and reset
         result = observer.observe()
 
         assert result.value is True
-        assert "ERROR: short" in result.metadata.get("matched_lines", [])
+        assert "ERROR: short" in result.metadata["matched_lines"]
 
-    def test_copytruncate_detection_without_size_regression(self, tmp_path: Path) -> None:
+    def test_copytruncate_detection_without_size_regression(
+        self, tmp_path: Path, make_observer: ObserverFactory
+    ) -> None:
         """
         Test that copytruncate is detected purely by .log.1 inode change,
         even when file_size >= offset (no size regression).
@@ -368,14 +528,8 @@ class TestStatefulLogPatternObserver:
         """
         log_file = tmp_path / "test.log"
         rotated_log = tmp_path / "test.log.1"
-        state_dir = tmp_path / "state"
 
-        observer = StatefulLogPatternObserver({
-            "name": "test_copytruncate_no_size_regression",
-            "state_dir": str(state_dir),
-            "log_file": str(log_file),
-            "patterns": ["ERROR"]
-        })
+        observer = make_observer("test_copytruncate_no_size_regression", log_file)
 
         # Initial file - start with some content
         initial_content = "line 1\nline 2\nline 3\n"
@@ -404,12 +558,9 @@ class TestStatefulLogPatternObserver:
         new_content = "ERROR: new line 1\nERROR: new line 2\nERROR: new line 3\nERROR: new line 4\n"
         assert len(new_content) > initial_offset, "New content must be larger than offset"
 
-        with log_file.open("w") as f:
-            f.truncate(0)
-            f.write(new_content)
+        current_size = rewrite(log_file, new_content)
 
         # Verify our test setup: file size should be >= offset
-        current_size = log_file.stat().st_size
         assert current_size >= initial_offset, "Test setup error: need file_size >= offset"
 
         # Observer should detect rotation ONLY by .log.1 fingerprint change
@@ -417,7 +568,9 @@ class TestStatefulLogPatternObserver:
 
         # Should find the ERROR lines because rotation was detected
         assert result.value is True
-        assert len(result.metadata.get("matched_lines", [])) == 4
+        assert result.metadata["matched_lines"] == [
+            f"ERROR: new line {i}" for i in range(1, 5)
+        ]
 
         # Fingerprint should not change (copytruncate keeps same inode)
         assert observer.state["fingerprint"] == initial_fingerprint
@@ -430,10 +583,18 @@ class TestStatefulLogPatternObserver:
 class TestMetricObserver:
     """Tests for MetricObserver."""
 
-    def test_line_count_extractor(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize(
+        "contents,expected",
+        [
+            ("[FAILED] File 1\n[FAILED] File 2\n[SUCCESS] File 3\n[FAILED] File 4\n", 3),
+            ("[SUCCESS] File 1\n[SUCCESS] File 2\n", 0),
+        ],
+        ids=["matches", "no_matches"],
+    )
+    def test_line_count_extractor(self, tmp_path: Path, contents: str, expected: int) -> None:
         """Test extracting line count metric."""
         log_file = tmp_path / "errors.log"
-        log_file.write_text("[FAILED] File 1\n[FAILED] File 2\n[SUCCESS] File 3\n[FAILED] File 4\n")
+        log_file.write_text(contents)
 
         observer = MetricObserver({
             "extractor": {
@@ -445,26 +606,9 @@ class TestMetricObserver:
 
         result = observer.observe()
 
-        assert result.value == 3
+        assert result.value == expected
         assert result.metadata["extractor_type"] == "line_count"
 
-    def test_line_count_no_matches(self, tmp_path: Path) -> None:
-        """Test line count with no matches."""
-        log_file = tmp_path / "errors.log"
-        log_file.write_text("[SUCCESS] File 1\n[SUCCESS] File 2\n")
-
-        observer = MetricObserver({
-            "extractor": {
-                "type": "line_count",
-                "source": str(log_file),
-                "pattern": r"\[FAILED\]"
-            }
-        })
-
-        result = observer.observe()
-
-        assert result.value == 0
-
     def test_line_count_nonexistent_file(self, tmp_path: Path) -> None:
         """Test line count with nonexistent file."""
         observer = MetricObserver({
@@ -479,61 +623,105 @@ class TestMetricObserver:
 
         assert result.value == 0
 
-    def test_regex_capture_extractor_int(self, tmp_path: Path) -> None:
-        """Test extracting value via regex capture group as integer."""
-        log_file = tmp_path / "stats.log"
-        log_file.write_text("Failed files( % ): 15\nTotal files: 100\n")
+    def test_line_count_counts_lines_not_matches(self, tmp_path: Path) -> None:
+        """Test that a line with several matches counts once and ^ anchors per line."""
+        log_file = tmp_path / "errors.log"
+        log_file.write_text("ERROR ERROR ERROR\nINFO ERROR\nERROR\n")
 
-        observer = MetricObserver({
-            "extractor": {
-                "type": "regex_capture",
-                "source": str(log_file),
-                "pattern": r"Failed files\( % \): (\d+)",
-                "group": 1,
-                "data_type": "int"
-            }
-        })
+        def count(pattern: str) -> object:
+            observer = MetricObserver({
+                "extractor": {"type": "line_count", "source": str(log_file), "pattern": pattern}
+            })
+            return observer.observe().value
 
-        result = observer.observe()
+        assert count("ERROR") == 3
+        assert count("^ERROR") == 2
+        assert count("ERROR$") == 3
 
-        assert result.value == 15
-        assert isinstance(result.value, int)
+    def test_line_count_pattern_does_not_cross_lines(self, tmp_path: Path) -> None:
+        """Test that a pattern able to match a newline is still confined to one line."""
+        log_file = tmp_path / "errors.log"
+        log_file.write_text("ERROR in module\nfoo: bar\nERROR again: x\n")
 
-    def test_regex_capture_extractor_str(self, tmp_path: Path) -> None:
-        """Test extracting value via regex capture group as string."""
-        log_file = tmp_path / "status.log"
-        log_file.write_text("Status: running\nUptime: 3600\n")
+        observer = MetricObserver({
+            "extractor": {"type": "line_count", "source": str(log_file), "pattern": r"ERROR[^:]*:"}
+        })
+        assert observer.observe().value == 1
 
+        log_file.write_text("a\nFAILED x\n")
         observer = MetricObserver({
-            "extractor": {
-                "type": "regex_capture",
-                "source": str(log_file),
-                "pattern": r"Status: (\w+)",
-                "group": 1
-            }
+            "extractor": {"type": "line_count", "source": str(log_file), "pattern": r"\sFAILED"}
         })
+        assert observer.observe().value == 0
 
-        result = observer.observe()
+    def test_line_count_searches_once_per_hit(self) -> None:
+        """Test that a large text costs one search per matching line, not one per line."""
+        text = ("INFO: fine\n" * 50_000 + "[FAILED] x [FAILED] y\n") * 3 + "INFO: done\n"
+        regex = MagicMock(wraps=compile_pattern(r"\[FAILED\]", re.MULTILINE))
 
-        assert result.value == "running"
+        assert _count_matching_lines(regex, text) == 3
+        # Three hits, then the search that finds nothing more
+        assert regex.search.call_count == 4
 
-    def test_regex_capture_no_match(self, tmp_path: Path) -> None:
-        """Test regex capture with no match."""
-        log_file = tmp_path / "status.log"
-        log_file.write_text("No status here\n")
+    def test_line_count_running_tally(self, tmp_path: Path) -> None:
+        """Test that appended lines are added to the previous count."""
+        log_file = tmp_path / "errors.log"
+        log_file.write_text("[FAILED] a\n[OK] b\n[FAILED] c")
 
         observer = MetricObserver({
             "extractor": {
-                "type": "regex_capture",
+                "type": "line_count",
                 "source": str(log_file),
-                "pattern": r"Status: (\w+)",
-                "group": 1
+                "pattern": r"\[FAILED\]"
             }
         })
+        assert observer.observe().value == 2
+
+        # Finish the partial line and append more
+        with log_file.open("a") as f:
+            f.write(" done\n[FAILED] d\n[OK] e\n")
+        assert observer.observe().value == 3
+        assert observer.observe().value == 3
+
+        # Truncation recounts from scratch
+        log_file.write_text("[FAILED] only\n")
+        assert observer.observe().value == 1
+
+    @pytest.mark.parametrize(
+        "contents,pattern,data_type,expected",
+        [
+            ("Failed files( % ): 15\nTotal files: 100\n", r"Failed files\( % \): (\d+)", "int", 15),
+            ("Status: running\nUptime: 3600\n", r"Status: (\w+)", None, "running"),
+            ("No status here\n", r"Status: (\w+)", None, None),
+        ],
+        ids=["int", "str", "no_match"],
+    )
+    def test_regex_capture_extractor(
+        self,
+        tmp_path: Path,
+        contents: str,
+        pattern: str,
+        data_type: str | None,
+        expected: object,
+    ) -> None:
+        """Test extracting a value via a regex capture group."""
+        log_file = tmp_path / "stats.log"
+        log_file.write_text(contents)
+
+        extractor = {
+            "type": "regex_capture",
+            "source": str(log_file),
+            "pattern": pattern,
+            "group": 1
+        }
+        if data_type is not None:
+            extractor["data_type"] = data_type
+        observer = MetricObserver({"extractor": extractor})
 
         result = observer.observe()
 
-        assert result.value is None
+        assert result.value == expected
+        assert type(result.value) is type(expected)
 
     def test_command_extractor(self) -> None:
         """Test extracting value from command."""
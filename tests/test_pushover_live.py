@@ -5,7 +5,8 @@ These tests require real Pushover API credentials set in environment variables:
 - PUSHOVER_USER_KEY
 - PUSHOVER_API_TOKEN
 
-Tests will be skipped if credentials are not provided.
+They are marked `network` and deselected by default; run them with
+`pytest -m network`. Tests will be skipped if credentials are not provided.
 """
 
 import os
@@ -25,17 +26,21 @@ skip_if_no_credentials = pytest.mark.skipif(
 )
 
 
+@pytest.mark.network
 @skip_if_no_credentials
 class TestPushoverLive:
     """Live tests for Pushover notifier (requires API credentials)."""
 
-    def test_send_basic_notification(self) -> None:
-        """Test sending a basic notification."""
-        notifier = PushoverNotifier({
+    @pytest.fixture(scope="class")
+    def notifier(self) -> PushoverNotifier:
+        """One notifier for the class, so its session reuses the TLS connection."""
+        return PushoverNotifier({
             "user_key": PUSHOVER_USER_KEY,
             "api_token": PUSHOVER_API_TOKEN
         })
 
+    def test_send_basic_notification(self, notifier: PushoverNotifier) -> None:
+        """Test sending a basic notification."""
         alert = AlertDecision(
             should_alert=True,
             severity="low",
@@ -47,33 +52,21 @@ class TestPushoverLive:
 
         assert result is True, "Notification should be sent successfully"
 
-    def test_send_with_different_priorities(self) -> None:
+    @pytest.mark.parametrize("severity", ["low", "medium", "high", "critical"])
+    def test_send_with_different_priorities(self, notifier: PushoverNotifier, severity: str) -> None:
         """Test sending notifications with different severity levels."""
-        notifier = PushoverNotifier({
-            "user_key": PUSHOVER_USER_KEY,
-            "api_token": PUSHOVER_API_TOKEN
-        })
-
-        severities = ["low", "medium", "high", "critical"]
-
-        for severity in severities:
-            alert = AlertDecision(
-                should_alert=True,
-                severity=severity,
-                message=f"Test {severity} priority notification",
-                context={"severity_test": severity}
-            )
+        alert = AlertDecision(
+            should_alert=True,
+            severity=severity,
+            message=f"Test {severity} priority notification",
+            context={"severity_test": severity}
+        )
 
-            result = notifier.notify(alert, f"Priority Test ({severity})")
-            assert result is True, f"Should send {severity} notification"
+        result = notifier.notify(alert, f"Priority Test ({severity})")
+        assert result is True, f"Should send {severity} notification"
 
-    def test_send_with_rich_context(self) -> None:
+    def test_send_with_rich_context(self, notifier: PushoverNotifier) -> None:
         """Test sending notification with rich context information."""
-        notifier = PushoverNotifier({
-            "user_key": PUSHOVER_USER_KEY,
-            "api_token": PUSHOVER_API_TOKEN
-        })
-
         alert = AlertDecision(
             should_alert=True,
             severity="medium",
@@ -6,16 +6,10 @@ from datetime import datetime
 
 import pytest
 
-# Import plugin modules to trigger decorator registration
-# pylint: disable=unused-import
-# ruff: noqa: F401
-import lighthouse.evaluators
-import lighthouse.notifiers
-import lighthouse.observers
-import lighthouse.triggers
 from lighthouse.core import AlertDecision, Evaluator, Notifier, ObservationResult, Observer, Trigger
 from lighthouse.registry import (
     PluginRegistry,
+    bootstrap_plugins,
     create_evaluator,
     create_notifier,
     create_observer,
@@ -25,94 +19,66 @@ from lighthouse.registry import (
 )
 
 
-class TestPluginRegistry:
-    """Tests for PluginRegistry class."""
-
-    def test_register_and_get_observer(self) -> None:
-        """Test registering and retrieving an observer."""
-        registry = PluginRegistry()
-
-        class TestObserver(Observer):
-            def observe(self) -> ObservationResult:
-                return ObservationResult(value=True, timestamp=datetime.now(), metadata={})
-
-        registry.register_observer("test", TestObserver)
-        retrieved = registry.get_observer("test")
-
-        assert retrieved is TestObserver
-
-    def test_register_and_get_trigger(self) -> None:
-        """Test registering and retrieving a trigger."""
-        registry = PluginRegistry()
-
-        class TestTrigger(Trigger):
-            def start(self) -> None:
-                pass
-            def stop(self) -> None:
-                pass
+class DummyObserver(Observer):
+    def observe(self) -> ObservationResult:
+        return ObservationResult(value=None, timestamp=datetime.now(), metadata={})
 
-        registry.register_trigger("test", TestTrigger)
-        retrieved = registry.get_trigger("test")
 
-        assert retrieved is TestTrigger
+class DummyTrigger(Trigger):
+    def start(self) -> None:
+        pass
+    def stop(self) -> None:
+        pass
 
-    def test_register_and_get_evaluator(self) -> None:
-        """Test registering and retrieving an evaluator."""
-        registry = PluginRegistry()
 
-        class TestEvaluator(Evaluator):
-            def evaluate(
-                self,
-                current: ObservationResult,
-                history: list[ObservationResult]
-            ) -> AlertDecision:
-                return AlertDecision(should_alert=False, severity="low", message="test", context={})
+class DummyEvaluator(Evaluator):
+    def evaluate(
+        self,
+        current: ObservationResult,
+        history: list[ObservationResult]
+    ) -> AlertDecision:
+        return AlertDecision(should_alert=False, severity="low", message="test", context={})
 
-        registry.register_evaluator("test", TestEvaluator)
-        retrieved = registry.get_evaluator("test")
 
-        assert retrieved is TestEvaluator
+class DummyNotifier(Notifier):
+    def notify(self, alert: AlertDecision, watcher_name: str) -> bool:
+        return True
 
-    def test_register_and_get_notifier(self) -> None:
-        """Test registering and retrieving a notifier."""
-        registry = PluginRegistry()
 
-        class TestNotifier(Notifier):
-            def notify(self, alert: AlertDecision, watcher_name: str) -> bool:
-                return True
+@pytest.fixture
+def builtin_plugins() -> None:
+    """Register the built-in plugins with the global registry."""
+    bootstrap_plugins()
 
-        registry.register_notifier("test", TestNotifier)
-        retrieved = registry.get_notifier("test")
 
-        assert retrieved is TestNotifier
+class TestPluginRegistry:
+    """Tests for PluginRegistry class."""
 
-    def test_get_unknown_observer_raises_error(self) -> None:
-        """Test that getting an unknown observer raises ValueError."""
+    @pytest.mark.parametrize(
+        "kind,cls",
+        [
+            ("observer", DummyObserver),
+            ("trigger", DummyTrigger),
+            ("evaluator", DummyEvaluator),
+            ("notifier", DummyNotifier),
+        ],
+    )
+    def test_register_and_get(self, kind: str, cls: type) -> None:
+        """Test registering and retrieving a plugin of each kind."""
         registry = PluginRegistry()
 
-        with pytest.raises(ValueError, match="Unknown observer type: nonexistent"):
-            registry.get_observer("nonexistent")
+        getattr(registry, f"register_{kind}")("test", cls)
+        retrieved = getattr(registry, f"get_{kind}")("test")
 
-    def test_get_unknown_trigger_raises_error(self) -> None:
-        """Test that getting an unknown trigger raises ValueError."""
-        registry = PluginRegistry()
-
-        with pytest.raises(ValueError, match="Unknown trigger type: nonexistent"):
-            registry.get_trigger("nonexistent")
+        assert retrieved is cls
 
-    def test_get_unknown_evaluator_raises_error(self) -> None:
-        """Test that getting an unknown evaluator raises ValueError."""
+    @pytest.mark.parametrize("kind", ["observer", "trigger", "evaluator", "notifier"])
+    def test_get_unknown_raises_error(self, kind: str) -> None:
+        """Test that getting an unknown plugin raises ValueError."""
         registry = PluginRegistry()
 
-        with pytest.raises(ValueError, match="Unknown evaluator type: nonexistent"):
-            registry.get_evaluator("nonexistent")
-
-    def test_get_unknown_notifier_raises_error(self) -> None:
-        """Test that getting an unknown notifier raises ValueError."""
-        registry = PluginRegistry()
-
-        with pytest.raises(ValueError, match="Unknown notifier type: nonexistent"):
-            registry.get_notifier("nonexistent")
+        with pytest.raises(ValueError, match=f"Unknown {kind} type: nonexistent"):
+            getattr(registry, f"get_{kind}")("nonexistent")
 
     def test_list_plugins_empty(self) -> None:
         """Test listing plugins in an empty registry."""
@@ -131,16 +97,6 @@ class TestPluginRegistry:
         """Test listing plugins after registration."""
         registry = PluginRegistry()
 
-        class DummyObserver(Observer):
-            def observe(self) -> ObservationResult:
-                return ObservationResult(value=None, timestamp=datetime.now(), metadata={})
-
-        class DummyTrigger(Trigger):
-            def start(self) -> None:
-                pass
-            def stop(self) -> None:
-                pass
-
         registry.register_observer("obs1", DummyObserver)
         registry.register_observer("obs2", DummyObserver)
         registry.register_trigger("trig1", DummyTrigger)
@@ -204,6 +160,7 @@ class TestDecoratorRegistration:
         assert hasattr(OriginalObserver, 'observe')
 
 
+@pytest.mark.usefixtures("builtin_plugins")
 class TestFactoryFunctions:
     """Tests for factory functions."""
 
@@ -273,6 +230,7 @@ class TestFactoryFunctions:
             create_notifier("nonexistent_type", {})
 
 
+@pytest.mark.usefixtures("builtin_plugins")
 class TestGlobalRegistry:
     """Tests for global registry access."""
 
@@ -3,51 +3,76 @@ Tests for state management and rate limiting.
 """
 
 import json
+import subprocess
+import sys
+import threading
 import time
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import datetime
 from pathlib import Path
 from typing import Any
+from unittest.mock import call, patch
 
 from lighthouse.state import AlertState, StateManager
 
 
+class FakeClock:
+    """Epoch clock that only moves when advanced."""
+
+    def __init__(self, now: float = 1_700_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
 class TestAlertState:
     """Tests for AlertState dataclass."""
 
     def test_alert_state_creation(self) -> None:
         """Test creating an AlertState instance."""
-        now = datetime.now()
-        state = AlertState(last_sent=now, count_this_hour=5, hour_start=now)
+        now = time.time()
+        state = AlertState(last_sent=now, timestamps=deque([now - 10, now]))
 
         assert state.last_sent == now
-        assert state.count_this_hour == 5
-        assert state.hour_start == now
+        assert list(state.timestamps) == [now - 10, now]
 
     def test_alert_state_defaults(self) -> None:
         """Test AlertState default values."""
-        now = datetime.now()
+        now = time.time()
         state = AlertState(last_sent=now)
 
         assert state.last_sent == now
-        assert state.count_this_hour == 0
-        assert isinstance(state.hour_start, datetime)
+        assert len(state.timestamps) == 0
+
+    def test_expire_drops_timestamps_older_than_an_hour(self) -> None:
+        """Test that expire() keeps only the last hour's timestamps."""
+        now = time.time()
+        state = AlertState(last_sent=now, timestamps=deque([now - 7200, now - 3600, now - 60]))
+
+        state.expire(now)
+
+        assert list(state.timestamps) == [now - 60]
 
 
 class TestStateManager:
     """Tests for StateManager."""
 
-    def test_init_creates_state_file_dir(self, tmp_path: Path) -> None:
+    def test_init_creates_state_file_dir(self, state_dir: Path) -> None:
         """Test that initialization creates state file directory."""
-        state_file = tmp_path / "subdir" / "state.json"
+        state_file = state_dir / "subdir" / "state.json"
 
         manager = StateManager(state_file)
 
         assert state_file.parent.exists()
         assert manager.state_file == state_file
 
-    def test_init_with_existing_state(self, tmp_path: Path) -> None:
-        """Test initialization with existing state file."""
-        state_file = tmp_path / "state.json"
+    def test_init_with_fixed_window_state(self, state_dir: Path) -> None:
+        """Test loading a state file written with count_this_hour/hour_start."""
+        state_file = state_dir / "state.json"
 
         # Create initial state
         now = datetime.now()
@@ -67,12 +92,12 @@ class TestStateManager:
         # Load state
         manager = StateManager(state_file)
 
-        assert "watcher1:pattern1" in manager.alerts
-        assert manager.alerts["watcher1:pattern1"].count_this_hour == 3
+        assert ("watcher1", "pattern1") in manager.alerts
+        assert len(manager.alerts[("watcher1", "pattern1")].timestamps) == 3
 
-    def test_init_with_corrupted_state(self, tmp_path: Path, caplog: Any) -> None:
+    def test_init_with_corrupted_state(self, state_dir: Path, caplog: Any) -> None:
         """Test initialization with corrupted state file."""
-        state_file = tmp_path / "state.json"
+        state_file = state_dir / "state.json"
         state_file.write_text("invalid json{]")
 
         manager = StateManager(state_file)
@@ -83,9 +108,9 @@ class TestStateManager:
         # Should log warning
         assert "Could not load state file" in caplog.text
 
-    def test_should_send_alert_first_time(self, tmp_path: Path) -> None:
+    def test_should_send_alert_first_time(self, state_dir: Path) -> None:
         """Test that first alert for a pattern should be sent."""
-        manager = StateManager(tmp_path / "state.json")
+        manager = StateManager(state_dir / "state.json")
 
         should_send = manager.should_send_alert(
             "test_watcher",
@@ -96,9 +121,9 @@ class TestStateManager:
 
         assert should_send is True
 
-    def test_should_send_alert_respects_cooldown(self, tmp_path: Path) -> None:
+    def test_should_send_alert_respects_cooldown(self, state_dir: Path) -> None:
         """Test that cooldown period prevents rapid alerts."""
-        manager = StateManager(tmp_path / "state.json")
+        manager = StateManager(state_dir / "state.json")
 
         # First alert
         assert manager.should_send_alert("watcher", "pattern", cooldown_seconds=60, max_per_hour=0)
@@ -108,157 +133,209 @@ class TestStateManager:
         should_send = manager.should_send_alert("watcher", "pattern", cooldown_seconds=60, max_per_hour=0)
         assert should_send is False
 
-    def test_should_send_alert_after_cooldown_expires(self, tmp_path: Path) -> None:
+    def test_should_send_alert_after_cooldown_expires(self, state_dir: Path) -> None:
         """Test that alerts can be sent after cooldown expires."""
-        manager = StateManager(tmp_path / "state.json")
+        clock = FakeClock()
+        manager = StateManager(state_dir / "state.json", clock=clock)
 
-        # Record an alert in the past
         manager.record_alert("watcher", "pattern")
-        manager.alerts["watcher:pattern"].last_sent = datetime.now() - timedelta(seconds=61)
+        clock.advance(61)
 
         # Should be allowed now
         should_send = manager.should_send_alert("watcher", "pattern", cooldown_seconds=60, max_per_hour=0)
         assert should_send is True
 
-    def test_should_send_alert_respects_hourly_limit(self, tmp_path: Path) -> None:
+    def test_should_send_alert_respects_hourly_limit(self, state_dir: Path) -> None:
         """Test that hourly rate limit is enforced."""
-        manager = StateManager(tmp_path / "state.json")
+        clock = FakeClock()
+        manager = StateManager(state_dir / "state.json", clock=clock)
 
-        # Send max_per_hour alerts
+        # Send max_per_hour alerts, each past the previous one's cooldown
         for _i in range(3):
-            assert manager.should_send_alert("watcher", "pattern", cooldown_seconds=0, max_per_hour=3)
+            assert manager.should_send_alert("watcher", "pattern", cooldown_seconds=1, max_per_hour=3)
             manager.record_alert("watcher", "pattern")
-            time.sleep(0.01)  # Small delay to avoid cooldown
+            clock.advance(1)
 
         # Next alert should be blocked
-        should_send = manager.should_send_alert("watcher", "pattern", cooldown_seconds=0, max_per_hour=3)
+        should_send = manager.should_send_alert("watcher", "pattern", cooldown_seconds=1, max_per_hour=3)
         assert should_send is False
 
-    def test_should_send_alert_hourly_limit_resets(self, tmp_path: Path) -> None:
+    def test_should_send_alert_hourly_limit_resets(self, state_dir: Path) -> None:
         """Test that hourly limit resets after an hour."""
-        manager = StateManager(tmp_path / "state.json")
+        clock = FakeClock()
+        manager = StateManager(state_dir / "state.json", clock=clock)
 
         # Send max alerts
         for _i in range(3):
             assert manager.should_send_alert("watcher", "pattern", cooldown_seconds=0, max_per_hour=3)
             manager.record_alert("watcher", "pattern")
 
-        # Move hour_start back
-        manager.alerts["watcher:pattern"].hour_start = datetime.now() - timedelta(hours=2)
+        clock.advance(3600)
 
         # Should be allowed again
         should_send = manager.should_send_alert("watcher", "pattern", cooldown_seconds=0, max_per_hour=3)
         assert should_send is True
 
-    def test_should_send_alert_unlimited_hourly(self, tmp_path: Path) -> None:
+    def test_should_send_alert_hourly_limit_slides(self, state_dir: Path) -> None:
+        """Test that the hourly limit frees up as each alert leaves the window."""
+        clock = FakeClock()
+        manager = StateManager(state_dir / "state.json", clock=clock)
+        for gap in (0, 3000, 590):
+            clock.advance(gap)
+            manager.record_alert("watcher", "pattern")
+
+        # Just under an hour after the first alert, all three are still in the window
+        clock.advance(9)
+        assert not manager.should_send_alert("watcher", "pattern", cooldown_seconds=0, max_per_hour=3)
+
+        clock.advance(1)
+        assert manager.should_send_alert("watcher", "pattern", cooldown_seconds=0, max_per_hour=3)
+
+    def test_should_send_alert_unlimited_hourly(self, state_dir: Path) -> None:
         """Test that max_per_hour=0 means unlimited."""
-        manager = StateManager(tmp_path / "state.json")
+        manager = StateManager(state_dir / "state.json")
 
         # Send many alerts
         for _i in range(100):
             manager.record_alert("watcher", "pattern")
-            time.sleep(0.001)
 
         # Should still be allowed
         should_send = manager.should_send_alert("watcher", "pattern", cooldown_seconds=0, max_per_hour=0)
         assert should_send is True
 
-    def test_record_alert_creates_state(self, tmp_path: Path) -> None:
+    def test_record_alert_creates_state(self, state_dir: Path) -> None:
         """Test that recording an alert creates state."""
-        manager = StateManager(tmp_path / "state.json")
+        manager = StateManager(state_dir / "state.json")
 
         manager.record_alert("watcher", "pattern")
 
-        assert "watcher:pattern" in manager.alerts
-        state = manager.alerts["watcher:pattern"]
-        assert state.count_this_hour == 1
-        assert isinstance(state.last_sent, datetime)
-        assert isinstance(state.hour_start, datetime)
+        assert ("watcher", "pattern") in manager.alerts
+        state = manager.alerts[("watcher", "pattern")]
+        assert list(state.timestamps) == [state.last_sent]
+        assert isinstance(state.last_sent, float)
 
-    def test_record_alert_increments_count(self, tmp_path: Path) -> None:
+    def test_record_alert_increments_count(self, state_dir: Path) -> None:
         """Test that recording alerts increments count."""
-        manager = StateManager(tmp_path / "state.json")
+        manager = StateManager(state_dir / "state.json")
 
         manager.record_alert("watcher", "pattern")
         manager.record_alert("watcher", "pattern")
         manager.record_alert("watcher", "pattern")
 
-        assert manager.alerts["watcher:pattern"].count_this_hour == 3
+        assert len(manager.alerts[("watcher", "pattern")].timestamps) == 3
 
-    def test_record_alert_resets_hourly_count(self, tmp_path: Path) -> None:
-        """Test that count resets after an hour."""
-        manager = StateManager(tmp_path / "state.json")
+    def test_record_alert_expires_old_timestamps(self, state_dir: Path) -> None:
+        """Test that recording drops alerts older than an hour."""
+        clock = FakeClock()
+        manager = StateManager(state_dir / "state.json", clock=clock)
 
         manager.record_alert("watcher", "pattern")
         manager.record_alert("watcher", "pattern")
-
-        # Move hour_start back
-        manager.alerts["watcher:pattern"].hour_start = datetime.now() - timedelta(hours=2)
+        clock.advance(3600)
 
         # Record another alert
         manager.record_alert("watcher", "pattern")
 
-        # Count should have reset
-        assert manager.alerts["watcher:pattern"].count_this_hour == 1
+        # Only the new one is left
+        assert len(manager.alerts[("watcher", "pattern")].timestamps) == 1
 
-    def test_record_alert_saves_to_disk(self, tmp_path: Path) -> None:
+    def test_record_alert_saves_to_disk(self, state_dir: Path) -> None:
         """Test that recording an alert persists to disk."""
-        state_file = tmp_path / "state.json"
+        state_file = state_dir / "state.json"
         manager = StateManager(state_file)
 
         manager.record_alert("watcher", "pattern")
+        manager.flush()
 
-        # Verify file was written
-        assert state_file.exists()
+        # Verify the alert was logged
+        assert manager.wal_file.exists()
 
         # Load in new manager
         manager2 = StateManager(state_file)
-        assert "watcher:pattern" in manager2.alerts
+        assert ("watcher", "pattern") in manager2.alerts
 
-    def test_multiple_watchers_isolated(self, tmp_path: Path) -> None:
+    def test_multiple_watchers_isolated(self, state_dir: Path) -> None:
         """Test that different watchers have isolated state."""
-        manager = StateManager(tmp_path / "state.json")
+        manager = StateManager(state_dir / "state.json")
 
         # Record alerts for different watchers
         manager.record_alert("watcher1", "pattern1")
         manager.record_alert("watcher2", "pattern2")
 
-        assert "watcher1:pattern1" in manager.alerts
-        assert "watcher2:pattern2" in manager.alerts
-        assert manager.alerts["watcher1:pattern1"].count_this_hour == 1
-        assert manager.alerts["watcher2:pattern2"].count_this_hour == 1
+        assert ("watcher1", "pattern1") in manager.alerts
+        assert ("watcher2", "pattern2") in manager.alerts
+        assert len(manager.alerts[("watcher1", "pattern1")].timestamps) == 1
+        assert len(manager.alerts[("watcher2", "pattern2")].timestamps) == 1
 
-    def test_multiple_patterns_isolated(self, tmp_path: Path) -> None:
+    def test_multiple_patterns_isolated(self, state_dir: Path) -> None:
         """Test that different patterns for same watcher are isolated."""
-        manager = StateManager(tmp_path / "state.json")
+        manager = StateManager(state_dir / "state.json")
 
         manager.record_alert("watcher", "pattern1")
         manager.record_alert("watcher", "pattern2")
 
-        assert "watcher:pattern1" in manager.alerts
-        assert "watcher:pattern2" in manager.alerts
+        assert ("watcher", "pattern1") in manager.alerts
+        assert ("watcher", "pattern2") in manager.alerts
 
-    def test_state_persistence(self, tmp_path: Path) -> None:
+    def test_state_persistence(self, state_dir: Path) -> None:
         """Test that state persists across manager instances."""
-        state_file = tmp_path / "state.json"
+        state_file = state_dir / "state.json"
 
         # Create and use first manager
         manager1 = StateManager(state_file)
         manager1.record_alert("watcher", "pattern")
         manager1.record_alert("watcher", "pattern")
+        manager1.flush()
 
         # Create second manager
         manager2 = StateManager(state_file)
 
         # Should have loaded previous state
-        assert manager2.alerts["watcher:pattern"].count_this_hour == 2
+        assert len(manager2.alerts[("watcher", "pattern")].timestamps) == 2
 
-    def test_json_serialization_format(self, tmp_path: Path) -> None:
+    def test_pattern_with_colon_round_trips(self, state_dir: Path) -> None:
+        """Test that a pattern containing ':' keeps its key across a reload."""
+        state_file = state_dir / "state.json"
+        manager1 = StateManager(state_file)
+        manager1.record_alert("watcher", "ERROR: disk full")
+        manager1.close()
+
+        manager2 = StateManager(state_file)
+
+        assert ("watcher", "ERROR: disk full") in manager2.alerts
+
+    def test_watcher_name_with_colon_round_trips(self, state_dir: Path) -> None:
+        """Test that a ':' in the watcher name survives the snapshot and the log."""
+        state_file = state_dir / "state.json"
+        manager1 = StateManager(state_file)
+        manager1.record_alert("web:prod", "ERROR")
+        manager1.close()
+        manager1 = StateManager(state_file)
+        manager1.record_alert("web", "prod:ERROR")
+        manager1.flush()
+
+        manager2 = StateManager(state_file)
+
+        assert set(manager2.alerts) == {("web:prod", "ERROR"), ("web", "prod:ERROR")}
+
+    def test_joined_key_log_entry_is_read(self, state_dir: Path) -> None:
+        """Test that log entries written with a "watcher:pattern" key are still replayed."""
+        state_file = state_dir / "state.json"
+        record = {"key": "watcher:ERROR: disk", "last_sent": datetime.now().isoformat(),
+                  "timestamps": [time.time()]}
+        state_file.with_suffix(".wal").write_text(json.dumps(record) + "\n")
+
+        manager = StateManager(state_file)
+
+        assert len(manager.alerts[("watcher", "ERROR: disk")].timestamps) == 1
+
+    def test_json_serialization_format(self, state_dir: Path) -> None:
         """Test that state file is valid JSON with correct structure."""
-        state_file = tmp_path / "state.json"
+        state_file = state_dir / "state.json"
         manager = StateManager(state_file)
 
         manager.record_alert("test_watcher", "test_pattern")
+        manager.close()
 
         # Read raw JSON
         with state_file.open("r", encoding="utf-8") as f:
@@ -267,6 +344,159 @@ class TestStateManager:
         assert "alerts" in data
         assert "test_watcher:test_pattern" in data["alerts"]
         alert_data = data["alerts"]["test_watcher:test_pattern"]
+        assert alert_data["watcher"] == "test_watcher"
+        assert alert_data["pattern"] == "test_pattern"
         assert "last_sent" in alert_data
-        assert "count_this_hour" in alert_data
-        assert "hour_start" in alert_data
+        assert alert_data["timestamps"] == [manager.alerts[("test_watcher", "test_pattern")].last_sent]
+
+    def test_record_alert_appends_instead_of_rewriting(self, state_dir: Path) -> None:
+        """Test that recording alerts appends to the log and leaves the snapshot alone."""
+        state_file = state_dir / "state.json"
+        manager = StateManager(state_file)
+        manager.close()
+        snapshot = state_file.read_bytes()
+
+        for _i in range(3):
+            manager.record_alert("watcher", "pattern")
+        manager.flush()
+
+        assert state_file.read_bytes() == snapshot
+        assert len(manager.wal_file.read_text().splitlines()) == 3
+
+    def test_should_send_alert_holds_lock(self, state_dir: Path) -> None:
+        """Test that window expiry waits for the lock record_alert and snapshots use."""
+        manager = StateManager(state_dir / "state.json", clock=lambda: 5000.0)
+        manager.record_alert("watcher", "pattern")
+        results: list[bool] = []
+
+        with manager._lock:
+            checker = threading.Thread(
+                target=lambda: results.append(manager.should_send_alert("watcher", "pattern", 0, 1))
+            )
+            checker.start()
+            checker.join(0.1)
+            assert results == []
+
+        checker.join()
+        assert results == [False]
+
+    def test_wal_entries_are_fixed_size(self, state_dir: Path) -> None:
+        """Test that each log entry holds one send time, not the whole window."""
+        manager = StateManager(state_dir / "state.json", clock=iter(range(1000, 1100)).__next__)
+        for _i in range(50):
+            manager.record_alert("watcher", "pattern")
+        manager.flush()
+
+        lines = manager.wal_file.read_bytes().splitlines()
+        assert len(lines) == 50
+        assert len({len(line) for line in lines}) == 1
+        assert json.loads(lines[-1]) == {"watcher": "watcher", "pattern": "pattern", "sent": 1049}
+
+        replayed = StateManager(state_dir / "state.json", clock=lambda: 1100.0)
+        assert list(replayed.alerts[("watcher", "pattern")].timestamps) == list(range(1000, 1050))
+        assert replayed.alerts[("watcher", "pattern")].last_sent == 1049
+
+    def test_wal_replayed_and_compacted_on_load(self, state_dir: Path) -> None:
+        """Test that logged entries are applied on load and folded into the snapshot."""
+        state_file = state_dir / "state.json"
+        manager1 = StateManager(state_file)
+        manager1.record_alert("watcher", "pattern")
+        manager1.record_alert("watcher", "pattern")
+        manager1.record_alert("other", "pattern")
+        manager1.flush()
+
+        manager2 = StateManager(state_file)
+
+        assert len(manager2.alerts[("watcher", "pattern")].timestamps) == 2
+        assert len(manager2.alerts[("other", "pattern")].timestamps) == 1
+        assert not manager2.wal_file.exists()
+        data = json.loads(state_file.read_text())
+        assert set(data["alerts"]) == {"watcher:pattern", "other:pattern"}
+
+    def test_wal_synced_once_per_group(self, state_dir: Path) -> None:
+        """Test that a burst of appends is fsynced together rather than one by one."""
+        manager = StateManager(state_dir / "state.json")
+
+        with patch("lighthouse.state.FLUSH_DELAY", 60), patch("lighthouse.state.os.fsync") as fsync:
+            for _i in range(10):
+                manager.record_alert("watcher", "pattern")
+            # Timers left by other tests' managers may fsync their own logs meanwhile
+            fd = manager._wal.fileno()
+            assert call(fd) not in fsync.call_args_list
+
+            manager.flush()
+
+        assert fsync.call_args_list.count(call(fd)) == 1
+        assert len(manager.wal_file.read_text().splitlines()) == 10
+
+    def test_wal_flushed_after_delay(self, state_dir: Path) -> None:
+        """Test that pending appends reach the log without an explicit flush()."""
+        manager = StateManager(state_dir / "state.json")
+        manager.record_alert("watcher", "pattern")
+
+        deadline = time.monotonic() + 2
+        while not manager.wal_file.read_bytes() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert len(manager.wal_file.read_text().splitlines()) == 1
+
+    def test_pending_wal_entries_flushed_at_exit(self, state_dir: Path) -> None:
+        """Test that entries still waiting for the group flush survive interpreter exit."""
+        state_file = state_dir / "state.json"
+        script = (
+            "import sys\n"
+            "from lighthouse import state\n"
+            "state.FLUSH_DELAY = 60\n"
+            "state.StateManager(sys.argv[1]).record_alert('watcher', 'pattern')\n"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script, str(state_file)],
+            capture_output=True, text=True, check=False
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert len(state_file.with_suffix(".wal").read_text().splitlines()) == 1
+
+    def test_torn_wal_line_is_skipped(self, state_dir: Path, caplog: Any) -> None:
+        """Test that a partial line left by a crash does not lose earlier entries."""
+        state_file = state_dir / "state.json"
+        manager1 = StateManager(state_file)
+        manager1.record_alert("watcher", "pattern")
+        manager1.flush()
+        with manager1.wal_file.open("ab") as f:
+            f.write(b'{"key": "watcher:pat')
+
+        manager2 = StateManager(state_file)
+
+        assert len(manager2.alerts[("watcher", "pattern")].timestamps) == 1
+        assert "Skipping unreadable state log entry" in caplog.text
+
+    def test_snapshot_rename_synced_before_log_emptied(self, state_dir: Path) -> None:
+        """Test that the state directory is fsynced while the log still holds its entries."""
+        manager = StateManager(state_dir / "state.json")
+        manager.record_alert("watcher", "pattern")
+        manager.flush()
+        log_sizes: list[int] = []
+
+        def record_log_size(path: Path) -> None:
+            assert path == state_dir
+            log_sizes.append(manager.wal_file.stat().st_size)
+
+        with patch("lighthouse.state._fsync_dir", side_effect=record_log_size):
+            manager.close()
+
+        assert log_sizes[0] > 0
+        assert manager.wal_file.read_bytes() == b""
+
+    def test_snapshot_every_n_appends(self, state_dir: Path) -> None:
+        """Test that the log is folded into a snapshot after SNAPSHOT_EVERY appends."""
+        state_file = state_dir / "state.json"
+        manager = StateManager(state_file)
+
+        with patch("lighthouse.state.SNAPSHOT_EVERY", 5):
+            for _i in range(5):
+                manager.record_alert("watcher", "pattern")
+
+        assert manager.wal_file.read_bytes() == b""
+        data = json.loads(state_file.read_text())
+        assert len(data["alerts"]["watcher:pattern"]["timestamps"]) == 5
@@ -2,10 +2,14 @@
 Tests for trigger implementations.
 """
 
+import json
+import socket
 import time
-from datetime import UTC
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime, timedelta
+from itertools import pairwise
 from pathlib import Path
-from threading import Event
+from threading import Event, Semaphore, Thread
 
 import pytest
 
@@ -16,6 +20,41 @@ from lighthouse.triggers import (
     TemporalTrigger,
     WebhookTrigger,
 )
+from lighthouse.triggers.file_event import _Debouncer
+
+
+def wait_until_watching(trigger: FileEventTrigger, timeout: float = 1.0) -> None:
+    """Wait until the trigger's watchdog observer and emitter threads are running."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        observer = trigger.observer
+        if observer is not None and observer.is_alive() and all(
+            emitter.is_alive() for emitter in observer.emitters
+        ):
+            return
+        time.sleep(0.001)
+    raise AssertionError("watchdog observer did not start")
+
+
+def bound_port(trigger: WebhookTrigger) -> int:
+    """Port a started webhook trigger is listening on (tests bind port 0)."""
+    assert trigger.server is not None
+    return int(trigger.server.server_address[1])
+
+
+def utc_timestamp(offset: timedelta = timedelta(0)) -> str:
+    """Current UTC time plus offset, in the ISO 8601 'Z' form webhook requests carry."""
+    return (datetime.now(UTC) + offset).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def wait_for(predicate: Callable[[], object], timeout: float = 2.0) -> bool:
+    """Poll predicate every 5ms until it is truthy or timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.005)
+    return True
 
 
 class TestFileEventTrigger:
@@ -37,7 +76,7 @@ class TestFileEventTrigger:
         )
 
         trigger.start()
-        time.sleep(0.1)  # Let watchdog initialize
+        wait_until_watching(trigger)
 
         # Modify the file
         test_file.write_text("modified content\n")
@@ -62,7 +101,7 @@ class TestFileEventTrigger:
         )
 
         trigger.start()
-        time.sleep(0.1)
+        wait_until_watching(trigger)
 
         # Create a new file
         test_file.write_text("new content\n")
@@ -87,7 +126,7 @@ class TestFileEventTrigger:
         )
 
         trigger.start()
-        time.sleep(0.1)
+        wait_until_watching(trigger)
 
         # Delete the file
         test_file.unlink()
@@ -101,10 +140,10 @@ class TestFileEventTrigger:
         test_file = tmp_path / "multi.log"
         test_file.write_text("initial\n")
 
-        trigger_count = {"count": 0}
+        fired = Semaphore(0)
 
         def callback() -> None:
-            trigger_count["count"] += 1
+            fired.release()
 
         trigger = FileEventTrigger(
             {"path": str(test_file), "events": ["modified", "deleted"]},
@@ -112,19 +151,74 @@ class TestFileEventTrigger:
         )
 
         trigger.start()
-        time.sleep(0.1)
+        wait_until_watching(trigger)
 
         # Modify file
         test_file.write_text("modified\n")
-        time.sleep(0.2)
+        modified = fired.acquire(timeout=2)
 
         # Delete file
         test_file.unlink()
-        time.sleep(0.2)
+        deleted = fired.acquire(timeout=2)
 
         trigger.stop()
 
-        assert trigger_count["count"] >= 2, "Should trigger on both modification and deletion"
+        assert modified and deleted, "Should trigger on both modification and deletion"
+
+    def test_debounce_collapses_burst(self, tmp_path: Path) -> None:
+        """Test that a burst of writes gives one immediate and one trailing callback."""
+        test_file = tmp_path / "burst.log"
+        test_file.write_text("initial\n")
+
+        calls: list[float] = []
+
+        trigger = FileEventTrigger(
+            {"path": str(test_file), "events": ["modified"], "debounce_seconds": 0.3},
+            lambda: calls.append(time.monotonic())
+        )
+
+        trigger.start()
+        wait_until_watching(trigger)
+
+        for i in range(5):
+            test_file.write_text(f"write {i}\n")
+
+        try:
+            assert wait_for(lambda: len(calls) == 2), f"Expected 2 callbacks, got {len(calls)}"
+            assert calls[1] - calls[0] >= 0.25, "Trailing callback should wait for the window"
+
+            # Nothing further once the burst has been delivered
+            time.sleep(0.4)
+            assert len(calls) == 2
+        finally:
+            trigger.stop()
+
+    def test_debounce_serialises_slow_callback(self) -> None:
+        """Test that leading and trailing calls never overlap when fn outlasts the window."""
+        running: list[None] = []
+        overlapped: list[bool] = []
+        finished: list[None] = []
+
+        def slow() -> None:
+            overlapped.append(bool(running))
+            running.append(None)
+            time.sleep(0.2)
+            running.pop()
+            finished.append(None)
+
+        debouncer = _Debouncer(slow, 0.05)
+
+        # Leading call blocks, so run it off the test thread; the second call is coalesced
+        Thread(target=debouncer, daemon=True).start()
+        assert wait_for(lambda: running)
+        debouncer()
+
+        # Window has closed while the leading call still runs: a new burst starts
+        time.sleep(0.1)
+        Thread(target=debouncer, daemon=True).start()
+
+        assert wait_for(lambda: len(finished) == 3)
+        assert overlapped == [False, False, False]
 
     def test_trigger_recursive_directory(self, tmp_path: Path) -> None:
         """Test recursive directory watching."""
@@ -142,7 +236,7 @@ class TestFileEventTrigger:
         )
 
         trigger.start()
-        time.sleep(0.1)
+        wait_until_watching(trigger)
 
         # Create file in subdirectory
         test_file = subdir / "deep.log"
@@ -165,7 +259,7 @@ class TestFileEventTrigger:
         )
 
         trigger.start()
-        time.sleep(0.1)
+        wait_until_watching(trigger)
 
         # Create file in main directory (should trigger)
         test_file = tmp_path / "file.log"
@@ -193,7 +287,7 @@ class TestFileEventTrigger:
         trigger.start()
         assert trigger.observer is not None, "Observer should be created on start"
 
-        time.sleep(0.1)
+        wait_until_watching(trigger)
 
         # Verify it can trigger
         test_file.write_text("modification\n")
@@ -217,21 +311,21 @@ class TestTemporalTrigger:
             trigger_times.append(time.time())
 
         trigger = TemporalTrigger(
-            {"interval_seconds": 0.2},
+            {"interval_seconds": 0.05},
             callback
         )
 
         trigger.start()
-        time.sleep(0.7)  # Should get ~3 triggers
+        fired = wait_for(lambda: len(trigger_times) >= 3)
         trigger.stop()
 
-        assert len(trigger_times) >= 3, f"Should trigger at least 3 times, got {len(trigger_times)}"
+        assert fired, f"Should trigger at least 3 times, got {len(trigger_times)}"
 
         # Check intervals are roughly correct
-        if len(trigger_times) >= 2:
-            intervals = [trigger_times[i+1] - trigger_times[i] for i in range(len(trigger_times)-1)]
-            for interval in intervals:
-                assert 0.15 <= interval <= 0.35, f"Interval should be ~0.2s, got {interval}"
+        intervals = [later - earlier for earlier, later in pairwise(trigger_times)]
+        assert min(intervals) >= 0.04 and max(intervals) <= 0.2, (
+            f"Intervals should be ~0.05s, got {intervals}"
+        )
 
     def test_stop_prevents_further_triggers(self) -> None:
         """Test that stopping prevents further triggers."""
@@ -241,20 +335,19 @@ class TestTemporalTrigger:
             trigger_count["count"] += 1
 
         trigger = TemporalTrigger(
-            {"interval_seconds": 0.1},
+            {"interval_seconds": 0.02},
             callback
         )
 
         trigger.start()
-        time.sleep(0.35)  # Should get ~3 triggers
+        assert wait_for(lambda: trigger_count["count"] >= 3), "Should have triggered at least 3 times"
         trigger.stop()
 
         # Record count after stopping
         count_at_stop = trigger_count["count"]
-        assert count_at_stop >= 3, "Should have triggered at least 3 times"
 
-        # Wait and verify no more triggers
-        time.sleep(0.3)
+        # Wait several intervals and verify no more triggers
+        time.sleep(0.1)
         assert trigger_count["count"] == count_at_stop, "Should not trigger after stop()"
 
     def test_immediate_trigger_on_start(self) -> None:
@@ -339,22 +432,75 @@ class TestManualTrigger:
         assert trigger_count["count"] == 0
 
 
+# The one key in api_key_file
+API_KEY = "valid-key"
+
+
+@pytest.fixture(scope="class")
+def api_key_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """API key file holding API_KEY, written once per test class."""
+    path = tmp_path_factory.mktemp("webhook") / "api_keys.txt"
+    path.write_text(f"{API_KEY}\n")
+    return path
+
+
+@pytest.fixture(scope="class")
+def rejecting_server(api_key_file: Path) -> Iterator[tuple[WebhookTrigger, int, list[str]]]:
+    """
+    One running webhook server shared by a class's rejection tests.
+
+    Yields the trigger, its port and the list of watchers it has fired,
+    which every rejection test expects to stay empty.
+    """
+    fired: list[str] = []
+    trigger = WebhookTrigger(
+        {"port": 0, "api_key_file": str(api_key_file)},
+        lambda: None
+    )
+    trigger.register_watcher("test-watcher", lambda: fired.append("test-watcher"))
+    trigger.start()
+    try:
+        yield trigger, bound_port(trigger), fired
+    finally:
+        trigger.stop()
+
+
+# A hung server should fail fast rather than stall the run; 5s leaves room for the
+# 2s connection timeout plus a 2s wait_for() to report their own failures
+@pytest.mark.timeout(5)
 class TestWebhookTrigger:
     """Tests for WebhookTrigger with opaque API."""
 
-    def _get_current_timestamp(self) -> str:
-        """Get current timestamp in ISO 8601 format."""
-        from datetime import datetime
-        return datetime.now(UTC).isoformat().replace('+00:00', 'Z')
-
-    def test_webhook_server_starts_and_stops(self, tmp_path: Path) -> None:
+    def _send(
+        self,
+        port: int,
+        method: str,
+        path: str,
+        headers: dict[str, str],
+        payload: dict[str, str] | None = None
+    ) -> None:
+        """
+        Write one raw HTTP request and hang up.
+
+        The server never answers (it resets every connection), so there is
+        no response to read.
+        """
+        body = json.dumps(payload).encode() if payload is not None else b""
+        lines = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: 127.0.0.1:{port}",
+            *(f"{name}: {value}" for name, value in headers.items()),
+            f"Content-Length: {len(body)}",
+        ]
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+        with socket.create_connection(("127.0.0.1", port), timeout=2) as sock:
+            sock.sendall(request)
+
+    def test_webhook_server_starts_and_stops(self, api_key_file: Path) -> None:
         """Test that webhook server starts and stops cleanly."""
-        api_key_file = tmp_path / "api_keys.txt"
-        api_key_file.write_text("test-key-123\n")
-
         trigger = WebhookTrigger(
             {
-                "port": 18888,
+                "port": 0,
                 "api_key_file": str(api_key_file),
                 "host": "127.0.0.1"
             },
@@ -362,305 +508,75 @@ class TestWebhookTrigger:
         )
 
         trigger.start()
-        time.sleep(0.1)
+        assert bound_port(trigger) > 0
         trigger.stop()
 
-    def test_webhook_authenticated_request_triggers_callback(self, tmp_path: Path) -> None:
+    def test_webhook_authenticated_request_triggers_callback(self, api_key_file: Path) -> None:
         """Test that authenticated webhook triggers registered watcher."""
-        import http.client
-        import json
-
-        api_key_file = tmp_path / "api_keys.txt"
-        api_key = "valid-api-key-456"
-        api_key_file.write_text(f"{api_key}\n")
-
-        callback_count = 0
-
-        def callback() -> None:
-            nonlocal callback_count
-            callback_count += 1
+        fired: list[str] = []
 
         trigger = WebhookTrigger(
-            {"port": 18889, "api_key_file": str(api_key_file)},
+            {"port": 0, "api_key_file": str(api_key_file)},
             lambda: None
         )
-        trigger.register_watcher("test-watcher", callback)
+        trigger.register_watcher("test-watcher", lambda: fired.append("test-watcher"))
         trigger.start()
-        time.sleep(0.2)
 
         try:
             # Send authenticated POST to /api with JSON body
-            conn = http.client.HTTPConnection("127.0.0.1", 18889, timeout=2)
-            body = json.dumps({
-                "target": "test-watcher",
-                "timestamp": self._get_current_timestamp()
-            })
-            try:
-                conn.request(
-                    "POST",
-                    "/api",
-                    body=body,
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json"
-                    }
-                )
-                # Server sends RST, so this will fail - that's expected
-                conn.getresponse()
-            except Exception:
-                pass  # Connection reset is expected
-            finally:
-                conn.close()
+            self._send(
+                bound_port(trigger),
+                "POST",
+                "/api",
+                {"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"},
+                {"target": "test-watcher", "timestamp": utc_timestamp()}
+            )
 
             # Wait for async processing
-            time.sleep(0.5)
-            assert callback_count == 1
-        finally:
-            trigger.stop()
-
-    def test_webhook_wrong_bearer_token_rejected(self, tmp_path: Path) -> None:
-        """Test that wrong bearer token is rejected."""
-        import http.client
-        import json
-
-        api_key_file = tmp_path / "api_keys.txt"
-        api_key_file.write_text("valid-key\n")
-
-        callback_count = 0
-
-        def callback() -> None:
-            nonlocal callback_count
-            callback_count += 1
-
-        trigger = WebhookTrigger(
-            {"port": 18890, "api_key_file": str(api_key_file)},
-            lambda: None
-        )
-        trigger.register_watcher("test-watcher", callback)
-        trigger.start()
-        time.sleep(0.2)
-
-        try:
-            conn = http.client.HTTPConnection("127.0.0.1", 18890, timeout=2)
-            body = json.dumps({
-                "target": "test-watcher",
-                "timestamp": self._get_current_timestamp()
-            })
-            try:
-                conn.request(
-                    "POST",
-                    "/api",
-                    body=body,
-                    headers={
-                        "Authorization": "Bearer wrong-key",
-                        "Content-Type": "application/json"
-                    }
-                )
-                conn.getresponse()
-            except Exception:
-                pass
-            finally:
-                conn.close()
-
-            time.sleep(0.5)
-            assert callback_count == 0  # Not triggered
-        finally:
-            trigger.stop()
-
-    def test_webhook_stale_timestamp_rejected(self, tmp_path: Path) -> None:
-        """Test that stale timestamps are rejected (replay protection)."""
-        import http.client
-        import json
-        from datetime import datetime, timedelta
-
-        api_key_file = tmp_path / "api_keys.txt"
-        api_key = "valid-key"
-        api_key_file.write_text(f"{api_key}\n")
-
-        callback_count = 0
-
-        def callback() -> None:
-            nonlocal callback_count
-            callback_count += 1
-
-        trigger = WebhookTrigger(
-            {"port": 18891, "api_key_file": str(api_key_file)},
-            lambda: None
-        )
-        trigger.register_watcher("test-watcher", callback)
-        trigger.start()
-        time.sleep(0.2)
-
-        try:
-            # Send request with old timestamp (> 5 min ago)
-            old_time = datetime.now(UTC) - timedelta(minutes=10)
-            old_timestamp = old_time.isoformat().replace('+00:00', 'Z')
-
-            conn = http.client.HTTPConnection("127.0.0.1", 18891, timeout=2)
-            body = json.dumps({
-                "target": "test-watcher",
-                "timestamp": old_timestamp
-            })
-            try:
-                conn.request(
-                    "POST",
-                    "/api",
-                    body=body,
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json"
-                    }
-                )
-                conn.getresponse()
-            except Exception:
-                pass
-            finally:
-                conn.close()
-
-            time.sleep(0.5)
-            assert callback_count == 0  # Not triggered (stale)
+            assert wait_for(lambda: fired == ["test-watcher"])
         finally:
             trigger.stop()
 
-    def test_webhook_wrong_path_rejected(self, tmp_path: Path) -> None:
-        """Test that requests to wrong path are rejected."""
-        import http.client
-        import json
-
-        api_key_file = tmp_path / "api_keys.txt"
-        api_key = "valid-key"
-        api_key_file.write_text(f"{api_key}\n")
-
-        callback_count = 0
-
-        def callback() -> None:
-            nonlocal callback_count
-            callback_count += 1
-
-        trigger = WebhookTrigger(
-            {"port": 18892, "api_key_file": str(api_key_file)},
-            lambda: None
-        )
-        trigger.register_watcher("test-watcher", callback)
-        trigger.start()
-        time.sleep(0.2)
-
-        try:
-            # Send to wrong path
-            conn = http.client.HTTPConnection("127.0.0.1", 18892, timeout=2)
-            body = json.dumps({
-                "target": "test-watcher",
-                "timestamp": self._get_current_timestamp()
-            })
-            try:
-                conn.request(
-                    "POST",
-                    "/wrong",  # Wrong path
-                    body=body,
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json"
-                    }
-                )
-                conn.getresponse()
-            except Exception:
-                pass
-            finally:
-                conn.close()
-
-            time.sleep(0.5)
-            assert callback_count == 0
-        finally:
-            trigger.stop()
-
-    def test_webhook_get_request_rejected(self, tmp_path: Path) -> None:
-        """Test that GET requests are rejected."""
-        import http.client
-
-        api_key_file = tmp_path / "api_keys.txt"
-        api_key = "valid-key"
-        api_key_file.write_text(f"{api_key}\n")
-
-        callback_count = 0
-
-        def callback() -> None:
-            nonlocal callback_count
-            callback_count += 1
-
-        trigger = WebhookTrigger(
-            {"port": 18893, "api_key_file": str(api_key_file)},
-            lambda: None
-        )
-        trigger.register_watcher("test-watcher", callback)
-        trigger.start()
-        time.sleep(0.2)
-
-        try:
-            # Send GET request
-            conn = http.client.HTTPConnection("127.0.0.1", 18893, timeout=2)
-            try:
-                conn.request("GET", "/api", headers={"Authorization": f"Bearer {api_key}"})
-                conn.getresponse()
-            except Exception:
-                pass
-            finally:
-                conn.close()
-
-            time.sleep(0.5)
-            assert callback_count == 0
-        finally:
-            trigger.stop()
-
-    def test_webhook_unknown_watcher_rejected(self, tmp_path: Path) -> None:
-        """Test that requests for unknown watchers are rejected."""
-        import http.client
-        import json
-
-        api_key_file = tmp_path / "api_keys.txt"
-        api_key = "valid-key"
-        api_key_file.write_text(f"{api_key}\n")
-
-        callback_count = 0
-
-        def callback() -> None:
-            nonlocal callback_count
-            callback_count += 1
-
-        trigger = WebhookTrigger(
-            {"port": 18894, "api_key_file": str(api_key_file)},
-            lambda: None
-        )
-        trigger.register_watcher("known-watcher", callback)
-        trigger.start()
-        time.sleep(0.2)
-
-        try:
-            # Request unknown watcher
-            conn = http.client.HTTPConnection("127.0.0.1", 18894, timeout=2)
-            body = json.dumps({
-                "target": "unknown-watcher",  # Not registered
-                "timestamp": self._get_current_timestamp()
-            })
-            try:
-                conn.request(
-                    "POST",
-                    "/api",
-                    body=body,
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json"
-                    }
-                )
-                conn.getresponse()
-            except Exception:
-                pass
-            finally:
-                conn.close()
-
-            time.sleep(0.5)
-            assert callback_count == 0
-        finally:
-            trigger.stop()
+    @pytest.mark.parametrize(
+        "method,path,token,target,age",
+        [
+            ("POST", "/api", "wrong-key", "test-watcher", timedelta(0)),
+            # Replay protection: older than the 5 minute tolerance
+            ("POST", "/api", API_KEY, "test-watcher", timedelta(minutes=10)),
+            ("POST", "/wrong", API_KEY, "test-watcher", timedelta(0)),
+            ("GET", "/api", API_KEY, None, timedelta(0)),
+            ("POST", "/api", API_KEY, "unknown-watcher", timedelta(0)),
+        ],
+        ids=[
+            "wrong_bearer_token",
+            "stale_timestamp",
+            "wrong_path",
+            "get_request",
+            "unknown_watcher",
+        ],
+    )
+    def test_webhook_request_rejected(
+        self,
+        rejecting_server: tuple[WebhookTrigger, int, list[str]],
+        method: str,
+        path: str,
+        token: str,
+        target: str | None,
+        age: timedelta
+    ) -> None:
+        """Test that a bad request is counted as a failure and fires nothing."""
+        trigger, port, fired = rejecting_server
+        headers = {"Authorization": f"Bearer {token}"}
+        payload = None
+        if target is not None:
+            headers["Content-Type"] = "application/json"
+            payload = {"target": target, "timestamp": utc_timestamp(-age)}
+        before = sum(trigger.failed_attempts.values())
+
+        self._send(port, method, path, headers, payload)
+
+        assert wait_for(lambda: sum(trigger.failed_attempts.values()) > before)
+        assert fired == []
 
 
 class TestProcessEventTrigger: